@@ -0,0 +1,72 @@
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from uuid import UUID, uuid4
+from hgraph.core.async_hypergraph import AsyncHypergraph
+from hgraph.core.config import EdgeConfig
+from hgraph.core.edge import Edge
+from hgraph.core.hypergraph import Hypergraph
+from hgraph.core.sqlite_store import SQLiteStore
+
+# -----------------------------
+# Single-edge insert latency through AsyncHypergraph on a SQLite file
+# -----------------------------
+#
+# Many concurrent clients each await one `add_edge` at a time. With
+# `max_batch=1` every insert is its own commit; otherwise inserts that
+# arrive while a batch is being committed are coalesced into the next one.
+
+
+class Follows(Edge):
+    source: UUID
+    target: UUID
+    config: EdgeConfig = EdgeConfig(irreflexive=True, allows_duplicates=False)
+
+
+def percentile(samples: list[float], share: float) -> float:
+    return samples[min(len(samples) - 1, int(len(samples) * share))]
+
+
+async def measure(clients: int, inserts: int, max_batch: int, path: str) -> None:
+    # Commit only when AsyncHypergraph says so, once per batch.
+    store = SQLiteStore(path, commit_every=10**9)
+    graph = AsyncHypergraph(Hypergraph(store=store), max_batch=max_batch)
+    samples: list[float] = []
+
+    async def client() -> None:
+        for _ in range(inserts):
+            edge = Follows(source=uuid4(), target=uuid4())
+            start = time.perf_counter()
+            await graph.add_edge(edge)
+            samples.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+    await graph.close()
+    store.close()
+    samples.sort()
+    print(
+        f"{max_batch:>9} {len(samples) / elapsed:>10.0f}"
+        f" {percentile(samples, 0.5) * 1e3:>8.2f}"
+        f" {percentile(samples, 0.99) * 1e3:>8.2f}"
+    )
+
+
+def run(clients: int, inserts: int, batches: list[int]) -> None:
+    print(f"{'max_batch':>9} {'inserts/s':>10} {'p50 ms':>8} {'p99 ms':>8}")
+    for max_batch in batches:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "graph.db")
+            asyncio.run(measure(clients, inserts, max_batch, path))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--inserts", type=int, default=20)
+    parser.add_argument("--batches", type=int, nargs="+", default=[1, 1_000])
+    args = parser.parse_args()
+    run(args.clients, args.inserts, args.batches)
@@ -0,0 +1,87 @@
+import argparse
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from uuid import UUID
+from hgraph.core.node import Node
+from hgraph.core.edge import Edge
+from hgraph.core.config import EdgeConfig
+from hgraph.core.hypergraph import Hypergraph
+
+# -----------------------------
+# smith_family-style ingestion: add_edge loop vs add_edges batch
+# -----------------------------
+#
+# The batch path checks new edges in one pass over dicts keyed like the
+# index buckets, probing the index once per distinct key, then stores them
+# with one bulk write per index table while the garbage collector is held
+# off. At 10k families it measured about 2x the `add_edge` loop (190k-223k
+# vs 97k-103k items/s), well short of an order of magnitude. What is left
+# is building the buckets themselves: six tables of per-key dicts, about
+# 0.22s for the 100k edges here even with collection paused.
+
+
+class Member(Node):
+    name: str
+
+
+class ParentOf(Edge):
+    source: UUID
+    target: UUID
+    config: EdgeConfig = EdgeConfig(antisymmetric=True, irreflexive=True)
+
+
+class SpouseOf(Edge):
+    source: UUID
+    target: UUID
+    config: EdgeConfig = EdgeConfig(
+        symmetric=True, irreflexive=True, allows_duplicates=False
+    )
+
+
+def make_families(count: int) -> tuple[list[Node], list[Edge]]:
+    nodes: list[Node] = []
+    edges: list[Edge] = []
+    for f in range(count):
+        father = Member(name=f"father-{f}")
+        mother = Member(name=f"mother-{f}")
+        children = [Member(name=f"child-{f}-{c}") for c in range(4)]
+        nodes += [father, mother, *children]
+        edges.append(SpouseOf(source=father.id, target=mother.id))
+        edges.append(SpouseOf(source=mother.id, target=father.id))
+        for child in children:
+            edges.append(ParentOf(source=father.id, target=child.id))
+            edges.append(ParentOf(source=mother.id, target=child.id))
+    return nodes, edges
+
+
+def timed(mode: str, families: int) -> tuple[int, float]:
+    nodes, edges = make_families(families)
+    g = Hypergraph()
+    start = time.perf_counter()
+    if mode == "loop":
+        for node in nodes:
+            g.add_node(node)
+        for edge in edges:
+            g.add_edge(edge)
+    else:
+        g.add_nodes(nodes)
+        g.add_edges(edges)
+    return len(nodes) + len(edges), time.perf_counter() - start
+
+
+def run(families: int) -> None:
+    # Each mode runs in a fresh interpreter so neither inherits the other's
+    # heap (and garbage-collector pressure).
+    spawn = multiprocessing.get_context("spawn")
+    for label, mode in [("add_edge", "loop"), ("add_edges", "batch")]:
+        with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as pool:
+            items, elapsed = pool.submit(timed, mode, families).result()
+        print(f"{label + ':':<11} {items / elapsed:>12,.0f} items/s ({items} items)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--families", type=int, default=20_000)
+    args = parser.parse_args()
+    run(args.families)
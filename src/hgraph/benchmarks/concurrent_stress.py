@@ -0,0 +1,101 @@
+import argparse
+import random
+import sys
+import threading
+import time
+from uuid import UUID, uuid4
+from hgraph.core.concurrent import ConcurrentHypergraph
+from hgraph.core.config import EdgeConfig
+from hgraph.core.consistency import check_consistency
+from hgraph.core.edge import Edge
+from hgraph.core.validator import ConstraintViolation
+
+# -----------------------------
+# Constraint safety of ConcurrentHypergraph under write contention
+# -----------------------------
+#
+# Writer threads race to insert edges between a small pool of nodes, so
+# most inserts are rejected and many pass validation at the same moment.
+# Reader threads audit snapshots while the writers run; neither they nor
+# the final graph may ever show a violation.
+
+
+class Owns(Edge):
+    source: UUID
+    target: UUID
+    config: EdgeConfig = EdgeConfig(functional=True, inverse_functional=True)
+
+
+class Beats(Edge):
+    source: UUID
+    target: UUID
+    config: EdgeConfig = EdgeConfig(
+        irreflexive=True, asymmetric=True, allows_duplicates=False
+    )
+
+
+def random_edge(rng: random.Random, nodes: list[UUID]) -> Edge:
+    model = Owns if rng.random() < 0.5 else Beats
+    return model(source=rng.choice(nodes), target=rng.choice(nodes))
+
+
+def run(writers: int, readers: int, writes: int, nodes: int, seed: int) -> bool:
+    # Switch threads as often as possible to widen every race window.
+    sys.setswitchinterval(1e-6)
+    pool = [uuid4() for _ in range(nodes)]
+    graph = ConcurrentHypergraph()
+    accepted = [0] * writers
+    audits: list[int] = []
+    seen_violations: list[str] = []
+    done = threading.Event()
+
+    def write(worker: int) -> None:
+        rng = random.Random(seed + worker)
+        for _ in range(writes):
+            try:
+                graph.add_edge(random_edge(rng, pool))
+                accepted[worker] += 1
+            except ConstraintViolation:
+                pass
+
+    def read() -> None:
+        count = 0
+        while not done.is_set():
+            report = check_consistency(graph.snapshot(), processes=1)
+            seen_violations.extend(v.rule for v in report.violations)
+            count += 1
+        audits.append(count)
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(writers)]
+    threads += [threading.Thread(target=read) for _ in range(readers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads[:writers]:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    done.set()
+    for thread in threads[writers:]:
+        thread.join()
+
+    report = check_consistency(graph.snapshot(), processes=1)
+    print(f"writes          {writers * writes} in {elapsed:.1f}s")
+    print(f"accepted        {sum(accepted)}")
+    print(f"snapshot audits {sum(audits)}")
+    print(f"seen by readers {len(seen_violations)} violation(s)")
+    print(f"final graph     {len(report.violations)} violation(s)")
+    for rule, violations in report.by_rule().items():
+        print(f"  {rule}: {len(violations)}")
+    return not seen_violations and report.ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--readers", type=int, default=2)
+    parser.add_argument("--writes", type=int, default=2_000)
+    parser.add_argument("--nodes", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    ok = run(args.writers, args.readers, args.writes, args.nodes, args.seed)
+    sys.exit(0 if ok else 1)
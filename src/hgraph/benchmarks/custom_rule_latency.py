@@ -0,0 +1,81 @@
+import argparse
+import gc
+import time
+from uuid import UUID, uuid4
+from hgraph.core.edge import Edge
+from hgraph.core.hypergraph import Hypergraph
+from hgraph.core.rules import EdgesFrom, validator
+from hgraph.core.validator import ConstraintViolation
+
+# -----------------------------
+# Per-insert latency of a cardinality rule: declared lookup vs scan
+# -----------------------------
+#
+# Both types allow a company at most `LIMIT` employees. `Employs` declares
+# the count it needs and is answered from the edge index; `Hires` reads the
+# whole graph the way a rule without declared lookups would have to.
+
+LIMIT = 50
+
+GRAPH = Hypergraph()
+
+
+class Employs(Edge):
+    @validator(staff=EdgesFrom("Employs", count=True))
+    def bounded(self, staff: int) -> bool:
+        return staff < LIMIT
+
+
+class Hires(Edge):
+    @validator()
+    def bounded(self) -> bool:
+        staff = sum(
+            1
+            for edge in GRAPH.edges.values()
+            if edge.type == "Hires" and edge.source == self.source
+        )
+        return staff < LIMIT
+
+
+def make_edges(model: type, count: int, companies: list[UUID]) -> list[Edge]:
+    return [
+        model(source=companies[i % len(companies)], target=uuid4())
+        for i in range(count)
+    ]
+
+
+def measure(model: type, checkpoints: list[int], window: int) -> None:
+    global GRAPH
+    GRAPH = Hypergraph()
+    companies = [uuid4() for _ in range(checkpoints[-1] // LIMIT + 1)]
+    loaded = 0
+    for checkpoint in checkpoints:
+        for edge in make_edges(model, checkpoint - window - loaded, companies):
+            GRAPH.store.put_edge(edge)
+        sample = make_edges(model, window, companies)
+        gc.collect()
+        start = time.perf_counter()
+        for edge in sample:
+            try:
+                GRAPH.add_edge(edge)
+            except ConstraintViolation:
+                pass
+        elapsed = time.perf_counter() - start
+        loaded = checkpoint
+        print(f"{model.__name__:>8} {checkpoint:>10} {elapsed / window * 1e6:>12.2f}")
+
+
+def run(checkpoints: list[int], window: int) -> None:
+    print(f"{'type':>8} {'edges':>10} {'us/insert':>12}")
+    for model in (Employs, Hires):
+        measure(model, checkpoints, window)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--checkpoints", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--window", type=int, default=200)
+    args = parser.parse_args()
+    run(args.checkpoints, args.window)
@@ -0,0 +1,113 @@
+import argparse
+import gc
+import time
+import tracemalloc
+import uuid
+from uuid import UUID, uuid4
+from pydantic import BaseModel, ConfigDict, Field
+from hgraph.core.edge import Edge
+from hgraph.core.config import EdgeConfig
+
+# -----------------------------
+# Edge construction: per-instance config vs shared class config
+# -----------------------------
+#
+# The "legacy" models reproduce the previous layout, where `config` was a
+# field: the base class built a fresh config for every edge through its
+# `default_factory`, subclasses shared their declared default, and both
+# wrote the config out with every dump. The other rows are today's models;
+# "construct" and "trusted" build edges from already-typed values, as
+# loaders do, through pydantic's `model_construct` (what the columnar store
+# used before) and through `Edge.trusted`.
+
+
+class MutableEdgeConfig(EdgeConfig):
+    model_config = ConfigDict(frozen=False)
+
+
+class LegacyEdge(BaseModel):
+    config: MutableEdgeConfig = Field(default_factory=MutableEdgeConfig)
+
+    id: UUID = Field(default_factory=lambda x: uuid.uuid4())
+    type: str = Field(default="Edge")
+
+    source: UUID
+    target: UUID
+
+
+class LegacyKnows(BaseModel):
+    config: MutableEdgeConfig = MutableEdgeConfig(irreflexive=True)
+
+    id: UUID = Field(default_factory=lambda x: uuid.uuid4())
+    type: str = Field(default="Knows")
+
+    source: UUID
+    target: UUID
+
+
+class Knows(Edge):
+    config: EdgeConfig = EdgeConfig(irreflexive=True)
+
+
+BUILDERS = {
+    "legacy base": lambda source, target: LegacyEdge(source=source, target=target),
+    "legacy subclass": lambda source, target: LegacyKnows(source=source, target=target),
+    "base": lambda source, target: Edge(source=source, target=target),
+    "subclass": lambda source, target: Knows(source=source, target=target),
+    "construct": lambda source, target: Knows.model_construct(
+        id=uuid4(), type="Knows", source=source, target=target
+    ),
+    "trusted": lambda source, target: Knows.trusted(
+        id=uuid4(), type="Knows", source=source, target=target
+    ),
+}
+
+
+def endpoints(edges: int, nodes: list[UUID]) -> list[tuple[UUID, UUID]]:
+    return [
+        (nodes[i % len(nodes)], nodes[(i * 31 + 7) % len(nodes)]) for i in range(edges)
+    ]
+
+
+def rate(build, pairs: list[tuple[UUID, UUID]], repeats: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for source, target in pairs:
+            build(source, target)
+        best = min(best, time.perf_counter() - started)
+    return len(pairs) / best
+
+
+def footprint(build, pairs: list[tuple[UUID, UUID]]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [build(source, target) for source, target in pairs]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / len(pairs)
+
+
+def run(edges: int, node_count: int) -> None:
+    nodes = [uuid4() for _ in range(node_count)]
+    pairs = endpoints(edges, nodes)
+    print(f"{edges} edges over {node_count} nodes")
+    for label, build in BUILDERS.items():
+        per_second = rate(build, pairs)
+        per_edge = footprint(build, pairs)
+        dumped = len(build(*pairs[0]).model_dump_json())
+        print(
+            f"{label + ':':<17} {per_second:>10,.0f} edges/s "
+            f"{per_edge:>8.1f} bytes/edge {dumped:>5} JSON bytes/edge"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--edges", type=int, default=200_000)
+    parser.add_argument("--nodes", type=int, default=20_000)
+    args = parser.parse_args()
+    run(args.edges, args.nodes)
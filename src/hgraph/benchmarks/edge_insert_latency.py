@@ -0,0 +1,82 @@
+import argparse
+import gc
+import time
+from uuid import UUID, uuid4
+from hgraph.core.edge import Edge
+from hgraph.core.config import EdgeConfig
+from hgraph.core.hypergraph import Hypergraph
+from hgraph.core.validator import ConstraintViolation
+
+# -----------------------------
+# Per-insert latency of Hypergraph.add_edge as the graph grows
+# -----------------------------
+
+
+class Follows(Edge):
+    source: UUID
+    target: UUID
+    config: EdgeConfig = EdgeConfig(
+        irreflexive=True, antisymmetric=True, allows_duplicates=False
+    )
+
+
+class Owns(Edge):
+    source: UUID
+    target: UUID
+    config: EdgeConfig = EdgeConfig(functional=True, inverse_functional=True)
+
+
+def make_edges(count: int, nodes: list[UUID]) -> list[Edge]:
+    edges = []
+    for i in range(count):
+        if i % 2:
+            edges.append(Owns(source=uuid4(), target=uuid4()))
+        else:
+            src = nodes[i % len(nodes)]
+            dst = nodes[(i * 7 + 1) % len(nodes)]
+            if src == dst:
+                dst = nodes[(i * 7 + 2) % len(nodes)]
+            edges.append(Follows(source=src, target=dst))
+    return edges
+
+
+def run(checkpoints: list[int], window: int) -> None:
+    g = Hypergraph()
+    nodes = [uuid4() for _ in range(10_000)]
+    loaded = 0
+    print(f"{'edges':>10} {'us/insert':>10}")
+    for checkpoint in checkpoints:
+        # Grow the graph untimed, in chunks, up to just below the checkpoint.
+        while loaded < checkpoint - window:
+            chunk = make_edges(min(50_000, checkpoint - window - loaded), nodes)
+            for edge in chunk:
+                try:
+                    g.add_edge(edge)
+                except ConstraintViolation:
+                    pass
+            loaded += len(chunk)
+
+        sample = make_edges(window, nodes)
+        gc.collect()
+        start = time.perf_counter()
+        for edge in sample:
+            try:
+                g.add_edge(edge)
+            except ConstraintViolation:
+                pass
+        elapsed = time.perf_counter() - start
+        loaded += window
+        print(f"{loaded:>10} {elapsed / window * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--checkpoints",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000, 1_000_000],
+    )
+    parser.add_argument("--window", type=int, default=1_000)
+    args = parser.parse_args()
+    run(args.checkpoints, args.window)
@@ -0,0 +1,57 @@
+import argparse
+import random
+import time
+from uuid import UUID, uuid4
+from hgraph.core.edge import Edge
+from hgraph.core.hypergraph import Hypergraph
+
+# -----------------------------
+# find_path latency between random node pairs on a large random graph
+# -----------------------------
+
+
+class Knows(Edge):
+    source: UUID
+    target: UUID
+
+
+def percentile(samples: list[float], share: float) -> float:
+    return samples[min(len(samples) - 1, int(len(samples) * share))]
+
+
+def run(nodes: int, edges: int, queries: int, max_depth: int, seed: int) -> None:
+    rng = random.Random(seed)
+    ids = [uuid4() for _ in range(nodes)]
+    g = Hypergraph()
+    start = time.perf_counter()
+    g.add_edges(
+        Knows(source=rng.choice(ids), target=rng.choice(ids)) for _ in range(edges)
+    )
+    print(f"loaded {edges} edges in {time.perf_counter() - start:.1f}s")
+
+    print(f"{'direction':>10} {'found':>6} {'p50 ms':>8} {'p99 ms':>8}")
+    for direction in ("out", "both"):
+        samples = []
+        found = 0
+        for _ in range(queries):
+            source, target = rng.choice(ids), rng.choice(ids)
+            start = time.perf_counter()
+            path = g.find_path(source, target, max_depth, direction=direction)
+            samples.append(time.perf_counter() - start)
+            found += path is not None
+        samples.sort()
+        print(
+            f"{direction:>10} {found:>6} {percentile(samples, 0.5) * 1e3:>8.2f}"
+            f" {percentile(samples, 0.99) * 1e3:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nodes", type=int, default=500_000)
+    parser.add_argument("--edges", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--max-depth", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.nodes, args.edges, args.queries, args.max_depth, args.seed)
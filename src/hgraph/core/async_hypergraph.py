@@ -0,0 +1,237 @@
+from __future__ import annotations
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from uuid import UUID
+
+from hgraph.core.edge import Edge, Hyperedge
+from hgraph.core.hypergraph import Direction, Hypergraph
+from hgraph.core.node import Node
+from hgraph.core.persistent_store import PersistentStore
+
+if TYPE_CHECKING:
+    from hgraph.core.query import QueryPattern
+    from hgraph.core.traversal import Path
+
+# -----------------------------
+# asyncio facade over Hypergraph
+# -----------------------------
+#
+# Graph calls block (on disk for `SQLiteStore`), so none of them runs on
+# the event loop. Writes are queued and drained by a single writer thread:
+# while one batch runs, new writes pile up and go out together as the next
+# batch, which is validated op by op but committed to the store once. Under
+# load, many concurrent single-edge inserts therefore cost one executor hop
+# and one disk commit per batch instead of one each (group commit), and the
+# batch size adapts to the arrival rate without a timer.
+#
+# Reads run on a bounded thread pool against the snapshot published after
+# each batch when the store is a `PersistentStore`. Other stores are not
+# safe to read while they are written, so their reads take the writer
+# thread too, in between batches.
+
+# A queued write: the `Hypergraph` method to call and its arguments.
+Op = Tuple[Callable, tuple]
+
+
+class AsyncHypergraph:
+    """
+    Awaitable CRUD, batch and query methods mirroring `Hypergraph`.
+
+    `max_workers` bounds the reader pool, `max_batch` the number of queued
+    writes applied per commit. Close it with `await graph.close()` or use
+    it as an `async with` block.
+    """
+
+    def __init__(
+        self,
+        graph: Optional[Hypergraph] = None,
+        max_workers: int = 4,
+        max_batch: int = 1_000,
+    ):
+        self.graph = graph if graph is not None else Hypergraph()
+        self.max_batch = max_batch
+        self.writer = ThreadPoolExecutor(1, thread_name_prefix="hgraph-writer")
+        self.snapshots = isinstance(self.graph.store, PersistentStore)
+        self.readers = (
+            ThreadPoolExecutor(max_workers, thread_name_prefix="hgraph-reader")
+            if self.snapshots
+            else self.writer
+        )
+        self.current = self.graph.snapshot() if self.snapshots else self.graph
+        self.pending: List[Tuple[Op, asyncio.Future]] = []
+        self.flushing: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "AsyncHypergraph":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Apply every queued write, commit the store and stop the threads."""
+        while self.flushing is not None:
+            await asyncio.shield(self.flushing)
+        commit = getattr(self.graph.store, "commit", None)
+        if commit is not None:
+            await asyncio.get_running_loop().run_in_executor(self.writer, commit)
+        self.writer.shutdown()
+        self.readers.shutdown()
+
+    # --- Execution ---
+    def write(self, method: Callable, *args: Any) -> asyncio.Future:
+        """Queue `method(graph, *args)`; the future resolves once committed."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append(((method, args), future))
+        if self.flushing is None:
+            self.flushing = loop.create_task(self._flush())
+        return future
+
+    async def read(self, method: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Run `method(graph, *args, **kwargs)` on the latest committed state."""
+        graph = self.current
+        return await asyncio.get_running_loop().run_in_executor(
+            self.readers, lambda: method(graph, *args, **kwargs)
+        )
+
+    async def _flush(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while self.pending:
+                batch = self.pending[: self.max_batch]
+                del self.pending[: self.max_batch]
+                ops = [op for op, _ in batch]
+                outcomes = await loop.run_in_executor(self.writer, self._apply, ops)
+                for (_, future), (error, result) in zip(batch, outcomes):
+                    if future.cancelled():
+                        continue
+                    if error is None:
+                        future.set_result(result)
+                    else:
+                        future.set_exception(error)
+        finally:
+            self.flushing = None
+
+    def _apply(self, ops: List[Op]) -> List[Tuple[Optional[BaseException], Any]]:
+        # Runs on the writer thread. Each op succeeds or fails on its own;
+        # batch methods such as `add_edges` stay all-or-nothing.
+        graph = self.graph
+        outcomes: List[Tuple[Optional[BaseException], Any]] = []
+        for method, args in ops:
+            try:
+                outcomes.append((None, method(graph, *args)))
+            except Exception as error:
+                outcomes.append((error, None))
+        commit = getattr(graph.store, "commit", None)
+        if commit is not None:
+            commit()
+        if self.snapshots:
+            self.current = graph.snapshot()
+        return outcomes
+
+    # --- Nodes ---
+    def add_node(self, node: Node) -> asyncio.Future:
+        return self.write(Hypergraph.add_node, node)
+
+    def add_nodes(self, nodes: Iterable[Node]) -> asyncio.Future:
+        return self.write(Hypergraph.add_nodes, list(nodes))
+
+    def update_node(self, node_id: UUID, updated: Node) -> asyncio.Future:
+        return self.write(Hypergraph.update_node, node_id, updated)
+
+    def delete_node(self, node_id: UUID, cascade: bool = False) -> asyncio.Future:
+        return self.write(Hypergraph.delete_node, node_id, cascade)
+
+    def delete_nodes(
+        self, node_ids: Iterable[UUID], cascade: bool = False
+    ) -> asyncio.Future:
+        return self.write(Hypergraph.delete_nodes, list(node_ids), cascade)
+
+    async def get_node(self, node_id: UUID) -> Optional[Node]:
+        return await self.read(Hypergraph.get_node, node_id)
+
+    # --- Edges ---
+    def add_edge(self, edge: Edge) -> asyncio.Future:
+        return self.write(Hypergraph.add_edge, edge)
+
+    def add_edges(
+        self, edges: Iterable[Edge], fail_fast: bool = True
+    ) -> asyncio.Future:
+        return self.write(Hypergraph.add_edges, list(edges), fail_fast)
+
+    def update_edge(self, edge_id: UUID, updated: Edge) -> asyncio.Future:
+        return self.write(Hypergraph.update_edge, edge_id, updated)
+
+    def delete_edge(self, edge_id: UUID) -> asyncio.Future:
+        return self.write(Hypergraph.delete_edge, edge_id)
+
+    async def get_edge(self, edge_id: UUID) -> Optional[Edge]:
+        return await self.read(Hypergraph.get_edge, edge_id)
+
+    # --- Hyperedges ---
+    def add_hyperedge(self, hyperedge: Hyperedge) -> asyncio.Future:
+        return self.write(Hypergraph.add_hyperedge, hyperedge)
+
+    def add_hyperedges(
+        self, hyperedges: Iterable[Hyperedge], fail_fast: bool = True
+    ) -> asyncio.Future:
+        return self.write(Hypergraph.add_hyperedges, list(hyperedges), fail_fast)
+
+    def update_hyperedge(self, edge_id: UUID, updated: Hyperedge) -> asyncio.Future:
+        return self.write(Hypergraph.update_hyperedge, edge_id, updated)
+
+    def delete_hyperedge(self, edge_id: UUID) -> asyncio.Future:
+        return self.write(Hypergraph.delete_hyperedge, edge_id)
+
+    async def get_hyperedge(self, edge_id: UUID) -> Optional[Hyperedge]:
+        return await self.read(Hypergraph.get_hyperedge, edge_id)
+
+    # --- Queries ---
+    async def get_neighbors(
+        self,
+        node_id: UUID,
+        direction: Direction = "out",
+        type: Optional[str] = None,
+    ) -> List[Node]:
+        return await self.read(Hypergraph.get_neighbors, node_id, direction, type)
+
+    async def find_edges(
+        self,
+        source: Optional[UUID] = None,
+        target: Optional[UUID] = None,
+        type: Optional[str] = None,
+    ) -> List[Edge]:
+        return await self.read(Hypergraph.find_edges, source, target, type)
+
+    async def find_hyperedges(
+        self, containing: Optional[UUID] = None, type: Optional[str] = None
+    ) -> List[Hyperedge]:
+        return await self.read(Hypergraph.find_hyperedges, containing, type)
+
+    async def match(
+        self, pattern: Union["QueryPattern", str], limit: Optional[int] = None
+    ) -> List[Dict[str, UUID]]:
+        return await self.read(Hypergraph.match, pattern, limit)
+
+    async def find_path(
+        self, start: UUID, end: UUID, **options: Any
+    ) -> Optional["Path"]:
+        """See `Hypergraph.find_path` for the options."""
+        return await self.read(Hypergraph.find_path, start, end, **options)
+
+    async def k_hop_neighborhood(
+        self, node_id: UUID, k: int, **options: Any
+    ) -> Dict[UUID, int]:
+        """See `Hypergraph.k_hop_neighborhood` for the options."""
+        return await self.read(Hypergraph.k_hop_neighborhood, node_id, k, **options)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+from math import ceil, log
+from typing import Iterable
+
+# -----------------------------
+# Bloom filter over node ids
+# -----------------------------
+#
+# Disk-backed stores keep one of these in memory in front of their node
+# table, so a reference to a node that was never stored is rejected
+# without a query; only ids the filter may contain go to disk. Keys are
+# `UUID.int`: random ids are already uniformly distributed, so the two
+# halves serve directly as the base hashes of double hashing.
+
+MASK_64 = (1 << 64) - 1
+
+
+class BloomFilter:
+    """Set of ints with no false negatives and about `error_rate` false positives."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.capacity = max(capacity, 1024)
+        size = ceil(-self.capacity * log(error_rate) / log(2) ** 2)
+        self.size = size
+        self.hashes = max(1, round(size / self.capacity * log(2)))
+        self.bits = bytearray((size + 7) // 8)
+        self.count = 0
+
+    @classmethod
+    def of(
+        cls, keys: Iterable[int], count: int, error_rate: float = 0.01
+    ) -> "BloomFilter":
+        """A filter holding `keys`, with room for twice their `count`."""
+        bloom = cls(2 * count, error_rate)
+        for key in keys:
+            bloom.add(key)
+        return bloom
+
+    @property
+    def full(self) -> bool:
+        return self.count >= self.capacity
+
+    def add(self, key: int) -> None:
+        bits, size = self.bits, self.size
+        position, step = key & MASK_64, (key >> 64) | 1
+        for _ in range(self.hashes):
+            slot = position % size
+            bits[slot >> 3] |= 1 << (slot & 7)
+            position += step
+        self.count += 1
+
+    def __contains__(self, key: int) -> bool:
+        bits, size = self.bits, self.size
+        position, step = key & MASK_64, (key >> 64) | 1
+        for _ in range(self.hashes):
+            slot = position % size
+            if not bits[slot >> 3] & (1 << (slot & 7)):
+                return False
+            position += step
+        return True
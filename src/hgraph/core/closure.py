@@ -0,0 +1,265 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Sequence, Tuple
+from uuid import UUID
+
+from hgraph.core.columnar import NodeInterner
+
+if TYPE_CHECKING:
+    from hgraph.core.edge import Hyperedge
+
+
+def bit_positions(mask: int) -> Iterator[int]:
+    """Positions of the set bits in `mask`, lowest first."""
+    if mask.bit_count() * 64 < mask.bit_length():
+        # Sparse: peel off the lowest bit instead of rendering every digit.
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
+        return
+    # Dense: scanning the binary string runs in C.
+    digits = bin(mask)[:1:-1]
+    position = digits.find("1")
+    while position != -1:
+        yield position
+        position = digits.find("1", position + 1)
+
+
+class TransitiveClosure:
+    """
+    Reachability over the links of one edge type, maintained incrementally.
+
+    Every node keeps a bitset of the nodes it reaches and of the nodes that
+    reach it. Bit positions are local to the node's weakly connected
+    component, so a bitset is only as wide as the component it lives in;
+    when a link joins two components the smaller one is renumbered after
+    the larger by shifting its bitsets.
+
+    Adding a link ORs the target's descendants into every ancestor of the
+    source. Removing the last link between two nodes recomputes only the
+    source and its ancestors: no other node can reach the removed link.
+    Components are never split again, which only costs some width.
+    """
+
+    def __init__(self):
+        self.interner = NodeInterner()
+        # Indexed by interned position.
+        self.successors: List[Dict[int, int]] = []  # target -> link count
+        self.component: List[int] = []
+        self.local: List[int] = []
+        self.descendants: List[int] = []
+        self.ancestors: List[int] = []
+        # Component key -> interned positions, in local bit order.
+        self.members: Dict[int, List[int]] = {}
+
+    @classmethod
+    def from_links(cls, links: Iterable[Tuple[UUID, UUID]]) -> "TransitiveClosure":
+        """
+        Build a closure in one pass: every mask is computed once, strongly
+        connected component by component, instead of link by link.
+        """
+        closure = cls()
+        for source, target in links:
+            u, v = closure._position(source), closure._position(target)
+            successors = closure.successors[u]
+            count = successors.get(v, 0)
+            successors[v] = count + 1
+            if not count:
+                closure._merge(u, v)
+        predecessors: List[List[int]] = [[] for _ in closure.successors]
+        for u, successors in enumerate(closure.successors):
+            for v in successors:
+                predecessors[v].append(u)
+        closure.descendants = closure._reachability(closure.successors)
+        closure.ancestors = closure._reachability(predecessors)
+        return closure
+
+    # --- Maintenance ---
+    def add_link(self, source: UUID, target: UUID) -> None:
+        u, v = self._position(source), self._position(target)
+        links = self.successors[u]
+        count = links.get(v, 0)
+        links[v] = count + 1
+        if count:
+            return
+        self._merge(u, v)
+        if self.descendants[u] >> self.local[v] & 1:
+            # Already reachable, so both closures already contain each other.
+            return
+        members = self.members[self.component[u]]
+        ancestors = self.ancestors[u] | 1 << self.local[u]
+        descendants = self.descendants[v] | 1 << self.local[v]
+        for x in bit_positions(ancestors):
+            self.descendants[members[x]] |= descendants
+        for y in bit_positions(descendants):
+            self.ancestors[members[y]] |= ancestors
+
+    def remove_links(self, links: Iterable[Tuple[UUID, UUID]]) -> None:
+        """Remove one occurrence of each link, then recompute once."""
+        affected: Dict[int, int] = {}
+        for source, target in links:
+            u, v = self.interner.find(source), self.interner.find(target)
+            if u is None or v is None:
+                continue
+            successors = self.successors[u]
+            count = successors.get(v, 0)
+            if count > 1:
+                successors[v] = count - 1
+            elif count == 1:
+                del successors[v]
+                key = self.component[u]
+                affected[key] = (
+                    affected.get(key, 0) | self.ancestors[u] | 1 << self.local[u]
+                )
+        for key, mask in affected.items():
+            self._recompute(self.members[key], mask)
+
+    def add_hyperedge(self, hyperedge: Hyperedge) -> None:
+        for source in hyperedge.sources:
+            for target in hyperedge.targets:
+                self.add_link(source, target)
+
+    def remove_hyperedge(self, hyperedge: Hyperedge) -> None:
+        self.remove_links(
+            (source, target)
+            for source in hyperedge.sources
+            for target in hyperedge.targets
+        )
+
+    def _position(self, node_id: UUID) -> int:
+        position = self.interner.intern(node_id)
+        if position == len(self.successors):
+            self.successors.append({})
+            self.component.append(position)
+            self.local.append(0)
+            self.descendants.append(0)
+            self.ancestors.append(0)
+            self.members[position] = [position]
+        return position
+
+    def _merge(self, u: int, v: int) -> None:
+        first, second = self.component[u], self.component[v]
+        if first == second:
+            return
+        if len(self.members[first]) < len(self.members[second]):
+            first, second = second, first
+        offset = len(self.members[first])
+        for position in self.members[second]:
+            self.component[position] = first
+            self.local[position] += offset
+            self.descendants[position] <<= offset
+            self.ancestors[position] <<= offset
+        self.members[first].extend(self.members.pop(second))
+
+    def _recompute(self, members: List[int], affected: int) -> None:
+        reached = {
+            x: self._reach(members[x], affected) for x in bit_positions(affected)
+        }
+        for x, mask in reached.items():
+            position = members[x]
+            lost = self.descendants[position] & ~mask
+            self.descendants[position] = mask
+            for y in bit_positions(lost):
+                self.ancestors[members[y]] &= ~(1 << x)
+
+    def _reach(self, start: int, affected: int) -> int:
+        # Nodes outside `affected` cannot reach a removed link, so their
+        # descendants are still exact and are taken without expanding them.
+        reached = 0
+        stack = [start]
+        while stack:
+            for successor in self.successors[stack.pop()]:
+                bit = 1 << self.local[successor]
+                if reached & bit:
+                    continue
+                reached |= bit
+                if affected & bit:
+                    stack.append(successor)
+                else:
+                    reached |= self.descendants[successor]
+        return reached
+
+    def _reachability(self, adjacency: Sequence[Iterable[int]]) -> List[int]:
+        """
+        Masks of everything reachable from each position along `adjacency`,
+        using an iterative Tarjan pass. Components come out sinks first, so
+        the masks of their successors are already final.
+        """
+        bits = [1 << local for local in self.local]
+        masks = [0] * len(adjacency)
+        order = [-1] * len(adjacency)
+        low = [0] * len(adjacency)
+        on_stack = [False] * len(adjacency)
+        stack: List[int] = []
+        counter = 0
+        for root in range(len(adjacency)):
+            if order[root] != -1:
+                continue
+            order[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [(root, iter(adjacency[root]))]
+            while work:
+                node, successors = work[-1]
+                for successor in successors:
+                    if order[successor] == -1:
+                        order[successor] = low[successor] = counter
+                        counter += 1
+                        stack.append(successor)
+                        on_stack[successor] = True
+                        work.append((successor, iter(adjacency[successor])))
+                        break
+                    if on_stack[successor]:
+                        low[node] = min(low[node], order[successor])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+                    if low[node] != order[node]:
+                        continue
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    inside = set(component)
+                    cyclic = len(component) > 1
+                    mask = 0
+                    for member in component:
+                        for successor in adjacency[member]:
+                            if successor in inside:
+                                cyclic = True
+                            else:
+                                mask |= bits[successor] | masks[successor]
+                    if cyclic:
+                        for member in component:
+                            mask |= bits[member]
+                    for member in component:
+                        masks[member] = mask
+        return masks
+
+    # --- Queries ---
+    def is_reachable(self, source: UUID, target: UUID) -> bool:
+        """Whether a path of one or more links leads from `source` to `target`."""
+        u, v = self.interner.find(source), self.interner.find(target)
+        if u is None or v is None or self.component[u] != self.component[v]:
+            return False
+        return bool(self.descendants[u] >> self.local[v] & 1)
+
+    def descendants_of(self, node_id: UUID) -> List[UUID]:
+        return self._nodes(node_id, self.descendants)
+
+    def ancestors_of(self, node_id: UUID) -> List[UUID]:
+        return self._nodes(node_id, self.ancestors)
+
+    def _nodes(self, node_id: UUID, masks: List[int]) -> List[UUID]:
+        position = self.interner.find(node_id)
+        if position is None:
+            return []
+        members = self.members[self.component[position]]
+        ids = self.interner.ids
+        return [ids[members[x]] for x in bit_positions(masks[position])]
@@ -0,0 +1,572 @@
+from __future__ import annotations
+from array import array
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from uuid import UUID
+
+from hgraph.core.node import Node
+from hgraph.core.edge import Edge, Hyperedge
+from hgraph.core.index import EMPTY, Bucket, NodeKey, Role
+
+# Fields every edge carries in its own column (or that are implied by the
+# type column); anything else a subclass declares is kept per row.
+EDGE_COLUMNS = frozenset({"id", "type", "source", "target"})
+HYPEREDGE_COLUMNS = frozenset({"id", "type", "sources", "targets"})
+
+TOMBSTONE = -1
+MASK_64 = (1 << 64) - 1
+
+
+class NodeInterner:
+    """Maps node UUIDs to dense integer ids and back."""
+
+    def __init__(self):
+        self.ids: List[UUID] = []
+        self.positions: Dict[int, int] = {}
+
+    def intern(self, node_id: UUID) -> int:
+        position = self.positions.get(node_id.int)
+        if position is None:
+            position = len(self.ids)
+            self.positions[node_id.int] = position
+            self.ids.append(node_id)
+        return position
+
+    def find(self, node_id: UUID) -> Optional[int]:
+        return self.positions.get(node_id.int)
+
+
+class TypeTable:
+    """Dense ids for type names, remembering the model class of each."""
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.classes: List[type] = []
+        self.ids: Dict[str, int] = {}
+
+    def intern(self, type_name: str, model: type) -> int:
+        type_id = self.ids.get(type_name)
+        if type_id is None:
+            type_id = len(self.names)
+            self.ids[type_name] = type_id
+            self.names.append(type_name)
+            self.classes.append(model)
+        return type_id
+
+
+def split_id(value: UUID) -> Tuple[int, int]:
+    return value.int >> 64, value.int & MASK_64
+
+
+def row_layout(model: type, columns: frozenset) -> Tuple[str, ...]:
+    """Per-row field names of `model`."""
+    return tuple(name for name in model.model_fields if name not in columns)
+
+
+class ColumnarStore:
+    """
+    Compact `GraphStore` that keeps edges as parallel typed arrays.
+
+    Node UUIDs are interned to dense integers. Each edge is one row across
+    the type, source, target and id columns, and hyperedges keep their
+    sources and targets in CSR-style offset arrays. `Edge`/`Hyperedge`
+    models are only materialised when a caller reads them.
+
+    Rows are never moved in place: deletes and replacements leave a
+    tombstone that `compact()` reclaims, and the edge and hyperedge indexes
+    skip tombstoned rows as they read them. Pair lookups (`between`,
+    `with_members`) filter the smaller bucket instead of keeping a per-pair
+    index.
+    """
+
+    def __init__(self):
+        self.nodes: Dict[UUID, Node] = {}
+        self.interner = NodeInterner()
+
+        self.edge_types = TypeTable()
+        self.edge_type = array("i")
+        self.edge_source = array("q")
+        self.edge_target = array("q")
+        self.edge_id_hi = array("Q")
+        self.edge_id_lo = array("Q")
+        self.edge_extra: Dict[int, dict] = {}
+        self.edge_rows: Dict[int, int] = {}
+
+        self.hyperedge_types = TypeTable()
+        self.hyperedge_type = array("i")
+        self.hyperedge_id_hi = array("Q")
+        self.hyperedge_id_lo = array("Q")
+        self.source_offsets = array("q", [0])
+        self.source_nodes = array("q")
+        self.target_offsets = array("q", [0])
+        self.target_nodes = array("q")
+        self.hyperedge_extra: Dict[int, dict] = {}
+        self.hyperedge_rows: Dict[int, int] = {}
+
+        self._layouts: Dict[type, Tuple[str, ...]] = {}
+
+        self.edges = ColumnarEdges(self)
+        self.hyperedges = ColumnarHyperedges(self)
+        self.edge_index = ColumnarEdgeIndex(self)
+        self.hyperedge_index = ColumnarHyperedgeIndex(self)
+
+    # --- Nodes ---
+    def put_node(self, node: Node) -> None:
+        self.nodes[node.id] = node
+
+    def put_nodes(self, nodes: Iterable[Node]) -> None:
+        self.nodes.update((node.id, node) for node in nodes)
+
+    def pop_node(self, node_id: UUID) -> Optional[Node]:
+        return self.nodes.pop(node_id, None)
+
+    def node_types(self, node_ids: Iterable[UUID]) -> Dict[UUID, str]:
+        nodes = self.nodes
+        found = {}
+        for node_id in node_ids:
+            node = nodes.get(node_id)
+            if node is not None:
+                found[node_id] = node.type
+        return found
+
+    # --- Edges ---
+    def put_edge(self, edge: Edge) -> None:
+        previous = self.edge_rows.get(edge.id.int)
+        if previous is not None:
+            self._drop_edge_row(previous)
+        row = len(self.edge_type)
+        type_id = self.edge_types.intern(edge.type, type(edge))
+        source = self.interner.intern(edge.source)
+        target = self.interner.intern(edge.target)
+        hi, lo = split_id(edge.id)
+        self.edge_type.append(type_id)
+        self.edge_source.append(source)
+        self.edge_target.append(target)
+        self.edge_id_hi.append(hi)
+        self.edge_id_lo.append(lo)
+        extra = self._extra(edge, EDGE_COLUMNS)
+        if extra:
+            self.edge_extra[row] = extra
+        self.edge_rows[edge.id.int] = row
+        self.edge_index.add_row(row, type_id, source, target)
+
+    def put_edges(self, edges: List[Edge]) -> None:
+        for edge in edges:
+            self.put_edge(edge)
+
+    def pop_edge(self, edge_id: UUID) -> Optional[Edge]:
+        row = self.edge_rows.get(edge_id.int)
+        if row is None:
+            return None
+        edge = self.edge_at(row)
+        self._drop_edge_row(row)
+        return edge
+
+    def edge_at(self, row: int) -> Edge:
+        model = self.edge_types.classes[self.edge_type[row]]
+        return model.trusted(
+            id=self.edge_id_at(row),
+            type=self.edge_types.names[self.edge_type[row]],
+            source=self.interner.ids[self.edge_source[row]],
+            target=self.interner.ids[self.edge_target[row]],
+            **self.edge_extra.get(row, {}),
+        )
+
+    def edge_id_at(self, row: int) -> UUID:
+        return UUID(int=(self.edge_id_hi[row] << 64) | self.edge_id_lo[row])
+
+    def _drop_edge_row(self, row: int) -> None:
+        # The index drops tombstoned rows lazily; see `RowIndex`.
+        del self.edge_rows[(self.edge_id_hi[row] << 64) | self.edge_id_lo[row]]
+        self.edge_type[row] = TOMBSTONE
+        self.edge_extra.pop(row, None)
+
+    # --- Hyperedges ---
+    def put_hyperedge(self, hyperedge: Hyperedge) -> None:
+        previous = self.hyperedge_rows.get(hyperedge.id.int)
+        if previous is not None:
+            self._drop_hyperedge_row(previous)
+        row = len(self.hyperedge_type)
+        type_id = self.hyperedge_types.intern(hyperedge.type, type(hyperedge))
+        hi, lo = split_id(hyperedge.id)
+        self.hyperedge_type.append(type_id)
+        self.hyperedge_id_hi.append(hi)
+        self.hyperedge_id_lo.append(lo)
+        sources = [self.interner.intern(n) for n in hyperedge.sources]
+        targets = [self.interner.intern(n) for n in hyperedge.targets]
+        self.source_nodes.extend(sources)
+        self.source_offsets.append(len(self.source_nodes))
+        self.target_nodes.extend(targets)
+        self.target_offsets.append(len(self.target_nodes))
+        extra = self._extra(hyperedge, HYPEREDGE_COLUMNS)
+        if extra:
+            self.hyperedge_extra[row] = extra
+        self.hyperedge_rows[hyperedge.id.int] = row
+        self.hyperedge_index.add_row(
+            row, type_id, sources, targets, hyperedge.config.unordered
+        )
+
+    def pop_hyperedge(self, hyperedge_id: UUID) -> Optional[Hyperedge]:
+        row = self.hyperedge_rows.get(hyperedge_id.int)
+        if row is None:
+            return None
+        hyperedge = self.hyperedge_at(row)
+        self._drop_hyperedge_row(row)
+        return hyperedge
+
+    def hyperedge_at(self, row: int) -> Hyperedge:
+        ids = self.interner.ids
+        model = self.hyperedge_types.classes[self.hyperedge_type[row]]
+        sources = self.source_nodes[
+            self.source_offsets[row] : self.source_offsets[row + 1]
+        ]
+        targets = self.target_nodes[
+            self.target_offsets[row] : self.target_offsets[row + 1]
+        ]
+        return model.trusted(
+            id=self.hyperedge_id_at(row),
+            type=self.hyperedge_types.names[self.hyperedge_type[row]],
+            sources=[ids[n] for n in sources],
+            targets=[ids[n] for n in targets],
+            **self.hyperedge_extra.get(row, {}),
+        )
+
+    def hyperedge_id_at(self, row: int) -> UUID:
+        return UUID(int=(self.hyperedge_id_hi[row] << 64) | self.hyperedge_id_lo[row])
+
+    def _drop_hyperedge_row(self, row: int) -> None:
+        del self.hyperedge_rows[
+            (self.hyperedge_id_hi[row] << 64) | self.hyperedge_id_lo[row]
+        ]
+        self.hyperedge_type[row] = TOMBSTONE
+        self.hyperedge_extra.pop(row, None)
+
+    # --- Maintenance ---
+    def compact(self) -> None:
+        """Rewrite the columns without tombstoned rows."""
+        edges = list(self.edges.values())
+        hyperedges = list(self.hyperedges.values())
+        nodes = self.nodes
+        self.__init__()
+        self.nodes = nodes
+        for edge in edges:
+            self.put_edge(edge)
+        for hyperedge in hyperedges:
+            self.put_hyperedge(hyperedge)
+
+    def _extra(self, model: Edge | Hyperedge, columns: frozenset) -> dict:
+        fields = self._layouts.get(type(model))
+        if fields is None:
+            fields = self._layouts[type(model)] = row_layout(type(model), columns)
+        return {name: getattr(model, name) for name in fields}
+
+
+class ColumnarEdges(Mapping[UUID, Edge]):
+    """Read-only `edges` mapping that materialises rows on access."""
+
+    def __init__(self, store: ColumnarStore):
+        self.store = store
+
+    def __getitem__(self, edge_id: UUID) -> Edge:
+        return self.store.edge_at(self.store.edge_rows[edge_id.int])
+
+    def __iter__(self) -> Iterator[UUID]:
+        store = self.store
+        for row, type_id in enumerate(store.edge_type):
+            if type_id != TOMBSTONE:
+                yield store.edge_id_at(row)
+
+    def __len__(self) -> int:
+        return len(self.store.edge_rows)
+
+    def __contains__(self, edge_id: object) -> bool:
+        return isinstance(edge_id, UUID) and edge_id.int in self.store.edge_rows
+
+
+class ColumnarHyperedges(Mapping[UUID, Hyperedge]):
+    """Read-only `hyperedges` mapping that materialises rows on access."""
+
+    def __init__(self, store: ColumnarStore):
+        self.store = store
+
+    def __getitem__(self, hyperedge_id: UUID) -> Hyperedge:
+        return self.store.hyperedge_at(self.store.hyperedge_rows[hyperedge_id.int])
+
+    def __iter__(self) -> Iterator[UUID]:
+        store = self.store
+        for row, type_id in enumerate(store.hyperedge_type):
+            if type_id != TOMBSTONE:
+                yield store.hyperedge_id_at(row)
+
+    def __len__(self) -> int:
+        return len(self.store.hyperedge_rows)
+
+    def __contains__(self, hyperedge_id: object) -> bool:
+        return (
+            isinstance(hyperedge_id, UUID)
+            and hyperedge_id.int in self.store.hyperedge_rows
+        )
+
+
+class RowIndex:
+    """
+    Shared upkeep of the columnar indexes. Buckets are arrays of row
+    numbers keyed by interned ids, so each entry costs eight bytes instead
+    of a dict slot holding a UUID.
+
+    Deleting a row only tombstones its type in the store; buckets drop dead
+    rows the next time they are read, so a delete is O(1) however many
+    edges share its endpoints. Keys that are never read again keep their
+    dead rows until `ColumnarStore.compact()`.
+    """
+
+    def __init__(self, row_types: array, id_at: Callable[[int], UUID]):
+        self.row_types = row_types
+        self.id_at = id_at
+        # Rows of each type in insertion order.
+        self.by_type: Dict[int, array] = {}
+
+    @staticmethod
+    def _append(table: dict, key, row: int) -> None:
+        rows = table.get(key)
+        if rows is None:
+            table[key] = array("q", (row,))
+        else:
+            rows.append(row)
+
+    def _live(self, table: dict, key) -> Sequence[int]:
+        """Live rows under `key`, dropping any dead ones from the table."""
+        rows = table.get(key)
+        if rows is None:
+            return ()
+        row_types = self.row_types
+        live = [row for row in rows if row_types[row] != TOMBSTONE]
+        if len(live) < len(rows):
+            if live:
+                table[key] = array("q", live)
+            else:
+                del table[key]
+        return live
+
+    def _bucket(self, rows: Iterable[int]) -> Bucket:
+        id_at = self.id_at
+        bucket = {}
+        for row in rows:
+            record_id = id_at(row)
+            bucket[record_id.int] = record_id
+        return bucket
+
+
+class ColumnarEdgeIndex(RowIndex):
+    """`EdgeLookup` over the row numbers of a `ColumnarStore`."""
+
+    def __init__(self, store: ColumnarStore):
+        super().__init__(store.edge_type, store.edge_id_at)
+        self.store = store
+        self.by_source: Dict[Tuple[int, int], array] = {}
+        self.by_target: Dict[Tuple[int, int], array] = {}
+        self.outgoing_any: Dict[int, array] = {}
+        self.incoming_any: Dict[int, array] = {}
+
+    # --- Maintenance ---
+    def add_row(self, row: int, type_id: int, source: int, target: int) -> None:
+        self._append(self.by_source, (type_id, source), row)
+        self._append(self.by_target, (type_id, target), row)
+        self._append(self.outgoing_any, source, row)
+        self._append(self.incoming_any, target, row)
+        self._append(self.by_type, type_id, row)
+
+    # --- Lookups ---
+    def from_source(self, edge_type: str, source: UUID) -> Bucket:
+        return self._typed(self.by_source, edge_type, source)
+
+    def to_target(self, edge_type: str, target: UUID) -> Bucket:
+        return self._typed(self.by_target, edge_type, target)
+
+    def between(self, edge_type: str, source: UUID, target: UUID) -> Bucket:
+        store = self.store
+        type_id = store.edge_types.ids.get(edge_type)
+        source_pos = store.interner.find(source)
+        target_pos = store.interner.find(target)
+        if type_id is None or source_pos is None or target_pos is None:
+            return EMPTY
+        outgoing = self._live(self.by_source, (type_id, source_pos))
+        incoming = self._live(self.by_target, (type_id, target_pos))
+        if len(outgoing) <= len(incoming):
+            rows = [r for r in outgoing if store.edge_target[r] == target_pos]
+        else:
+            rows = [r for r in incoming if store.edge_source[r] == source_pos]
+        return self._bucket(rows)
+
+    def of_type(self, edge_type: str) -> Bucket:
+        type_id = self.store.edge_types.ids.get(edge_type)
+        if type_id is None:
+            return EMPTY
+        return self._bucket(self._live(self.by_type, type_id))
+
+    def outgoing(self, node: UUID, edge_type: Optional[str] = None) -> Bucket:
+        if edge_type is not None:
+            return self.from_source(edge_type, node)
+        return self._untyped(self.outgoing_any, node)
+
+    def incoming(self, node: UUID, edge_type: Optional[str] = None) -> Bucket:
+        if edge_type is not None:
+            return self.to_target(edge_type, node)
+        return self._untyped(self.incoming_any, node)
+
+    def _typed(self, table: dict, edge_type: str, node: UUID) -> Bucket:
+        type_id = self.store.edge_types.ids.get(edge_type)
+        position = self.store.interner.find(node)
+        if type_id is None or position is None:
+            return EMPTY
+        return self._bucket(self._live(table, (type_id, position)))
+
+    def _untyped(self, table: dict, node: UUID) -> Bucket:
+        position = self.store.interner.find(node)
+        if position is None:
+            return EMPTY
+        return self._bucket(self._live(table, position))
+
+
+class ColumnarHyperedgeIndex(RowIndex):
+    """
+    `HyperedgeLookup` over the row numbers of a `ColumnarStore`.
+
+    Side lookups are keyed by the hash of a side's interned node ids rather
+    than by the side itself, and candidates are checked against the CSR
+    arrays, so an entry holds no copy of the members.
+    """
+
+    def __init__(self, store: ColumnarStore):
+        super().__init__(store.hyperedge_type, store.hyperedge_id_at)
+        self.store = store
+        self.by_sources: Dict[Tuple[int, int], array] = {}
+        self.by_targets: Dict[Tuple[int, int], array] = {}
+        # Node -> hyperedge incidence, split by the side the node is on.
+        self.sourced_by: Dict[Tuple[int, int], array] = {}
+        self.targeted_by: Dict[Tuple[int, int], array] = {}
+        self.sourced_by_any: Dict[int, array] = {}
+        self.targeted_by_any: Dict[int, array] = {}
+
+    # --- Maintenance ---
+    def add_row(
+        self,
+        row: int,
+        type_id: int,
+        sources: List[int],
+        targets: List[int],
+        unordered: bool,
+    ) -> None:
+        side = frozenset if unordered else tuple
+        self._append(self.by_sources, (type_id, hash(side(sources))), row)
+        self._append(self.by_targets, (type_id, hash(side(targets))), row)
+        self._append(self.by_type, type_id, row)
+        for node in sources:
+            self._append(self.sourced_by, (type_id, node), row)
+            self._append(self.sourced_by_any, node, row)
+        for node in targets:
+            self._append(self.targeted_by, (type_id, node), row)
+            self._append(self.targeted_by_any, node, row)
+
+    def _positions(self, key: NodeKey) -> Optional[NodeKey]:
+        """`key` in interned positions, or None if a member was never stored."""
+        positions = self.store.interner.positions
+        found = [positions.get(node) for node in key]
+        if None in found:
+            return None
+        return frozenset(found) if isinstance(key, frozenset) else tuple(found)
+
+    def _side_of(self, row: int, role: Role, unordered: bool) -> NodeKey:
+        store = self.store
+        if role == "source":
+            offsets, nodes = store.source_offsets, store.source_nodes
+        else:
+            offsets, nodes = store.target_offsets, store.target_nodes
+        members = nodes[offsets[row] : offsets[row + 1]]
+        return frozenset(members) if unordered else tuple(members)
+
+    def _matching(
+        self, edge_type: str, sides: Tuple[Optional[NodeKey], Optional[NodeKey]]
+    ) -> Bucket:
+        # Reads the smaller of the candidate buckets, then checks each
+        # candidate's sides, which also rules out hash collisions.
+        type_id = self.store.hyperedge_types.ids.get(edge_type)
+        if type_id is None:
+            return EMPTY
+        wanted = []
+        for role, key, table in (
+            ("source", sides[0], self.by_sources),
+            ("target", sides[1], self.by_targets),
+        ):
+            if key is None:
+                continue
+            position_key = self._positions(key)
+            if position_key is None:
+                return EMPTY
+            wanted.append(
+                (role, position_key, self._live(table, (type_id, hash(position_key))))
+            )
+        unordered = isinstance(wanted[0][1], frozenset)
+        candidates = min((rows for _, _, rows in wanted), key=len)
+        return self._bucket(
+            row
+            for row in candidates
+            if all(
+                self._side_of(row, role, unordered) == key for role, key, _ in wanted
+            )
+        )
+
+    # --- Lookups ---
+    def with_sources(self, edge_type: str, sources: NodeKey) -> Bucket:
+        return self._matching(edge_type, (sources, None))
+
+    def with_targets(self, edge_type: str, targets: NodeKey) -> Bucket:
+        return self._matching(edge_type, (None, targets))
+
+    def with_members(
+        self, edge_type: str, sources: NodeKey, targets: NodeKey
+    ) -> Bucket:
+        return self._matching(edge_type, (sources, targets))
+
+    def of_type(self, edge_type: str) -> Bucket:
+        type_id = self.store.hyperedge_types.ids.get(edge_type)
+        if type_id is None:
+            return EMPTY
+        return self._bucket(self._live(self.by_type, type_id))
+
+    def containing(
+        self,
+        node: UUID,
+        edge_type: Optional[str] = None,
+        role: Optional[Role] = None,
+    ) -> Bucket:
+        """Hyperedges that have `node` among their sources and/or targets."""
+        position = self.store.interner.find(node)
+        if position is None:
+            return EMPTY
+        if edge_type is None:
+            key, sourced, targeted = position, self.sourced_by_any, self.targeted_by_any
+        else:
+            type_id = self.store.hyperedge_types.ids.get(edge_type)
+            if type_id is None:
+                return EMPTY
+            key, sourced, targeted = (
+                (type_id, position),
+                self.sourced_by,
+                self.targeted_by,
+            )
+        rows: List[int] = []
+        if role != "target":
+            rows.extend(self._live(sourced, key))
+        if role != "source":
+            rows.extend(self._live(targeted, key))
+        return self._bucket(rows)
@@ -0,0 +1,127 @@
+from __future__ import annotations
+import threading
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional
+from uuid import UUID
+
+from hgraph.core.edge import Edge, Hyperedge
+from hgraph.core.hypergraph import Hypergraph
+from hgraph.core.node import Node
+from hgraph.core.persistent_store import (
+    GraphDiff,
+    PersistentStore,
+    persistent_store,
+)
+
+# -----------------------------
+# Thread-safe Hypergraph for multithreaded servers
+# -----------------------------
+#
+# Writers are serialised on one lock, and each write runs validation and
+# insertion inside a `transaction()`, so a check can never be invalidated
+# by another thread before its insert lands, and a failed write leaves
+# nothing behind. After every successful write the graph publishes an O(1)
+# frozen snapshot by swapping a single reference.
+#
+# Readers only ever touch published snapshots. These are immutable and
+# share their trie nodes with the live graph, so reads take no lock and
+# never wait for a writer; a reader keeps a consistent view for as long as
+# it holds on to one snapshot.
+#
+# The lock is global rather than per type: every type shares the store's
+# records and index tables, and per-type locks would have to serialise on
+# those anyway. Write throughput is bounded by one core either way.
+
+
+class ConcurrentHypergraph:
+    """
+    Serialised writes to a `Hypergraph` with lock-free snapshot reads.
+
+    Use `snapshot()` for queries and the write methods (or a `write()`
+    block for several writes that must publish together) for changes.
+    """
+
+    def __init__(self, graph: Optional[Hypergraph] = None):
+        if graph is None:
+            graph = Hypergraph(store=PersistentStore())
+        persistent_store(graph)
+        self.graph = graph
+        # Reentrant so a write method may be called inside a `write()` block.
+        self.lock = threading.RLock()
+        self.current = graph.snapshot()
+
+    def snapshot(self) -> Hypergraph:
+        """The latest published version of the graph; never blocks."""
+        return self.current
+
+    @contextmanager
+    def write(self) -> Iterator[Hypergraph]:
+        """
+        Hold the writer lock and yield the live graph. Writes made in the
+        block become visible to readers together when it exits, or are
+        rolled back if it raises.
+        """
+        with self.lock:
+            with self.graph.transaction():
+                yield self.graph
+            if self.graph.transaction_log is None:
+                self.current = self.graph.snapshot()
+
+    # --- Nodes ---
+    def add_node(self, node: Node) -> None:
+        with self.write() as graph:
+            graph.add_node(node)
+
+    def add_nodes(self, nodes: Iterable[Node]) -> None:
+        with self.write() as graph:
+            graph.add_nodes(nodes)
+
+    def update_node(self, node_id: UUID, updated: Node) -> None:
+        with self.write() as graph:
+            graph.update_node(node_id, updated)
+
+    def delete_node(self, node_id: UUID, cascade: bool = False) -> GraphDiff:
+        with self.write() as graph:
+            return graph.delete_node(node_id, cascade)
+
+    def delete_nodes(
+        self, node_ids: Iterable[UUID], cascade: bool = False
+    ) -> GraphDiff:
+        with self.write() as graph:
+            return graph.delete_nodes(node_ids, cascade)
+
+    # --- Edges ---
+    def add_edge(self, edge: Edge) -> None:
+        with self.write() as graph:
+            graph.add_edge(edge)
+
+    def add_edges(self, edges: Iterable[Edge], fail_fast: bool = True) -> None:
+        with self.write() as graph:
+            graph.add_edges(edges, fail_fast)
+
+    def update_edge(self, edge_id: UUID, updated: Edge) -> None:
+        with self.write() as graph:
+            graph.update_edge(edge_id, updated)
+
+    def delete_edge(self, edge_id: UUID) -> None:
+        with self.write() as graph:
+            graph.delete_edge(edge_id)
+
+    # --- Hyperedges ---
+    def add_hyperedge(self, hyperedge: Hyperedge) -> None:
+        with self.write() as graph:
+            graph.add_hyperedge(hyperedge)
+
+    def add_hyperedges(
+        self, hyperedges: Iterable[Hyperedge], fail_fast: bool = True
+    ) -> None:
+        with self.write() as graph:
+            graph.add_hyperedges(hyperedges, fail_fast)
+
+    def update_hyperedge(self, edge_id: UUID, updated: Hyperedge) -> None:
+        with self.write() as graph:
+            graph.update_hyperedge(edge_id, updated)
+
+    def delete_hyperedge(self, edge_id: UUID) -> None:
+        with self.write() as graph:
+            graph.delete_hyperedge(edge_id)
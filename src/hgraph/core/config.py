@@ -1,9 +1,48 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, ConfigDict
+from typing import Any, ClassVar, Dict, Optional, TypeVar
+
+# Configs are properties of a type, not of its instances: each model class
+# holds one frozen config as a class attribute, and equal configs are
+# interned so that every class declaring the same flags shares one object.
+
+C = TypeVar("C", bound=BaseModel)
+
+_interned: Dict[BaseModel, BaseModel] = {}
+
+
+def intern_config(config: C) -> C:
+    """The shared instance equal to `config`."""
+    return _interned.setdefault(config, config)
+
+
+def share_config(model: type) -> None:
+    """
+    Turn the `config` a model subclass declares into a shared class
+    attribute. Subclasses write `config: EdgeConfig = EdgeConfig(...)`;
+    the annotation is rewritten to a `ClassVar` before pydantic collects
+    fields, so the config is neither a field nor stored per instance.
+    """
+    annotations = model.__dict__.get("__annotations__", {})
+    if "config" in annotations:
+        annotations["config"] = ClassVar[type(model.config)]
+    model.config = intern_config(model.config)
+
+
+def reject_config(data: Any) -> Any:
+    """
+    Body of the models' `mode="before"` validator. A config is a class
+    attribute, so a `config=` argument would otherwise be dropped without
+    a word; declare it on a subclass instead.
+    """
+    if isinstance(data, dict) and "config" in data:
+        raise ValueError(
+            "config is set per class, not per instance; declare it on a subclass"
+        )
+    return data
 
 
 class NodeConfig(BaseModel):
-    pass
+    model_config = ConfigDict(frozen=True)
 
 
 class EdgeConfig(BaseModel):
@@ -14,6 +53,8 @@ class EdgeConfig(BaseModel):
     Constraints like symmetric, reflexive, transitive, etc. describe possibility, not requirement.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     symmetric: bool = False
     """
     If True:
@@ -109,6 +150,19 @@ class EdgeConfig(BaseModel):
         This enables classic **directed multigraph** semantics.
     """
 
+    domain: Optional[str] = None
+    """
+    The name of a node class every source must be an instance of (a node of
+    that class or a subclass), checked on insert against the stored nodes.
+    Example: "employs" with domain "Company" — only companies employ.
+    """
+
+    range: Optional[str] = None
+    """
+    The name of a node class every target must be an instance of.
+    Example: "employs" with range "Person" — only people are employed.
+    """
+
 
 class HyperedgeConfig(BaseModel):
     """
@@ -117,6 +171,8 @@ class HyperedgeConfig(BaseModel):
     These define semantics and structure for edges that connect more than two nodes.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     unordered: bool = False
     """
     If True:
@@ -190,3 +246,15 @@ class HyperedgeConfig(BaseModel):
     Name of the inverse hyperedge type (if exists).
     Example: "DelegatesTo" <-> "ReceivesDelegationFrom"
     """
+
+    domain: Optional[str] = None
+    """
+    The name of a node class every source must be an instance of.
+    Example: "authoredByTeam" with domain "Researcher".
+    """
+
+    range: Optional[str] = None
+    """
+    The name of a node class every target must be an instance of.
+    Example: "authoredByTeam" with range "Paper".
+    """
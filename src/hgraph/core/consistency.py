@@ -0,0 +1,514 @@
+from __future__ import annotations
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+)
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from hgraph.core.index import HyperedgeIndex
+from hgraph.core.registry import SchemaRegistry
+from hgraph.core.rules import CustomRule
+from hgraph.core.validator import ConstraintViolation
+
+if TYPE_CHECKING:
+    from hgraph.core.hypergraph import Hypergraph
+
+# -----------------------------
+# Whole-graph consistency audit
+# -----------------------------
+#
+# `ConstraintValidator` checks one incoming record against the graph. This
+# module checks every stored record at once, e.g. after a trusted load.
+# Records are partitioned by type, and each type's rules are split into
+# families that share a grouping key (source, target, endpoint pair, ...).
+# Large types are further sharded by that key, so every task sees all the
+# rows it needs and tasks run independently across a process pool.
+#
+# Checks that read nodes or the indexes rather than rows of one type,
+# i.e. `domain`/`range`, referential integrity and `@validator` rules, run
+# afterwards in this process, per record, with every endpoint fetched in
+# one `node_types` call.
+
+Kind = Literal["edges", "hyperedges"]
+
+
+class Violation(BaseModel):
+    kind: Kind
+    rule: str
+    type: str
+    ids: List[UUID]
+    """The records that conflict with each other (or the one offender)."""
+
+
+class ConsistencyReport(BaseModel):
+    violations: List[Violation] = Field(default_factory=list)
+    checked: Dict[str, int] = Field(default_factory=dict)
+    """Number of records audited per type."""
+
+    @property
+    def ok(self) -> bool:
+        return not self.violations
+
+    def by_rule(self) -> Dict[str, List[Violation]]:
+        grouped: Dict[str, List[Violation]] = {}
+        for violation in self.violations:
+            grouped.setdefault(violation.rule, []).append(violation)
+        return grouped
+
+
+# Whether a record's config enforces each rule, keyed by rule name.
+EDGE_RULES: Dict[str, Callable] = {
+    "irreflexive": lambda config: config.irreflexive,
+    "asymmetric": lambda config: config.asymmetric,
+    "antisymmetric": lambda config: config.antisymmetric,
+    "functional": lambda config: config.functional,
+    "inverse_functional": lambda config: config.inverse_functional,
+    "duplicate": lambda config: not config.allows_duplicates,
+}
+HYPEREDGE_RULES: Dict[str, Callable] = {
+    "cyclic": lambda config: not config.cyclic,
+    "reflexive": lambda config: not config.reflexive,
+    "duplicate": lambda config: not config.allows_duplicates,
+    "functional": lambda config: config.functional,
+    "inverse_functional": lambda config: config.inverse_functional,
+}
+
+# Rules `record_violations` reports for a record's endpoints.
+ENDPOINT_RULES = ("integrity", "domain", "range")
+
+# Below this many rows in all, a default audit runs in this process:
+# starting workers and pickling rows to them costs more than the checks.
+PARALLEL_MIN_ROWS = 100_000
+
+# Rule families: the rules checked together, and the shard key they share.
+EDGE_FAMILIES: Dict[str, Tuple[str, ...]] = {
+    "local": ("irreflexive",),
+    "pair": ("duplicate", "asymmetric", "antisymmetric"),
+    "source": ("functional",),
+    "target": ("inverse_functional",),
+}
+HYPEREDGE_FAMILIES: Dict[str, Tuple[str, ...]] = {
+    "local": ("cyclic", "reflexive"),
+    "members": ("duplicate",),
+    "sources": ("functional",),
+    "targets": ("inverse_functional",),
+}
+
+# Whether each rule applies to a partition; configs are per type.
+Enforced = Dict[str, bool]
+
+# `(kind, type, family, rows, enforced)`; a row is `(id, first, second)`
+# with endpoints for edges and canonical sides for hyperedges.
+Task = Tuple[Kind, str, str, list, Enforced]
+
+
+# --- Partitioning ---
+def partitions(graph: Hypergraph, kind: Kind) -> Iterator[Tuple[str, list, Enforced]]:
+    """Yield `(type, rows, enforced)` for every type stored under `kind`."""
+    records = graph.edges if kind == "edges" else graph.hyperedges
+    return rows_by_type(records.values(), kind)
+
+
+def rows_by_type(
+    records: Iterable[BaseModel], kind: Kind
+) -> Iterator[Tuple[str, list, Enforced]]:
+    rules = EDGE_RULES if kind == "edges" else HYPEREDGE_RULES
+    rows: Dict[str, list] = {}
+    # A config belongs to the class, so rules are evaluated once per type.
+    configs: Dict[str, BaseModel] = {}
+    for record in records:
+        if kind == "edges":
+            row = (record.id.int, record.source.int, record.target.int)
+        else:
+            sources, targets = HyperedgeIndex.keys(record)
+            row = (record.id.int, sources, targets)
+        type_rows = rows.get(record.type)
+        if type_rows is None:
+            type_rows = rows[record.type] = []
+            configs[record.type] = record.config
+        type_rows.append(row)
+    for type_name, type_rows in rows.items():
+        config = configs[type_name]
+        enforced = {rule: applies(config) for rule, applies in rules.items()}
+        yield type_name, type_rows, enforced
+
+
+def shard_key(family: str, row: tuple) -> Hashable:
+    if family in ("source", "sources"):
+        return row[1]
+    if family in ("target", "targets"):
+        return row[2]
+    if family == "pair":
+        # Both directions of a pair must land in the same shard.
+        return (row[1], row[2]) if row[1] <= row[2] else (row[2], row[1])
+    if family == "members":
+        return (row[1], row[2])
+    return row[0]
+
+
+def tasks(graph: Hypergraph, shard_size: int) -> Tuple[List[Task], Dict[str, int]]:
+    """Plan one task per type, rule family and shard; skip unenforced families."""
+    planned: List[Task] = []
+    checked: Dict[str, int] = {}
+    for kind, families in (
+        ("edges", EDGE_FAMILIES),
+        ("hyperedges", HYPEREDGE_FAMILIES),
+    ):
+        for type_name, rows, enforced in partitions(graph, kind):
+            checked[type_name] = checked.get(type_name, 0) + len(rows)
+            shards = -(-len(rows) // shard_size)
+            for family, rules in families.items():
+                flags = {rule: enforced[rule] for rule in rules}
+                if not any(flags.values()):
+                    continue
+                if shards == 1:
+                    planned.append((kind, type_name, family, rows, flags))
+                    continue
+                members: List[List[int]] = [[] for _ in range(shards)]
+                for position, row in enumerate(rows):
+                    key = shard_key(family, row)
+                    members[hash(key) % shards].append(position)
+                for shard in filter(None, members):
+                    shard_rows = [rows[p] for p in shard]
+                    planned.append((kind, type_name, family, shard_rows, flags))
+    return planned, checked
+
+
+# --- Checks (run in worker processes) ---
+def groups(keys: Iterable[Hashable]) -> Dict[Hashable, List[int]]:
+    """Positions of the rows sharing each key."""
+    grouped: Dict[Hashable, List[int]] = {}
+    for position, key in enumerate(keys):
+        grouped.setdefault(key, []).append(position)
+    return grouped
+
+
+def check_task(task: Task) -> List[Tuple[str, List[int]]]:
+    """Run one family of rules over one partition; returns `(rule, ids)`."""
+    kind, _, family, rows, enforced = task
+    found: List[Tuple[str, List[int]]] = []
+
+    def report(rule: str, positions: List[int]) -> None:
+        found.append((rule, [rows[p][0] for p in positions]))
+
+    if kind == "edges" and family == "local":
+        for position, (_, source, target) in enumerate(rows):
+            if source == target and enforced["irreflexive"]:
+                report("irreflexive", [position])
+
+    elif kind == "edges" and family == "pair":
+        pairs = groups([(row[1], row[2]) for row in rows])
+        for (source, target), positions in pairs.items():
+            if len(positions) > 1 and enforced["duplicate"]:
+                report("duplicate", positions)
+            if source > target:
+                continue
+            if source == target:
+                # A self-loop is its own reverse; a second copy conflicts.
+                both = positions if len(positions) > 1 else []
+            else:
+                both = positions + pairs.get((target, source), [])
+                if len(both) == len(positions):
+                    both = []
+            if both and enforced["asymmetric"]:
+                report("asymmetric", both)
+            if both and source != target and enforced["antisymmetric"]:
+                report("antisymmetric", both)
+
+    elif kind == "edges" and family in ("source", "target"):
+        rule = "functional" if family == "source" else "inverse_functional"
+        column = 1 if family == "source" else 2
+        for positions in groups([row[column] for row in rows]).values():
+            if len(positions) > 1 and enforced[rule]:
+                report(rule, positions)
+
+    elif family == "local":
+        for position, (_, sources, targets) in enumerate(rows):
+            if set(sources) & set(targets) and enforced["cyclic"]:
+                report("cyclic", [position])
+            if sources == targets and enforced["reflexive"]:
+                report("reflexive", [position])
+
+    elif family == "members":
+        for positions in groups([(row[1], row[2]) for row in rows]).values():
+            if len(positions) > 1 and enforced["duplicate"]:
+                report("duplicate", positions)
+
+    elif family in ("sources", "targets"):
+        rule = "functional" if family == "sources" else "inverse_functional"
+        column, other = (1, 2) if family == "sources" else (2, 1)
+        for positions in groups([row[column] for row in rows]).values():
+            if len({rows[p][other] for p in positions}) > 1 and enforced[rule]:
+                report(rule, positions)
+
+    return found
+
+
+# --- Record checks (run in this process) ---
+def record_violations(
+    graph: Hypergraph,
+    kind: Kind,
+    records: Iterable[BaseModel],
+    integrity: bool,
+) -> List[Violation]:
+    """
+    Violations of the checks `check_task` cannot run: endpoints that are
+    missing (`"integrity"`) or of the wrong node type (`"domain"`,
+    `"range"`), and failing custom rules, reported under their names.
+    """
+    plan_of = (
+        SchemaRegistry.edge_plan if kind == "edges" else SchemaRegistry.hyperedge_plan
+    )
+    audited: List[Tuple[BaseModel, bool, List[CustomRule]]] = []
+    node_ids = set()
+    for record in records:
+        plan = plan_of(record)
+        endpoints = plan.endpoints or integrity
+        rules = [check for check in plan.checks if isinstance(check, CustomRule)]
+        if not (endpoints or rules):
+            continue
+        audited.append((record, endpoints, rules))
+        if endpoints:
+            node_ids.update(members(kind, record))
+    if not audited:
+        return []
+    validator = graph._prefetched_validator(node_ids)
+    stored = validator.node_types(node_ids)
+    found: List[Violation] = []
+    for record, endpoints, rules in audited:
+        failed = endpoint_rules(kind, record, stored, integrity) if endpoints else []
+        for rule in rules:
+            try:
+                rule(validator, record)
+            except ConstraintViolation:
+                failed.append(rule.name)
+        found.extend(
+            Violation(kind=kind, rule=name, type=record.type, ids=[record.id])
+            for name in failed
+        )
+    return found
+
+
+def dependencies(graph: Hypergraph, violation: Violation) -> Set[UUID]:
+    """
+    Ids outside `violation.ids` whose state decides a record check: the
+    endpoints behind "integrity", "domain" and "range", or the records a
+    custom rule's lookups read. Row-family violations list every record
+    involved already, so they have none.
+    """
+    records = graph.edges if violation.kind == "edges" else graph.hyperedges
+    record = records.get(violation.ids[0]) if len(violation.ids) == 1 else None
+    if record is None:
+        return set()
+    if violation.rule in ENDPOINT_RULES:
+        return set(members(violation.kind, record))
+    plan_of = (
+        SchemaRegistry.edge_plan
+        if violation.kind == "edges"
+        else SchemaRegistry.hyperedge_plan
+    )
+    for check in plan_of(record).checks:
+        if isinstance(check, CustomRule) and check.name == violation.rule:
+            return check.read(graph._validator(), record)
+    return set()
+
+
+def members(kind: Kind, record: BaseModel) -> List[UUID]:
+    if kind == "edges":
+        return [record.source, record.target]
+    return [*record.sources, *record.targets]
+
+
+def endpoint_rules(
+    kind: Kind, record: BaseModel, stored: Dict[UUID, str], integrity: bool
+) -> List[str]:
+    """Names of the endpoint rules `record` breaks, each at most once."""
+    if kind == "edges":
+        sides = ([record.source], [record.target])
+    else:
+        sides = (record.sources, record.targets)
+    config = record.config
+    failed: List[str] = []
+    for rule, nodes, required in zip(
+        ("domain", "range"), sides, (config.domain, config.range)
+    ):
+        if required is None and not integrity:
+            continue
+        node_types = [stored.get(node) for node in nodes]
+        if None in node_types and "integrity" not in failed:
+            failed.append("integrity")
+        allowed = SchemaRegistry.node_subtypes(required) if required else None
+        if allowed and any(t is not None and t not in allowed for t in node_types):
+            failed.append(rule)
+    return failed
+
+
+# --- Entry point ---
+def check_consistency(
+    graph: Hypergraph,
+    processes: Optional[int] = None,
+    shard_size: int = 1_000_000,
+    integrity: Optional[bool] = None,
+) -> ConsistencyReport:
+    """
+    Audit every edge and hyperedge of `graph` against its config and
+    custom rules, and its endpoints against `domain` and `range`. With
+    `integrity` (by default the graph's own setting), every endpoint must
+    also be a stored node.
+
+    The config checks are split into independent tasks per type, rule
+    family and shard of at most about `shard_size` rows, and run on a pool
+    of `processes` workers. By default that is all cores, unless there is
+    only one or the graph has fewer than `PARALLEL_MIN_ROWS` rows to
+    check, in which case, as with `processes=1`, everything runs in this
+    process.
+    """
+    if integrity is None:
+        integrity = graph.integrity
+    planned, checked = tasks(graph, shard_size)
+    if processes is None and (
+        (os.cpu_count() or 1) == 1
+        or sum(len(task[3]) for task in planned) < PARALLEL_MIN_ROWS
+    ):
+        processes = 1
+    if processes == 1 or len(planned) <= 1:
+        results = [check_task(task) for task in planned]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            results = list(executor.map(check_task, planned))
+    report = build_report(planned, results, checked)
+    report.violations.extend(
+        record_violations(graph, "edges", graph.edges.values(), integrity)
+    )
+    report.violations.extend(
+        record_violations(graph, "hyperedges", graph.hyperedges.values(), integrity)
+    )
+    return report
+
+
+def check_records(
+    graph: Hypergraph,
+    edge_ids: Iterable[UUID] = (),
+    hyperedge_ids: Iterable[UUID] = (),
+) -> ConsistencyReport:
+    """
+    Audit only what the given records can conflict with: for each one, the
+    rows sharing its grouping key in every rule family its config enforces,
+    fetched through the indexes, and the records' own endpoint and custom
+    rule checks. Ids no longer stored are skipped.
+    """
+    requested: Dict[Kind, List[UUID]] = {
+        "edges": list(edge_ids),
+        "hyperedges": list(hyperedge_ids),
+    }
+    groups_by_family: Dict[Tuple[Kind, str], Dict[UUID, BaseModel]] = {}
+
+    def collect(kind: Kind, family: str, records: Iterable[BaseModel]) -> None:
+        group = groups_by_family.setdefault((kind, family), {})
+        for record in records:
+            group[record.id] = record
+
+    edges, index = graph.edges, graph.edge_index
+    for edge_id in requested["edges"]:
+        edge = edges.get(edge_id)
+        if edge is None:
+            continue
+        for family in enforced_families(edge.config, EDGE_RULES, EDGE_FAMILIES):
+            if family == "local":
+                found = [edge_id]
+            elif family == "pair":
+                found = [
+                    *index.between(edge.type, edge.source, edge.target).values(),
+                    *index.between(edge.type, edge.target, edge.source).values(),
+                ]
+            elif family == "source":
+                found = index.from_source(edge.type, edge.source).values()
+            else:
+                found = index.to_target(edge.type, edge.target).values()
+            collect("edges", family, (edges[i] for i in found))
+
+    hyperedges, hyperedge_index = graph.hyperedges, graph.hyperedge_index
+    for hyperedge_id in requested["hyperedges"]:
+        hyperedge = hyperedges.get(hyperedge_id)
+        if hyperedge is None:
+            continue
+        sources, targets = HyperedgeIndex.keys(hyperedge)
+        families = enforced_families(
+            hyperedge.config, HYPEREDGE_RULES, HYPEREDGE_FAMILIES
+        )
+        for family in families:
+            if family == "local":
+                found = [hyperedge_id]
+            elif family == "members":
+                found = hyperedge_index.with_members(
+                    hyperedge.type, sources, targets
+                ).values()
+            elif family == "sources":
+                found = hyperedge_index.with_sources(hyperedge.type, sources).values()
+            else:
+                found = hyperedge_index.with_targets(hyperedge.type, targets).values()
+            collect("hyperedges", family, (hyperedges[i] for i in found))
+
+    planned: List[Task] = []
+    checked: Dict[str, int] = {}
+    for (kind, family), group in groups_by_family.items():
+        families = EDGE_FAMILIES if kind == "edges" else HYPEREDGE_FAMILIES
+        for type_name, rows, enforced in rows_by_type(group.values(), kind):
+            checked[type_name] = max(checked.get(type_name, 0), len(rows))
+            flags = {rule: enforced[rule] for rule in families[family]}
+            planned.append((kind, type_name, family, rows, flags))
+    report = build_report(planned, [check_task(task) for task in planned], checked)
+    for kind, records in (("edges", edges), ("hyperedges", hyperedges)):
+        report.violations.extend(
+            record_violations(
+                graph,
+                kind,
+                (records[i] for i in requested[kind] if i in records),
+                graph.integrity,
+            )
+        )
+    return report
+
+
+def enforced_families(
+    config: BaseModel,
+    rules: Dict[str, Callable],
+    families: Dict[str, Tuple[str, ...]],
+) -> List[str]:
+    return [
+        family
+        for family, names in families.items()
+        if any(rules[name](config) for name in names)
+    ]
+
+
+def build_report(
+    planned: List[Task],
+    results: List[List[Tuple[str, List[int]]]],
+    checked: Dict[str, int],
+) -> ConsistencyReport:
+    report = ConsistencyReport(checked=checked)
+    for (kind, type_name, _, _, _), found in zip(planned, results):
+        for rule, ids in found:
+            report.violations.append(
+                Violation(
+                    kind=kind,
+                    rule=rule,
+                    type=type_name,
+                    ids=sorted(UUID(int=i) for i in ids),
+                )
+            )
+    return report
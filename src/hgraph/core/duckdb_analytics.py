@@ -0,0 +1,375 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple
+from uuid import UUID
+
+from hgraph.core.config import EdgeConfig, HyperedgeConfig
+from hgraph.core.consistency import ConsistencyReport, Violation
+from hgraph.core.jsonl import chunked
+from hgraph.core.parquet import KINDS, Kind, file_path, model_for, stored_types
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+    from hgraph.core.hypergraph import Direction, Hypergraph
+
+# -----------------------------
+# DuckDB analytical mirror
+# -----------------------------
+#
+# A read-mostly copy of a graph's structure in DuckDB columnar tables, for
+# whole-graph aggregation. Only the structural columns are mirrored (ids,
+# types, endpoints); constraint flags live in one row per type, taken from
+# the registered class's config, which is also what the Parquet
+# layout records. Ids are 16-byte blobs, as in `hgraph.core.parquet`.
+
+EDGE_FLAGS: Tuple[str, ...] = tuple(
+    name for name, field in EdgeConfig.model_fields.items() if field.annotation is bool
+)
+HYPEREDGE_FLAGS: Tuple[str, ...] = tuple(
+    name
+    for name, field in HyperedgeConfig.model_fields.items()
+    if field.annotation is bool
+)
+
+# Flag columns are quoted: `symmetric` is a reserved word in DuckDB.
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS nodes (id BLOB NOT NULL, type VARCHAR NOT NULL);
+CREATE TABLE IF NOT EXISTS edges (
+    id BLOB NOT NULL,
+    type VARCHAR NOT NULL,
+    source BLOB NOT NULL,
+    target BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS hyperedges (
+    id BLOB NOT NULL,
+    type VARCHAR NOT NULL,
+    sources BLOB[] NOT NULL,
+    targets BLOB[] NOT NULL
+);
+CREATE TABLE IF NOT EXISTS edge_types (
+    type VARCHAR PRIMARY KEY,
+    {", ".join(f'"{flag}" BOOLEAN NOT NULL' for flag in EDGE_FLAGS)}
+);
+CREATE TABLE IF NOT EXISTS hyperedge_types (
+    type VARCHAR PRIMARY KEY,
+    {", ".join(f'"{flag}" BOOLEAN NOT NULL' for flag in HYPEREDGE_FLAGS)}
+);
+
+-- Canonical sides, matching `canonical_nodes`: unordered hyperedges
+-- compare as sets, ordered ones as sequences.
+CREATE OR REPLACE VIEW hyperedge_keys AS
+SELECT h.id, h.type, h.sources, h.targets,
+    CASE WHEN t.unordered THEN list_sort(list_distinct(h.sources))
+         ELSE h.sources END AS sources_key,
+    CASE WHEN t.unordered THEN list_sort(list_distinct(h.targets))
+         ELSE h.targets END AS targets_key
+FROM hyperedges h JOIN hyperedge_types t USING (type);
+
+CREATE OR REPLACE VIEW hyperedge_members AS
+SELECT id AS hyperedge_id, type, unnest(sources) AS node_id, 'source' AS role
+FROM hyperedges
+UNION ALL
+SELECT id AS hyperedge_id, type, unnest(targets) AS node_id, 'target' AS role
+FROM hyperedges;
+"""
+
+# Each rule mirrors one check in `ConstraintValidator` and yields
+# `(type, ids)` rows, where `ids` are the records that conflict.
+EDGE_RULES: Dict[str, str] = {
+    "irreflexive": """
+        SELECT type, [id] FROM edges JOIN edge_types USING (type)
+        WHERE irreflexive AND source = target
+    """,
+    "asymmetric": """
+        SELECT e.type, [e.id, r.id] FROM edges e
+        JOIN edge_types t USING (type)
+        JOIN edges r ON r.type = e.type AND r.source = e.target
+            AND r.target = e.source AND r.id < e.id
+        WHERE t.asymmetric
+    """,
+    "antisymmetric": """
+        SELECT e.type, [e.id, r.id] FROM edges e
+        JOIN edge_types t USING (type)
+        JOIN edges r ON r.type = e.type AND r.source = e.target
+            AND r.target = e.source AND r.id < e.id
+        WHERE t.antisymmetric AND e.source <> e.target
+    """,
+    "functional": """
+        SELECT type, list(id) FROM edges JOIN edge_types USING (type)
+        WHERE functional GROUP BY type, source HAVING count(*) > 1
+    """,
+    "inverse_functional": """
+        SELECT type, list(id) FROM edges JOIN edge_types USING (type)
+        WHERE inverse_functional GROUP BY type, target HAVING count(*) > 1
+    """,
+    "duplicate": """
+        SELECT type, list(id) FROM edges JOIN edge_types USING (type)
+        WHERE NOT allows_duplicates
+        GROUP BY type, source, target HAVING count(*) > 1
+    """,
+}
+
+HYPEREDGE_RULES: Dict[str, str] = {
+    "cyclic": """
+        SELECT type, [id] FROM hyperedge_keys JOIN hyperedge_types USING (type)
+        WHERE NOT cyclic AND len(list_intersect(sources, targets)) > 0
+    """,
+    "reflexive": """
+        SELECT type, [id] FROM hyperedge_keys JOIN hyperedge_types USING (type)
+        WHERE NOT reflexive AND sources_key = targets_key
+    """,
+    "duplicate": """
+        SELECT type, list(id) FROM hyperedge_keys JOIN hyperedge_types USING (type)
+        WHERE NOT allows_duplicates
+        GROUP BY type, sources_key, targets_key HAVING count(*) > 1
+    """,
+    "functional": """
+        SELECT type, list(id) FROM hyperedge_keys JOIN hyperedge_types USING (type)
+        WHERE functional
+        GROUP BY type, sources_key HAVING count(DISTINCT targets_key) > 1
+    """,
+    "inverse_functional": """
+        SELECT type, list(id) FROM hyperedge_keys JOIN hyperedge_types USING (type)
+        WHERE inverse_functional
+        GROUP BY type, targets_key HAVING count(DISTINCT sources_key) > 1
+    """,
+}
+
+
+def require_duckdb():
+    try:
+        import duckdb
+        import pyarrow  # noqa: F401 - batches are handed over as Arrow tables
+    except ImportError as e:
+        raise ImportError(
+            "DuckDB analytics requires the 'duckdb' and 'pyarrow' packages "
+            "(pip install hgraph[duckdb])"
+        ) from e
+    return duckdb
+
+
+class DuckDBAnalytics:
+    """
+    Columnar mirror of a `Hypergraph` in an embedded DuckDB database.
+
+    Fill it with `mirror(graph)` or `import_parquet(path)`, then run
+    set-based queries over every record at once. The mirror is a copy:
+    later changes to the graph are not reflected until it is re-mirrored.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        duckdb = require_duckdb()
+        self.connection = duckdb.connect(path)
+        self.connection.execute(SCHEMA)
+
+    @classmethod
+    def from_graph(cls, graph: Hypergraph, path: str = ":memory:") -> "DuckDBAnalytics":
+        analytics = cls(path)
+        analytics.mirror(graph)
+        return analytics
+
+    def close(self) -> None:
+        self.connection.close()
+
+    # --- Loading ---
+    def clear(self) -> None:
+        for table in (*KINDS, "edge_types", "hyperedge_types"):
+            self.connection.execute(f"DELETE FROM {table}")
+
+    def mirror(self, graph: Hypergraph, batch_size: int = 100_000) -> None:
+        """Replace the mirrored tables with the current contents of `graph`."""
+        import pyarrow as pa
+
+        self.clear()
+        blob = pa.binary(16)
+        self._insert_batches(
+            "nodes",
+            graph.nodes.values(),
+            batch_size,
+            pa.schema([("id", blob), ("type", pa.string())]),
+            lambda node: (node.id.bytes, node.type),
+        )
+        self._insert_batches(
+            "edges",
+            graph.edges.values(),
+            batch_size,
+            pa.schema(
+                [
+                    ("id", blob),
+                    ("type", pa.string()),
+                    ("source", blob),
+                    ("target", blob),
+                ]
+            ),
+            lambda edge: (
+                edge.id.bytes,
+                edge.type,
+                edge.source.bytes,
+                edge.target.bytes,
+            ),
+        )
+        self._insert_batches(
+            "hyperedges",
+            graph.hyperedges.values(),
+            batch_size,
+            pa.schema(
+                [
+                    ("id", blob),
+                    ("type", pa.string()),
+                    ("sources", pa.list_(blob)),
+                    ("targets", pa.list_(blob)),
+                ]
+            ),
+            lambda hyperedge: (
+                hyperedge.id.bytes,
+                hyperedge.type,
+                [node.bytes for node in hyperedge.sources],
+                [node.bytes for node in hyperedge.targets],
+            ),
+        )
+        self.refresh_types()
+
+    def import_parquet(self, path: str, types: Optional[Iterable[str]] = None) -> None:
+        """
+        Append a snapshot written by `save_to_parquet`, optionally only the
+        given types. DuckDB reads the files directly, projecting the
+        structural columns.
+        """
+        selected = None if types is None else set(types)
+        # The file name is the type, so it is not read from the rows.
+        columns = {
+            "nodes": "id, ? AS type",
+            "edges": "id, ? AS type, source, target",
+            "hyperedges": "id, ? AS type, sources, targets",
+        }
+        for kind in KINDS:
+            for type_name in stored_types(path, kind):
+                if selected is not None and type_name not in selected:
+                    continue
+                self.connection.execute(
+                    f"INSERT INTO {kind} BY NAME "
+                    f"SELECT {columns[kind]} FROM read_parquet(?)",
+                    [type_name, file_path(path, kind, type_name)],
+                )
+        self.refresh_types()
+
+    def refresh_types(self) -> None:
+        """Record the config of every edge and hyperedge type present."""
+        for kind, table, flags in (
+            ("edges", "edge_types", EDGE_FLAGS),
+            ("hyperedges", "hyperedge_types", HYPEREDGE_FLAGS),
+        ):
+            missing = self.connection.execute(
+                f"SELECT DISTINCT type FROM {kind} "
+                f"WHERE type NOT IN (SELECT type FROM {table})"
+            ).fetchall()
+            for (type_name,) in missing:
+                model = model_for(kind, type_name)
+                config = model.config
+                self.connection.execute(
+                    f"INSERT INTO {table} VALUES (?{', ?' * len(flags)})",
+                    [type_name, *(getattr(config, flag) for flag in flags)],
+                )
+
+    def _insert_batches(
+        self, table: str, models: Iterable, batch_size: int, schema: pa.Schema, row
+    ) -> None:
+        import pyarrow as pa
+
+        for chunk in chunked(models, batch_size):
+            columns = list(zip(*(row(model) for model in chunk)))
+            batch = pa.Table.from_arrays(
+                [
+                    pa.array(column, type=field.type)
+                    for column, field in zip(columns, schema)
+                ],
+                schema=schema,
+            )
+            self.connection.register("batch", batch)
+            try:
+                self.connection.execute(f"INSERT INTO {table} SELECT * FROM batch")
+            finally:
+                self.connection.unregister("batch")
+
+    # --- Aggregations ---
+    def type_counts(self, kind: Kind) -> Dict[str, int]:
+        """Record count per type for one of `KINDS`."""
+        if kind not in KINDS:
+            raise ValueError(f"Unknown kind: {kind!r}")
+        rows = self.connection.execute(
+            f"SELECT type, count(*) FROM {kind} GROUP BY type ORDER BY type"
+        ).fetchall()
+        return dict(rows)
+
+    def degree_distribution(
+        self, direction: Direction = "both", edge_type: Optional[str] = None
+    ) -> Dict[int, int]:
+        """
+        Map each degree to the number of nodes that have it, counting
+        binary edges in `direction`. Nodes without edges count as degree 0.
+        """
+        endpoints = {
+            "out": "SELECT source AS node FROM edges {where}",
+            "in": "SELECT target AS node FROM edges {where}",
+            "both": "SELECT source AS node FROM edges {where} "
+            "UNION ALL SELECT target AS node FROM edges {where}",
+        }
+        if direction not in endpoints:
+            raise ValueError(f"Unknown direction: {direction!r}")
+        where = "" if edge_type is None else "WHERE type = $type"
+        return self._distribution(
+            endpoints[direction].format(where=where),
+            {} if edge_type is None else {"type": edge_type},
+        )
+
+    def hyperedge_degree_distribution(
+        self, edge_type: Optional[str] = None
+    ) -> Dict[int, int]:
+        """Like `degree_distribution`, counting hyperedge memberships."""
+        where = "" if edge_type is None else "WHERE type = $type"
+        return self._distribution(
+            f"SELECT DISTINCT hyperedge_id, node_id AS node "
+            f"FROM hyperedge_members {where}",
+            {} if edge_type is None else {"type": edge_type},
+        )
+
+    def _distribution(self, endpoints: str, parameters: dict) -> Dict[int, int]:
+        rows = self.connection.execute(
+            f"""
+            WITH degrees AS (
+                SELECT n.id, count(e.node) AS degree
+                FROM nodes n LEFT JOIN ({endpoints}) e ON e.node = n.id
+                GROUP BY n.id
+            )
+            SELECT degree, count(*) FROM degrees GROUP BY degree ORDER BY degree
+            """,
+            parameters,
+        ).fetchall()
+        return dict(rows)
+
+    # --- Consistency ---
+    def check_consistency(self) -> ConsistencyReport:
+        """
+        Audit every edge and hyperedge against its type's constraints in
+        one set-based query per rule, reported as by
+        `Hypergraph.check_consistency`. Endpoint and custom rule checks
+        read nodes and Python methods, so only the graph's own audit runs
+        them.
+        """
+        report = ConsistencyReport(
+            checked={**self.type_counts("edges"), **self.type_counts("hyperedges")}
+        )
+        for kind, rules in (
+            ("edges", EDGE_RULES),
+            ("hyperedges", HYPEREDGE_RULES),
+        ):
+            for rule, query in rules.items():
+                for type_name, ids in self.connection.execute(query).fetchall():
+                    report.violations.append(
+                        Violation(
+                            kind=kind,
+                            rule=rule,
+                            type=type_name,
+                            ids=sorted(UUID(bytes=i) for i in ids),
+                        )
+                    )
+        return report
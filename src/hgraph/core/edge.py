@@ -1,14 +1,20 @@
-from typing import Optional, List
+from typing import Any, ClassVar, List
 from uuid import UUID
 import uuid
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from hgraph.core.node import Node
-from hgraph.core.config import HyperedgeConfig, EdgeConfig
-from hgraph.core.registry import SchemaRegistry
+from hgraph.core.config import (
+    HyperedgeConfig,
+    EdgeConfig,
+    reject_config,
+    share_config,
+)
+from hgraph.core.registry import SchemaRegistry, construct_trusted
 
 
 class Edge(BaseModel):
-    config: EdgeConfig = Field(default_factory=EdgeConfig)
+    # Shared by every instance of the class; see `share_config`.
+    config: ClassVar[EdgeConfig] = EdgeConfig()
 
     id: UUID = Field(default_factory=lambda x: uuid.uuid4())
     type: str = Field(default="Edge")
@@ -19,12 +25,26 @@ class Edge(BaseModel):
 
     def __init_subclass__(cls, **kwargs):
         cls.type = cls.__name__
+        share_config(cls)
         SchemaRegistry.register_edge(cls)
         super().__init_subclass__(**kwargs)
 
+    @model_validator(mode="before")
+    @classmethod
+    def no_instance_config(cls, data: Any) -> Any:
+        return reject_config(data)
+
+    @classmethod
+    def trusted(cls, **fields: Any) -> "Edge":
+        """
+        Build an edge from already-valid values without pydantic
+        validation, for loaders reading records this library wrote.
+        """
+        return construct_trusted(cls, fields)
+
 
 class Hyperedge(BaseModel):
-    config: HyperedgeConfig = Field(default_factory=HyperedgeConfig)
+    config: ClassVar[HyperedgeConfig] = HyperedgeConfig()
 
     id: UUID = Field(default_factory=lambda x: uuid.uuid4())
     type: str = Field(default="Hyperedge")
@@ -35,5 +55,16 @@ class Hyperedge(BaseModel):
 
     def __init_subclass__(cls, **kwargs):
         cls.type = cls.__name__
+        share_config(cls)
         SchemaRegistry.register_hyperedge(cls)
         super().__init_subclass__(**kwargs)
+
+    @model_validator(mode="before")
+    @classmethod
+    def no_instance_config(cls, data: Any) -> Any:
+        return reject_config(data)
+
+    @classmethod
+    def trusted(cls, **fields: Any) -> "Hyperedge":
+        """Hyperedge counterpart of `Edge.trusted`."""
+        return construct_trusted(cls, fields)
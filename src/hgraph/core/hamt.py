@@ -0,0 +1,448 @@
+from __future__ import annotations
+from collections.abc import ItemsView, KeysView, ValuesView
+from typing import (
+    Any,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+)
+
+# -----------------------------
+# Hash array mapped trie (persistent map)
+# -----------------------------
+#
+# Each trie node consumes 5 bits of the key's hash and stores only its
+# occupied slots, located through a 32-bit bitmap. An update copies the
+# nodes on one root-to-leaf path (about log32(n) of them, so 4-5 for a
+# million keys) and shares everything else with the previous version.
+# Two versions therefore differ only along the paths that were written,
+# which is what makes `HAMT.diff` proportional to the changes.
+#
+# A node's array alternates key and value. A `CHILD` key marks a slot that
+# holds a subtree instead. Keys whose 64-bit hashes are equal end up in a
+# `Collision` node once every hash bit is used.
+#
+# `PersistentDict` additionally tags the nodes it creates with an owner
+# token, renewed whenever the dict is copied. A node carrying the current
+# token is reachable from no other version, so it is updated in place (as
+# Clojure's transients do) instead of being copied again on every write.
+
+BITS = 5
+MASK = (1 << BITS) - 1
+HASH_BITS = 64
+HASH_MASK = (1 << HASH_BITS) - 1
+
+CHILD = object()
+MISSING = object()
+
+
+class Bitmap:
+    __slots__ = ("bitmap", "array", "owner")
+
+    def __init__(self, bitmap: int, array: list, owner: Optional[object] = None):
+        self.bitmap = bitmap
+        self.array = array
+        self.owner = owner
+
+
+class Collision:
+    __slots__ = ("array",)
+
+    def __init__(self, array: list):
+        self.array = array
+
+
+def key_hash(key: Hashable) -> int:
+    return hash(key) & HASH_MASK
+
+
+def slot(bitmap: int, bit: int) -> int:
+    return 2 * (bitmap & (bit - 1)).bit_count()
+
+
+# --- Node operations ---
+def lookup(node, shift: int, hashed: int, key: Hashable, default: Any) -> Any:
+    while type(node) is Bitmap:
+        bitmap = node.bitmap
+        bit = 1 << (hashed >> shift & MASK)
+        if not bitmap & bit:
+            return default
+        index = 2 * (bitmap & (bit - 1)).bit_count()
+        found = node.array[index]
+        if found is CHILD:
+            node = node.array[index + 1]
+            shift += BITS
+            continue
+        return node.array[index + 1] if found == key else default
+    array = node.array
+    for index in range(0, len(array), 2):
+        if array[index] == key:
+            return array[index + 1]
+    return default
+
+
+def pair(shift: int, first: tuple, second: tuple, owner: Optional[object] = None):
+    """A subtree holding two entries `(hash, key, value)` with distinct keys."""
+    if shift >= HASH_BITS:
+        return Collision([first[1], first[2], second[1], second[2]])
+    first_bits = first[0] >> shift & MASK
+    second_bits = second[0] >> shift & MASK
+    if first_bits == second_bits:
+        child = pair(shift + BITS, first, second, owner)
+        return Bitmap(1 << first_bits, [CHILD, child], owner)
+    if first_bits > second_bits:
+        first, second = second, first
+    return Bitmap(
+        1 << first_bits | 1 << second_bits,
+        [first[1], first[2], second[1], second[2]],
+        owner,
+    )
+
+
+def assoc(
+    root: Bitmap,
+    hashed: int,
+    key: Hashable,
+    value: Any,
+    owner: Optional[object] = None,
+) -> Tuple[Bitmap, bool]:
+    """`root` with `key` set to `value`, and whether the key is new."""
+    path: List[Tuple[Bitmap, int]] = []
+    node, shift = root, 0
+    while True:
+        array = node.array
+        if type(node) is Collision:
+            for index in range(0, len(array), 2):
+                if array[index] == key:
+                    if array[index + 1] is value:
+                        return root, False
+                    array = array[:]
+                    array[index + 1] = value
+                    replaced, added = Collision(array), False
+                    break
+            else:
+                replaced, added = Collision(array + [key, value]), True
+            break
+        bitmap = node.bitmap
+        bit = 1 << (hashed >> shift & MASK)
+        index = 2 * (bitmap & (bit - 1)).bit_count()
+        owned = owner is not None and node.owner is owner
+        if not bitmap & bit:
+            if owned:
+                array[index:index] = (key, value)
+                node.bitmap = bitmap | bit
+                return root, True
+            array = [*array[:index], key, value, *array[index:]]
+            replaced, added = Bitmap(bitmap | bit, array, owner), True
+            break
+        found = array[index]
+        if found is CHILD:
+            path.append((node, index))
+            node, shift = array[index + 1], shift + BITS
+            continue
+        if found == key and array[index + 1] is value:
+            return root, False
+        if not owned:
+            array = array[:]
+        if found == key:
+            array[index + 1] = value
+            added = False
+        else:
+            array[index + 1] = pair(
+                shift + BITS,
+                (key_hash(found), found, array[index + 1]),
+                (hashed, key, value),
+                owner,
+            )
+            array[index] = CHILD
+            added = True
+        if owned:
+            return root, added
+        replaced = Bitmap(bitmap, array, owner)
+        break
+    # Copy the path back up to the first node this owner may update in place,
+    # sharing every other subtree.
+    for parent, index in reversed(path):
+        if owner is not None and parent.owner is owner:
+            parent.array[index + 1] = replaced
+            return root, added
+        array = parent.array[:]
+        array[index + 1] = replaced
+        replaced = Bitmap(parent.bitmap, array, owner)
+    return replaced, added
+
+
+def dissoc(
+    node, shift: int, hashed: int, key: Hashable, owner: Optional[object] = None
+) -> Tuple[Any, bool]:
+    """`node` without `key` (None once empty), and whether it was present."""
+    array = node.array
+    if type(node) is Collision:
+        for index in range(0, len(array), 2):
+            if array[index] == key:
+                array = array[:index] + array[index + 2 :]
+                return (Collision(array) if array else None), True
+        return node, False
+    bit = 1 << (hashed >> shift & MASK)
+    if not node.bitmap & bit:
+        return node, False
+    index = slot(node.bitmap, bit)
+    found = array[index]
+    if found is CHILD:
+        child, removed = dissoc(array[index + 1], shift + BITS, hashed, key, owner)
+        if not removed:
+            return node, False
+        if child is not None:
+            array = array[:]
+            if len(child.array) == 2 and child.array[0] is not CHILD:
+                # Pull a lone entry up so equal maps keep similar shapes.
+                array[index], array[index + 1] = child.array
+            else:
+                array[index + 1] = child
+            return Bitmap(node.bitmap, array, owner), True
+    elif found != key:
+        return node, False
+    if node.bitmap == bit:
+        return None, True
+    array = array[:index] + array[index + 2 :]
+    return Bitmap(node.bitmap ^ bit, array, owner), True
+
+
+def entries(node) -> Iterator[Tuple[Any, Any]]:
+    stack = [node]
+    while stack:
+        array = stack.pop().array
+        for index in range(0, len(array), 2):
+            if array[index] is CHILD:
+                stack.append(array[index + 1])
+            else:
+                yield array[index], array[index + 1]
+
+
+def changes(old, new) -> Iterator[Tuple[Any, Any, Any]]:
+    """`(key, old value, new value)` for every difference between two subtrees."""
+    if old is new:
+        return
+    if type(old) is Bitmap and type(new) is Bitmap:
+        old_array, new_array = old.array, new.array
+        occupied = old.bitmap | new.bitmap
+        while occupied:
+            bit = occupied & -occupied
+            occupied ^= bit
+            if old.bitmap & new.bitmap & bit:
+                i = 2 * (old.bitmap & (bit - 1)).bit_count()
+                j = 2 * (new.bitmap & (bit - 1)).bit_count()
+                if old_array[i + 1] is new_array[j + 1] and (
+                    old_array[i] is new_array[j]
+                ):
+                    # Shared subtree or untouched entry.
+                    continue
+            yield from slot_changes(slot_at(old, bit), slot_at(new, bit))
+        return
+    yield from dict_changes(dict(entries(old)), dict(entries(new)))
+
+
+def slot_at(node: Bitmap, bit: int) -> Optional[tuple]:
+    if not node.bitmap & bit:
+        return None
+    index = slot(node.bitmap, bit)
+    return node.array[index], node.array[index + 1]
+
+
+def slot_changes(
+    old: Optional[tuple], new: Optional[tuple]
+) -> Iterator[Tuple[Any, Any, Any]]:
+    if old is not None and new is not None:
+        if old[0] is CHILD and new[0] is CHILD:
+            yield from changes(old[1], new[1])
+            return
+        if old[0] is not CHILD and new[0] is not CHILD and old[0] == new[0]:
+            if old[1] is not new[1] and old[1] != new[1]:
+                yield old[0], old[1], new[1]
+            return
+    yield from dict_changes(slot_entries(old), slot_entries(new))
+
+
+def slot_entries(found: Optional[tuple]) -> dict:
+    if found is None:
+        return {}
+    if found[0] is CHILD:
+        return dict(entries(found[1]))
+    return {found[0]: found[1]}
+
+
+def dict_changes(old: dict, new: dict) -> Iterator[Tuple[Any, Any, Any]]:
+    for key, value in old.items():
+        other = new.get(key, MISSING)
+        if other is MISSING:
+            yield key, value, None
+        elif other is not value and other != value:
+            yield key, value, other
+    for key, value in new.items():
+        if key not in old:
+            yield key, None, value
+
+
+EMPTY_NODE = Bitmap(0, [])
+
+
+# --- Public maps ---
+class HAMT(Mapping):
+    """
+    Immutable map with structural sharing: `set` and `delete` return a new
+    map in O(log n) and leave this one untouched.
+    """
+
+    __slots__ = ("root", "count")
+
+    def __init__(self, root: Bitmap = EMPTY_NODE, count: int = 0):
+        self.root = root
+        self.count = count
+
+    @classmethod
+    def from_items(cls, items: Iterable[Tuple[Hashable, Any]]) -> "HAMT":
+        built = EMPTY_HAMT
+        for key, value in items:
+            built = built.set(key, value)
+        return built
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = lookup(self.root, 0, key_hash(key), key, MISSING)
+        if value is MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        return lookup(self.root, 0, key_hash(key), key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return lookup(self.root, 0, key_hash(key), key, MISSING) is not MISSING
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator:
+        return (key for key, _ in entries(self.root))
+
+    def keys(self) -> KeysView:
+        return HAMTKeys(self)
+
+    def values(self) -> ValuesView:
+        return HAMTValues(self)
+
+    def items(self) -> ItemsView:
+        return HAMTItems(self)
+
+    def set(self, key: Hashable, value: Any) -> "HAMT":
+        root, added = assoc(self.root, key_hash(key), key, value)
+        if root is self.root:
+            return self
+        return HAMT(root, self.count + added)
+
+    def delete(self, key: Hashable) -> "HAMT":
+        root, removed = dissoc(self.root, 0, key_hash(key), key)
+        if not removed:
+            return self
+        return HAMT(root if root is not None else EMPTY_NODE, self.count - 1)
+
+    def diff(self, other: "HAMT") -> Iterator[Tuple[Any, Any, Any]]:
+        """
+        `(key, value here, value in other)` for every key that differs, with
+        None for a missing side. Subtrees shared between the two versions
+        are skipped, so the cost follows the number of changes.
+        """
+        return changes(self.root, other.root)
+
+
+# Views read `root` at iteration time, so on a `PersistentDict` they stay
+# live like dict views.
+class HAMTKeys(KeysView):
+    def __iter__(self) -> Iterator:
+        return (key for key, _ in entries(self._mapping.root))
+
+
+class HAMTValues(ValuesView):
+    def __iter__(self) -> Iterator:
+        return (value for _, value in entries(self._mapping.root))
+
+
+class HAMTItems(ItemsView):
+    def __iter__(self) -> Iterator:
+        return entries(self._mapping.root)
+
+
+EMPTY_HAMT = HAMT()
+
+
+class PersistentDict(MutableMapping):
+    """
+    Mutable handle on a `HAMT`: `copy()` is O(1) because the two handles
+    share every node until one writes. Writes may update nodes created
+    since the last copy in place, so `map` is only a stable version once
+    the dict has been copied.
+    """
+
+    __slots__ = ("map", "owner")
+
+    def __init__(self, initial: HAMT = EMPTY_HAMT):
+        self.map = initial
+        self.owner = object()
+
+    @property
+    def root(self) -> Bitmap:
+        return self.map.root
+
+    def __getitem__(self, key: Hashable) -> Any:
+        return self.map[key]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        return self.map.get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.map
+
+    def __len__(self) -> int:
+        return self.map.count
+
+    def __iter__(self) -> Iterator:
+        return iter(self.map)
+
+    def keys(self) -> KeysView:
+        return HAMTKeys(self)
+
+    def values(self) -> ValuesView:
+        return HAMTValues(self)
+
+    def items(self) -> ItemsView:
+        return HAMTItems(self)
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        current = self.map
+        root, added = assoc(current.root, key_hash(key), key, value, self.owner)
+        if root is not current.root or added:
+            self.map = HAMT(root, current.count + added)
+
+    def __delitem__(self, key: Hashable) -> None:
+        if self.pop(key, MISSING) is MISSING:
+            raise KeyError(key)
+
+    def pop(self, key: Hashable, default: Any = MISSING) -> Any:
+        current = self.map
+        value = current.get(key, MISSING)
+        if value is MISSING:
+            if default is MISSING:
+                raise KeyError(key)
+            return default
+        root, _ = dissoc(current.root, 0, key_hash(key), key, self.owner)
+        self.map = HAMT(root if root is not None else EMPTY_NODE, current.count - 1)
+        return value
+
+    def copy(self) -> "PersistentDict":
+        # Neither handle may update the nodes they now share in place.
+        self.owner = object()
+        return PersistentDict(self.map)
@@ -1,28 +1,282 @@
-from typing import Type, TypeVar, Optional, List
-from uuid import UUID
+import gc
+from contextlib import contextmanager
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    Literal,
+    Mapping,
+    Type,
+    TypeVar,
+    Optional,
+    List,
+    Set,
+    Tuple,
+    Union,
+)
+from uuid import UUID, uuid5, NAMESPACE_OID
+from hgraph.core.closure import TransitiveClosure
+from hgraph.core.transaction import Kind, Transaction
 from hgraph.core.node import Node
 from hgraph.core.edge import Edge, Hyperedge
-from hgraph.core.validator import ConstraintValidator
+from hgraph.core.index import Bucket, EdgeLookup, HyperedgeLookup
+from hgraph.core.registry import SchemaRegistry
+from hgraph.core.store import GraphStore, InMemoryStore
+from hgraph.core.validator import (
+    BatchConstraintViolation,
+    ConstraintValidator,
+    ConstraintViolation,
+)
+
+if TYPE_CHECKING:
+    from hgraph.core.consistency import ConsistencyReport
+    from hgraph.core.duckdb_analytics import DuckDBAnalytics
+    from hgraph.core.merge import Conflict, Strategy
+    from hgraph.core.persistent_store import GraphDiff
+    from hgraph.core.query import QueryPattern
+    from hgraph.core.traversal import Path
 
 TNode = TypeVar("TNode", bound=Node)
 TEdge = TypeVar("TEdge", bound=Edge)
 THyperedge = TypeVar("THyperedge", bound=Hyperedge)
 
+Direction = Literal["out", "in", "both"]
+
+# How edges implied by `EdgeConfig.inverse` and `symmetric` are handled:
+# "none" ignores them, "virtual" answers queries by reading stored edges
+# backwards, "materialize" stores an inverse edge next to every edge.
+InverseMode = Literal["none", "virtual", "materialize"]
+
+
+def inverse_id(edge_id: UUID, edge_type: str, inverse_type: str) -> UUID:
+    """
+    Id of the inverse of `edge_id` as an `inverse_type` edge. The mask
+    depends only on the pair of types, so applying it twice gives the
+    original id back and either edge of a pair can find the other.
+    """
+    pair = "|".join(sorted((edge_type, inverse_type)))
+    return UUID(int=edge_id.int ^ uuid5(NAMESPACE_OID, pair).int)
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """
+    Hold off cyclic garbage collection while a batch builds its index
+    buckets. The buckets form no cycles, but allocating hundreds of
+    thousands of them triggers collections that walk every stored record.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class VirtualEdgeIndex:
+    """
+    `EdgeLookup` over the stored edges plus the ones `inverses="virtual"`
+    implies, so that validation sees both. An implied edge is bucketed
+    under its `inverse_id`.
+    """
+
+    def __init__(self, index: EdgeLookup, edges: Mapping[UUID, Edge]):
+        self.index = index
+        self.edges = edges
+        # Id of the stored edge the write under validation replaces. An
+        # update may turn an edge into its own former inverse, so neither
+        # the edge nor anything it implies counts against the new version.
+        self.replaced: Optional[int] = None
+
+    def from_source(self, edge_type: str, source: UUID) -> Bucket:
+        return self._merged(
+            edge_type,
+            self.index.from_source(edge_type, source),
+            lambda stored_type: self.index.to_target(stored_type, source),
+        )
+
+    def to_target(self, edge_type: str, target: UUID) -> Bucket:
+        return self._merged(
+            edge_type,
+            self.index.to_target(edge_type, target),
+            lambda stored_type: self.index.from_source(stored_type, target),
+        )
+
+    def between(self, edge_type: str, source: UUID, target: UUID) -> Bucket:
+        return self._merged(
+            edge_type,
+            self.index.between(edge_type, source, target),
+            lambda stored_type: self.index.between(stored_type, target, source),
+        )
+
+    def of_type(self, edge_type: str) -> Bucket:
+        return self._merged(
+            edge_type,
+            self.index.of_type(edge_type),
+            self.index.of_type,
+        )
+
+    def outgoing(self, node: UUID, edge_type: Optional[str] = None) -> Bucket:
+        if edge_type is not None:
+            return self.from_source(edge_type, node)
+        bucket = dict(self.index.outgoing(node))
+        bucket.pop(self.replaced, None)
+        for edge_id in self.index.incoming(node).values():
+            bucket.update(self._implied(self.edges[edge_id].type, edge_id))
+        return bucket
+
+    def incoming(self, node: UUID, edge_type: Optional[str] = None) -> Bucket:
+        if edge_type is not None:
+            return self.to_target(edge_type, node)
+        bucket = dict(self.index.incoming(node))
+        bucket.pop(self.replaced, None)
+        for edge_id in self.index.outgoing(node).values():
+            bucket.update(self._implied(self.edges[edge_id].type, edge_id))
+        return bucket
+
+    def _merged(self, edge_type: str, stored: Bucket, backwards) -> Bucket:
+        inverse_types = SchemaRegistry.inverse_types(edge_type)
+        if not inverse_types and self.replaced not in stored:
+            return stored
+        bucket = dict(stored)
+        bucket.pop(self.replaced, None)
+        for stored_type in inverse_types:
+            for edge_id in backwards(stored_type).values():
+                bucket.update(self._implied(stored_type, edge_id, edge_type))
+        return bucket
+
+    def _implied(
+        self, stored_type: str, edge_id: UUID, edge_type: Optional[str] = None
+    ) -> Bucket:
+        """Ids of the edges a stored one implies, of `edge_type` or any type."""
+        bucket: Bucket = {}
+        if edge_id.int == self.replaced:
+            return bucket
+        for inverse_type in SchemaRegistry.inverse_types(stored_type):
+            if edge_type is not None and inverse_type != edge_type:
+                continue
+            if inverse_type == stored_type:
+                # A symmetric self-loop is its own reverse.
+                edge = self.edges[edge_id]
+                if edge.source == edge.target:
+                    continue
+            implied = inverse_id(edge_id, stored_type, inverse_type)
+            bucket[implied.int] = implied
+        return bucket
+
 
 class Hypergraph:
-    nodes: dict[UUID, Node] = {}
-    edges: dict[UUID, Edge] = {}
-    hyperedges: dict[UUID, Hyperedge] = {}
+    def __init__(
+        self,
+        store: Optional[GraphStore] = None,
+        inverses: InverseMode = "none",
+        integrity: bool = False,
+    ):
+        self.store: GraphStore = store if store is not None else InMemoryStore()
+        self.inverses = inverses
+        # Whether edges and hyperedges may only reference stored nodes.
+        self.integrity = integrity
+        # Materialised reachability per edge type; see `infer_transitive_closure`.
+        self.closures: Dict[str, TransitiveClosure] = {}
+        # Undo log of the open `transaction()`, if any.
+        self.transaction_log: Optional[Transaction] = None
+
+    @property
+    def nodes(self) -> Mapping[UUID, Node]:
+        return self.store.nodes
+
+    @property
+    def edges(self) -> Mapping[UUID, Edge]:
+        return self.store.edges
+
+    @property
+    def hyperedges(self) -> Mapping[UUID, Hyperedge]:
+        return self.store.hyperedges
+
+    @property
+    def edge_index(self) -> EdgeLookup:
+        return self.store.edge_index
+
+    @property
+    def hyperedge_index(self) -> HyperedgeLookup:
+        return self.store.hyperedge_index
 
     # --- Nodes ---
     def add_node(self, node: Node) -> None:
-        self.nodes[node.id] = node
+        self._log("nodes", node.id)
+        self.store.put_node(node)
+
+    def add_nodes(self, nodes: Iterable[Node]) -> None:
+        # Drain the iterable first so a failing generator commits nothing.
+        batch = list(nodes)
+        if self.transaction_log is not None:
+            for node in batch:
+                self._log("nodes", node.id)
+        self.store.put_nodes(batch)
 
     def update_node(self, node_id: UUID, updated: Node) -> None:
-        self.nodes[node_id] = updated
+        self._log("nodes", node_id)
+        self.store.put_node(updated.model_copy(update={"id": node_id}))
+
+    def delete_node(self, node_id: UUID, cascade: bool = False) -> "GraphDiff":
+        """
+        Remove a node. With `cascade`, also delete the edges incident to it
+        and drop it from the hyperedges it belongs to; see `delete_nodes`.
+        """
+        return self.delete_nodes([node_id], cascade)
 
-    def delete_node(self, node_id: UUID) -> None:
-        self.nodes.pop(node_id, None)
+    def delete_nodes(
+        self, node_ids: Iterable[UUID], cascade: bool = False
+    ) -> "GraphDiff":
+        """
+        Remove a batch of nodes, all or nothing, and return the ids of every
+        record removed or changed. By default only the nodes go and their
+        edges are left dangling, as before.
+
+        With `cascade`, incident records are found through the adjacency
+        indexes, so the cost follows the nodes' degree rather than the size
+        of the graph: edges touching a deleted node are deleted (reported in
+        `edges.removed`), and hyperedges lose it from their sources and
+        targets (`hyperedges.changed`). A hyperedge left with an empty side
+        is deleted (`hyperedges.removed`); one that would violate its config
+        once shrunk raises `ConstraintViolation` and nothing is deleted.
+        """
+        from hgraph.core.persistent_store import GraphDiff
+
+        deleted = set(node_ids)
+        result = GraphDiff()
+        with self.transaction():
+            for node_id in deleted:
+                self._log("nodes", node_id)
+                if self.store.pop_node(node_id) is not None:
+                    result.nodes.removed.append(node_id)
+            if not cascade:
+                return result
+            index = self.edge_index
+            edge_ids = {
+                edge_id
+                for node_id in deleted
+                for bucket in (index.outgoing(node_id), index.incoming(node_id))
+                for edge_id in bucket.values()
+            }
+            for edge_id in edge_ids:
+                if self._pop_edge(edge_id) is not None:
+                    result.edges.removed.append(edge_id)
+            containing = self.hyperedge_index.containing
+            hyperedge_ids = {
+                edge_id
+                for node_id in deleted
+                for edge_id in containing(node_id).values()
+            }
+            for edge_id in hyperedge_ids:
+                if self._shrink_hyperedge(self.hyperedges[edge_id], deleted):
+                    result.hyperedges.changed.append(edge_id)
+                else:
+                    result.hyperedges.removed.append(edge_id)
+        return result
 
     def get_node(self, node_id: UUID) -> Optional[Node]:
         return self.nodes.get(node_id)
@@ -30,20 +284,80 @@ class Hypergraph:
     def list_nodes(self) -> List[Node]:
         return list(self.nodes.values())
 
+    def iter_nodes(self) -> Iterator[Node]:
+        return iter(self.nodes.values())
+
     # --- Edges ---
     def add_edge(self, edge: Edge) -> None:
-        validator = ConstraintValidator(self.edges, self.hyperedges)
-        validator.validate_edge(edge)
-        self.edges[edge.id] = edge
+        if self.inverses == "materialize":
+            # The edge and its inverses are committed together or not at all.
+            self.add_edges([edge])
+            return
+        self._validate_edge(edge)
+        self._put_edge(edge)
+
+    def add_edges(self, edges: Iterable[Edge], fail_fast: bool = True) -> None:
+        """
+        Validate a batch of edges against the graph and against each other,
+        then commit all of them or none.
+
+        With `fail_fast=False` every violation is collected and raised
+        together as a `BatchConstraintViolation`.
+        """
+        edges = list(edges)
+        validator = self._validator()
+        if self.integrity:
+            validator = self._prefetched_validator(
+                node for edge in edges for node in (edge.source, edge.target)
+            )
+        if self.inverses == "materialize":
+            edges = [
+                item for edge in edges for item in (edge, *self._inverse_edges(edge))
+            ]
+        if self.inverses != "virtual" and self._new_records(edges, self.edges):
+            # New edges are checked in one set-based pass and stored as one
+            # batch; nothing is written unless all of them pass.
+            with _gc_paused():
+                violations = validator.validate_edges(edges, fail_fast)
+                if violations:
+                    raise BatchConstraintViolation(violations)
+                self._put_edges(edges)
+            return
+        # Replacements and virtual inverses change what the edges after
+        # them are checked against, so each is stored as it is accepted.
+        validate = validator.validate_edge
+        if self.inverses == "virtual":
+            validate = partial(self._validate_implying, validator)
+        self._insert_batch(
+            edges,
+            validate,
+            self.edges,
+            self._put_edge,
+            self._pop_edge,
+            fail_fast,
+        )
 
     def update_edge(self, edge_id: UUID, updated: Edge) -> None:
         updated = updated.model_copy(update={"id": edge_id})
-        validator = ConstraintValidator(self.edges, self.hyperedges)
-        validator.validate_edge(updated)
-        self.edges[edge_id] = updated
+        if self.inverses == "materialize":
+            # Inverses of the same type keep their ids and are replaced;
+            # ones whose type no longer applies are dropped afterwards.
+            previous = self.edges.get(edge_id)
+            self.add_edges([updated])
+            if previous is not None:
+                kept = set(SchemaRegistry.inverse_types(updated.type))
+                for inverse_type in SchemaRegistry.inverse_types(previous.type):
+                    if inverse_type not in kept:
+                        self._pop_edge(inverse_id(edge_id, previous.type, inverse_type))
+            return
+        self._validate_edge(updated)
+        self._put_edge(updated)
 
     def delete_edge(self, edge_id: UUID) -> None:
-        self.edges.pop(edge_id, None)
+        edge = self._pop_edge(edge_id)
+        if edge is not None and self.inverses == "materialize":
+            for inverse_type in SchemaRegistry.inverse_types(edge.type):
+                self._pop_edge(inverse_id(edge_id, edge.type, inverse_type))
 
     def get_edge(self, edge_id: UUID) -> Optional[Edge]:
         return self.edges.get(edge_id)
@@ -51,23 +365,672 @@ class Hypergraph:
     def list_edges(self) -> List[Edge]:
         return list(self.edges.values())
 
+    def iter_edges(self) -> Iterator[Edge]:
+        return iter(self.edges.values())
+
     # --- Hyperedges ---
     def add_hyperedge(self, hyperedge: Hyperedge) -> None:
-        validator = ConstraintValidator(self.edges, self.hyperedges)
-        validator.validate_hyperedge(hyperedge)
-        self.hyperedges[hyperedge.id] = hyperedge
+        self._validate_hyperedge(hyperedge)
+        self._put_hyperedge(hyperedge)
+
+    def add_hyperedges(
+        self, hyperedges: Iterable[Hyperedge], fail_fast: bool = True
+    ) -> None:
+        """Hyperedge counterpart of `add_edges`."""
+        validator = self._validator()
+        if self.integrity:
+            hyperedges = list(hyperedges)
+            validator = self._prefetched_validator(
+                node
+                for hyperedge in hyperedges
+                for node in (*hyperedge.sources, *hyperedge.targets)
+            )
+        self._insert_batch(
+            hyperedges,
+            validator.validate_hyperedge,
+            self.hyperedges,
+            self._put_hyperedge,
+            self.delete_hyperedge,
+            fail_fast,
+        )
 
     def update_hyperedge(self, edge_id: UUID, updated: Hyperedge) -> None:
         updated = updated.model_copy(update={"id": edge_id})
-        validator = ConstraintValidator(self.edges, self.hyperedges)
-        validator.validate_hyperedge(updated)
-        self.hyperedges[edge_id] = updated
+        self._validate_hyperedge(updated)
+        self._put_hyperedge(updated)
 
     def delete_hyperedge(self, edge_id: UUID) -> None:
-        self.hyperedges.pop(edge_id, None)
+        self._log("hyperedges", edge_id)
+        hyperedge = self.store.pop_hyperedge(edge_id)
+        if hyperedge is not None and self._maintains():
+            self._unlink(hyperedge)
 
     def get_hyperedge(self, edge_id: UUID) -> Optional[Hyperedge]:
         return self.hyperedges.get(edge_id)
 
     def list_hyperedges(self) -> List[Hyperedge]:
         return list(self.hyperedges.values())
+
+    def iter_hyperedges(self) -> Iterator[Hyperedge]:
+        return iter(self.hyperedges.values())
+
+    # --- Transactions ---
+    @contextmanager
+    def transaction(self) -> Iterator[Transaction]:
+        """
+        Group writes so that they apply together or not at all: if the block
+        raises (e.g. a `ConstraintViolation`), every write made inside it is
+        undone from the undo log and the exception propagates. A nested block
+        rolls back only its own writes. See `hgraph.core.transaction`.
+        """
+        outer = self.transaction_log
+        log = outer if outer is not None else Transaction(self)
+        savepoint = len(log)
+        self.transaction_log = log
+        try:
+            yield log
+        except BaseException:
+            log.rollback(savepoint)
+            raise
+        finally:
+            self.transaction_log = outer
+        if outer is None:
+            log.commit()
+
+    # --- Branching ---
+    def snapshot(self) -> "Hypergraph":
+        """
+        A read-only view of the graph as it is now, in O(1); later writes to
+        this graph do not show in it. Needs a `PersistentStore`.
+        """
+        from hgraph.core.persistent_store import persistent_store
+
+        store = persistent_store(self).fork(frozen=True)
+        return Hypergraph(store, self.inverses, self.integrity)
+
+    def branch(self) -> "Hypergraph":
+        """
+        A writable copy in O(1) that shares all unchanged records and index
+        entries with this graph. Closures are not carried over; the branch
+        rebuilds them on first use. Needs a `PersistentStore`.
+        """
+        from hgraph.core.persistent_store import persistent_store
+
+        return Hypergraph(persistent_store(self).fork(), self.inverses, self.integrity)
+
+    def diff(self, other: "Hypergraph") -> "GraphDiff":
+        """Ids added, removed and changed going from this graph to `other`."""
+        from hgraph.core.persistent_store import diff
+
+        return diff(self, other)
+
+    def merge(
+        self, base: "Hypergraph", theirs: "Hypergraph", strategy: "Strategy" = "fail"
+    ) -> Tuple["Hypergraph", List["Conflict"]]:
+        """
+        Three-way merge of `theirs` into a new branch of this graph, both
+        forked from `base`. See `hgraph.core.merge.merge`.
+        """
+        from hgraph.core.merge import merge
+
+        return merge(base, self, theirs, strategy)
+
+    # --- Queries ---
+    def get_neighbors(
+        self,
+        node_id: UUID,
+        direction: Direction = "out",
+        type: Optional[str] = None,
+    ) -> List[Node]:
+        """
+        Nodes one edge away from `node_id`, optionally only across edges of
+        the given type. Neighbors that are not stored as nodes are skipped.
+        """
+        neighbor_ids: dict[UUID, None] = {}
+        if direction in ("out", "both"):
+            for edge_id in self.edge_index.outgoing(node_id, type).values():
+                neighbor_ids[self.edges[edge_id].target] = None
+            if self.inverses == "virtual":
+                for edge in self._virtual_edges(node_id, None, type):
+                    neighbor_ids[edge.target] = None
+        if direction in ("in", "both"):
+            for edge_id in self.edge_index.incoming(node_id, type).values():
+                neighbor_ids[self.edges[edge_id].source] = None
+            if self.inverses == "virtual":
+                for edge in self._virtual_edges(None, node_id, type):
+                    neighbor_ids[edge.source] = None
+        return [
+            self.nodes[neighbor_id]
+            for neighbor_id in neighbor_ids
+            if neighbor_id in self.nodes
+        ]
+
+    def find_edges(
+        self,
+        source: Optional[UUID] = None,
+        target: Optional[UUID] = None,
+        type: Optional[str] = None,
+    ) -> List[Edge]:
+        """
+        Edges matching every given filter. With `inverses="virtual"` the
+        result also holds the inverse and symmetric edges implied by the
+        stored ones; see `_virtual_edges`.
+        """
+        edges = self._stored_edges(source, target, type)
+        if self.inverses == "virtual":
+            edges.extend(self._virtual_edges(source, target, type))
+        return edges
+
+    def _stored_edges(
+        self,
+        source: Optional[UUID],
+        target: Optional[UUID],
+        type: Optional[str],
+    ) -> List[Edge]:
+        index = self.edge_index
+        if source is not None and target is not None:
+            if type is not None:
+                edge_ids = index.between(type, source, target).values()
+            else:
+                # Walk whichever endpoint has the smaller degree.
+                outgoing = index.outgoing(source)
+                incoming = index.incoming(target)
+                if len(outgoing) <= len(incoming):
+                    edge_ids = [
+                        edge_id
+                        for edge_id in outgoing.values()
+                        if self.edges[edge_id].target == target
+                    ]
+                else:
+                    edge_ids = [
+                        edge_id
+                        for edge_id in incoming.values()
+                        if self.edges[edge_id].source == source
+                    ]
+        elif source is not None:
+            edge_ids = index.outgoing(source, type).values()
+        elif target is not None:
+            edge_ids = index.incoming(target, type).values()
+        elif type is not None:
+            edge_ids = index.of_type(type).values()
+        else:
+            return self.list_edges()
+        return [self.edges[edge_id] for edge_id in edge_ids]
+
+    def find_hyperedges(
+        self, containing: Optional[UUID] = None, type: Optional[str] = None
+    ) -> List[Hyperedge]:
+        index = self.hyperedge_index
+        if containing is not None:
+            edge_ids = index.containing(containing, type).values()
+        elif type is not None:
+            edge_ids = index.of_type(type).values()
+        else:
+            return self.list_hyperedges()
+        return [self.hyperedges[edge_id] for edge_id in edge_ids]
+
+    def out_degree(self, node_id: UUID, type: Optional[str] = None) -> int:
+        degree = len(self.edge_index.outgoing(node_id, type))
+        if self.inverses == "virtual":
+            degree += len(self._virtual_edges(node_id, None, type))
+        return degree
+
+    def in_degree(self, node_id: UUID, type: Optional[str] = None) -> int:
+        degree = len(self.edge_index.incoming(node_id, type))
+        if self.inverses == "virtual":
+            degree += len(self._virtual_edges(None, node_id, type))
+        return degree
+
+    def degree(self, node_id: UUID, type: Optional[str] = None) -> int:
+        return self.out_degree(node_id, type) + self.in_degree(node_id, type)
+
+    def hyperedge_degree(self, node_id: UUID, type: Optional[str] = None) -> int:
+        return len(self.hyperedge_index.containing(node_id, type))
+
+    def match(
+        self, pattern: Union["QueryPattern", str], limit: Optional[int] = None
+    ) -> List[Dict[str, UUID]]:
+        """
+        Bindings of every variable in `pattern` (a `QueryPattern` or its
+        `Type(args), ...` text form), stopping after `limit` matches if
+        given; see `hgraph.core.query`.
+        """
+        from hgraph.core.query import match
+
+        return match(self, pattern, limit)
+
+    def find_path(
+        self,
+        start: UUID,
+        end: UUID,
+        max_depth: int = 6,
+        type: Optional[str] = None,
+        direction: Direction = "out",
+        hyperedges: bool = False,
+    ) -> Optional["Path"]:
+        """
+        A shortest path from `start` to `end` of at most `max_depth` hops, or
+        None. With `hyperedges`, a hyperedge is one hop from each of its
+        sources to each of its targets; see `hgraph.core.traversal`.
+        """
+        from hgraph.core.traversal import Traversal
+
+        traversal = Traversal(self, type, direction, hyperedges)
+        return traversal.find_path(start, end, max_depth)
+
+    def all_paths(
+        self,
+        start: UUID,
+        end: UUID,
+        max_depth: int = 6,
+        limit: Optional[int] = 100,
+        type: Optional[str] = None,
+        direction: Direction = "out",
+        hyperedges: bool = False,
+    ) -> List["Path"]:
+        """Up to `limit` simple paths from `start` to `end`, shortest first."""
+        from hgraph.core.traversal import Traversal
+
+        traversal = Traversal(self, type, direction, hyperedges)
+        return traversal.all_paths(start, end, max_depth, limit)
+
+    def k_hop_neighborhood(
+        self,
+        node_id: UUID,
+        k: int,
+        type: Optional[str] = None,
+        direction: Direction = "out",
+        hyperedges: bool = False,
+    ) -> Dict[UUID, int]:
+        """Hop count to every node within `k` hops of `node_id` (itself at 0)."""
+        from hgraph.core.traversal import Traversal
+
+        traversal = Traversal(self, type, direction, hyperedges)
+        return dict(traversal.distances(node_id, k).values())
+
+    # --- Consistency ---
+    def check_consistency(
+        self,
+        processes: Optional[int] = None,
+        shard_size: int = 1_000_000,
+        integrity: Optional[bool] = None,
+    ) -> "ConsistencyReport":
+        """
+        Audit every stored edge and hyperedge against its config, custom
+        rules and endpoint constraints, in parallel; see
+        `hgraph.core.consistency`.
+        """
+        from hgraph.core.consistency import check_consistency
+
+        return check_consistency(self, processes, shard_size, integrity)
+
+    # --- Transitive closure ---
+    def infer_transitive_closure(
+        self, type: Optional[str] = None
+    ) -> Dict[str, TransitiveClosure]:
+        """
+        Materialise reachability for `type`, or for every registered edge
+        and hyperedge type whose config is `transitive`. A hyperedge links
+        each of its sources to each of its targets. Once built, closures are
+        updated on every write through this graph instead of recomputed.
+        """
+        if type is not None:
+            types = [type]
+        else:
+            types = [
+                name
+                for registry in (
+                    SchemaRegistry.edge_types,
+                    SchemaRegistry.hyperedge_types,
+                )
+                for name, model in registry.items()
+                if model.config.transitive
+            ]
+        for name in types:
+            self.closures[name] = TransitiveClosure.from_links(self._links(name))
+        return {name: self.closures[name] for name in types}
+
+    def is_reachable(self, source: UUID, target: UUID, type: str) -> bool:
+        """Whether a chain of `type` edges leads from `source` to `target`."""
+        return self._closure(type).is_reachable(source, target)
+
+    def descendants(self, node_id: UUID, type: str) -> List[UUID]:
+        """Nodes reachable from `node_id` along `type` edges."""
+        return self._closure(type).descendants_of(node_id)
+
+    def ancestors(self, node_id: UUID, type: str) -> List[UUID]:
+        """Nodes from which `node_id` is reachable along `type` edges."""
+        return self._closure(type).ancestors_of(node_id)
+
+    # --- Persistence ---
+    def save_to_json(self, path: str, compression: Optional[str] = None) -> None:
+        """Stream the graph to a JSON Lines file; see `hgraph.core.jsonl`."""
+        from hgraph.core.jsonl import save_to_json
+
+        save_to_json(self, path, compression)
+
+    @classmethod
+    def load_from_json(
+        cls,
+        path: str,
+        store: Optional[GraphStore] = None,
+        trusted: bool = False,
+        compression: Optional[str] = None,
+    ) -> "Hypergraph":
+        """Stream a JSON Lines snapshot into a new graph."""
+        from hgraph.core.jsonl import load_from_json
+
+        return load_from_json(path, store, trusted, compression)
+
+    def save_to_parquet(self, path: str) -> None:
+        """Write one Parquet file per type; see `hgraph.core.parquet`."""
+        from hgraph.core.parquet import save_to_parquet
+
+        save_to_parquet(self, path)
+
+    @classmethod
+    def load_from_parquet(
+        cls,
+        path: str,
+        store: Optional[GraphStore] = None,
+        trusted: bool = False,
+        types: Optional[Iterable[str]] = None,
+    ) -> "Hypergraph":
+        """Load a Parquet snapshot, optionally only the given types."""
+        from hgraph.core.parquet import load_from_parquet
+
+        return load_from_parquet(path, store, trusted, types)
+
+    def load_records(self, kind: Kind, records: List, trusted: bool = False) -> None:
+        """
+        Commit one chunk of `kind` records read back from a snapshot. With
+        `trusted=True` edges and hyperedges skip constraint validation; use
+        it only for known-valid data. They still update built closures and
+        get their materialised inverses. They are refused inside a
+        transaction.
+        """
+        if trusted and kind != "nodes" and self.transaction_log is not None:
+            raise RuntimeError("Trusted loads cannot run inside a transaction")
+        if kind == "nodes":
+            self.add_nodes(records)
+        elif kind == "edges" and trusted:
+            if self.inverses == "materialize":
+                records = [
+                    item
+                    for edge in records
+                    for item in (edge, *self._inverse_edges(edge))
+                ]
+            for edge in records:
+                self._put_edge(edge)
+        elif kind == "edges":
+            self.add_edges(records)
+        elif trusted:
+            for hyperedge in records:
+                self._put_hyperedge(hyperedge)
+        else:
+            self.add_hyperedges(records)
+
+    def to_duckdb(self, path: str = ":memory:") -> "DuckDBAnalytics":
+        """Mirror the graph into DuckDB for whole-graph analytics."""
+        from hgraph.core.duckdb_analytics import DuckDBAnalytics
+
+        return DuckDBAnalytics.from_graph(self, path)
+
+    # --- Internals ---
+    def _validator(self) -> ConstraintValidator:
+        edge_index = self.edge_index
+        if self.inverses == "virtual":
+            edge_index = VirtualEdgeIndex(edge_index, self.edges)
+        return ConstraintValidator(
+            self.edges,
+            self.hyperedges,
+            edge_index,
+            self.hyperedge_index,
+            self.store.node_types,
+            self.integrity,
+        )
+
+    def _validate_edge(self, edge: Edge) -> None:
+        # Types without constraints skip building a validator altogether.
+        plan = SchemaRegistry.edge_plan(edge)
+        if self.inverses == "virtual" and SchemaRegistry.inverse_types(edge.type):
+            self._validate_implying(self._validator(), edge)
+        elif plan.checks or self.integrity:
+            self._validator().validate_edge(edge, plan)
+
+    def _validate_implying(self, validator: ConstraintValidator, edge: Edge) -> None:
+        # With virtual inverses, an edge also brings in the inverses it
+        # implies, and each must hold against stored and implied edges.
+        index = validator.edge_index
+        index.replaced = edge.id.int
+        try:
+            validator.validate_edge(edge)
+            for inverse in self._inverse_edges(edge):
+                validator.validate_edge(inverse)
+        finally:
+            index.replaced = None
+
+    def _validate_hyperedge(self, hyperedge: Hyperedge) -> None:
+        plan = SchemaRegistry.hyperedge_plan(hyperedge)
+        if plan.checks or self.integrity:
+            self._validator().validate_hyperedge(hyperedge, plan)
+
+    def _prefetched_validator(self, node_ids: Iterable[UUID]) -> ConstraintValidator:
+        # Batches look up every node they reference at once, which for a
+        # disk-backed store is one query per page instead of one per record.
+        # Nodes are not written during an edge batch, so the answer holds.
+        stored = self.store.node_types(set(node_ids))
+        validator = self._validator()
+        validator.node_types = lambda ids: stored
+        return validator
+
+    def _links(self, type: str) -> Iterator[tuple[UUID, UUID]]:
+        for edge_id in self.edge_index.of_type(type).values():
+            edge = self.edges[edge_id]
+            yield edge.source, edge.target
+        if self.inverses == "virtual":
+            for stored_type in SchemaRegistry.inverse_types(type):
+                for edge_id in self.edge_index.of_type(stored_type).values():
+                    edge = self.edges[edge_id]
+                    yield edge.target, edge.source
+        for edge_id in self.hyperedge_index.of_type(type).values():
+            hyperedge = self.hyperedges[edge_id]
+            for source in hyperedge.sources:
+                for target in hyperedge.targets:
+                    yield source, target
+
+    def _closure_links(
+        self, record: Union[Edge, Hyperedge]
+    ) -> List[Tuple[str, Tuple[UUID, UUID]]]:
+        """
+        The `(type, link)` pairs `record` adds to the closures, as `_links`
+        reads them: with virtual inverses an edge also links backwards
+        under each of its inverse types.
+        """
+        if isinstance(record, Hyperedge):
+            return [
+                (record.type, (source, target))
+                for source in record.sources
+                for target in record.targets
+            ]
+        links = [(record.type, (record.source, record.target))]
+        if self.inverses == "virtual":
+            links.extend(
+                (inverse_type, (record.target, record.source))
+                for inverse_type in SchemaRegistry.inverse_types(record.type)
+            )
+        return links
+
+    def _link(self, record: Union[Edge, Hyperedge]) -> None:
+        for type, (source, target) in self._closure_links(record):
+            if type in self.closures:
+                self.closures[type].add_link(source, target)
+
+    def _unlink(self, record: Union[Edge, Hyperedge]) -> None:
+        # Batched per closure, so each recomputes once.
+        removed: Dict[str, List[Tuple[UUID, UUID]]] = {}
+        for type, link in self._closure_links(record):
+            if type in self.closures:
+                removed.setdefault(type, []).append(link)
+        for type, links in removed.items():
+            self.closures[type].remove_links(links)
+
+    def _closure(self, type: str) -> TransitiveClosure:
+        closure = self.closures.get(type)
+        if closure is None:
+            closure = self.infer_transitive_closure(type)[type]
+        return closure
+
+    def _virtual_edges(
+        self,
+        source: Optional[UUID],
+        target: Optional[UUID],
+        type: Optional[str],
+    ) -> List[Edge]:
+        """
+        Edges implied by reading stored edges backwards: a `source -> target`
+        edge of type T for every stored `target -> source` edge whose type
+        is one of `SchemaRegistry.inverse_types(T)`. Nothing is stored.
+        """
+        if type is not None:
+            stored = (
+                edge
+                for stored_type in SchemaRegistry.inverse_types(type)
+                for edge in self._stored_edges(target, source, stored_type)
+            )
+            return [
+                inverse
+                for edge in stored
+                for inverse in self._inverse_edges(edge, [type])
+            ]
+        return [
+            inverse
+            for edge in self._stored_edges(target, source, None)
+            for inverse in self._inverse_edges(edge)
+        ]
+
+    def _inverse_edges(
+        self, edge: Edge, types: Optional[List[str]] = None
+    ) -> List[Edge]:
+        """Inverses of `edge`, optionally only those of the given types."""
+        inverse_types = SchemaRegistry.inverse_types(edge.type)
+        return [
+            self._inverse_edge(edge, inverse_type)
+            for inverse_type in inverse_types
+            if (types is None or inverse_type in types)
+            # A symmetric self-loop is its own reverse.
+            and (edge.source != edge.target or inverse_type != edge.type)
+        ]
+
+    @staticmethod
+    def _inverse_edge(edge: Edge, inverse_type: str) -> Edge:
+        # Unregistered inverse types (e.g. a `HasParent` that is only named
+        # in a config) are represented by the base `Edge`.
+        model = SchemaRegistry.edge_types.get(inverse_type, Edge)
+        data = edge.model_dump(exclude={"id", "type", "source", "target"})
+        return model.model_validate(
+            {
+                **data,
+                "id": inverse_id(edge.id, edge.type, inverse_type),
+                "type": inverse_type,
+                "source": edge.target,
+                "target": edge.source,
+            }
+        )
+
+    def _put_edge(self, edge: Edge) -> None:
+        self._log("edges", edge.id)
+        if self._maintains():
+            previous = self.edges.get(edge.id)
+            if previous is not None:
+                self._unlink(previous)
+            self._link(edge)
+        self.store.put_edge(edge)
+
+    def _put_edges(self, edges: List[Edge]) -> None:
+        # Only for edges whose ids are not stored yet: nothing to unlink.
+        if self.transaction_log is not None:
+            for edge in edges:
+                self._log("edges", edge.id)
+        self.store.put_edges(edges)
+        if self._maintains():
+            for edge in edges:
+                self._link(edge)
+
+    def _pop_edge(self, edge_id: UUID) -> Optional[Edge]:
+        self._log("edges", edge_id)
+        edge = self.store.pop_edge(edge_id)
+        if edge is not None and self._maintains():
+            self._unlink(edge)
+        return edge
+
+    def _put_hyperedge(self, hyperedge: Hyperedge) -> None:
+        self._log("hyperedges", hyperedge.id)
+        if self._maintains():
+            previous = self.hyperedges.get(hyperedge.id)
+            if previous is not None:
+                self._unlink(previous)
+            self._link(hyperedge)
+        self.store.put_hyperedge(hyperedge)
+
+    def _shrink_hyperedge(self, hyperedge: Hyperedge, removed: Set[UUID]) -> bool:
+        """Drop `removed` from the hyperedge; False if it had to be deleted."""
+        sources = [node for node in hyperedge.sources if node not in removed]
+        targets = [node for node in hyperedge.targets if node not in removed]
+        if not (sources and targets):
+            self.delete_hyperedge(hyperedge.id)
+            return False
+        shrunk = hyperedge.model_copy(update={"sources": sources, "targets": targets})
+        self._validate_hyperedge(shrunk)
+        self._put_hyperedge(shrunk)
+        return True
+
+    @staticmethod
+    def _new_records(records: List[Union[Edge, Hyperedge]], stored: Mapping) -> bool:
+        """Whether the ids of `records` are distinct and none is stored."""
+        ids = {record.id.int for record in records}
+        return len(ids) == len(records) and not any(
+            record.id in stored for record in records
+        )
+
+    def _log(self, kind: Kind, record_id: UUID) -> None:
+        if self.transaction_log is not None:
+            records = getattr(self.store, kind)
+            self.transaction_log.record(kind, record_id, records.get(record_id))
+
+    def _maintains(self) -> bool:
+        """Whether writes must update the closures right away."""
+        return bool(self.closures) and self.transaction_log is None
+
+    def _insert_batch(
+        self, items, validate, store: Mapping, put, delete, fail_fast: bool
+    ) -> None:
+        # Each accepted item is inserted right away so later items in the
+        # batch are validated against it through the live indexes. The undo
+        # lists restore the previous state if the batch is rejected; they
+        # are kept as parallel lists so logging allocates no tuples for the
+        # garbage collector to track.
+        undo_ids: List[UUID] = []
+        undo_previous: list = []
+        violations: List[tuple[int, ConstraintViolation]] = []
+        try:
+            for position, item in enumerate(items):
+                try:
+                    validate(item)
+                except ConstraintViolation as violation:
+                    if fail_fast:
+                        raise
+                    violations.append((position, violation))
+                    continue
+                undo_ids.append(item.id)
+                undo_previous.append(store.get(item.id))
+                put(item)
+            if violations:
+                raise BatchConstraintViolation(violations)
+        except BaseException:
+            for item_id, previous in zip(reversed(undo_ids), reversed(undo_previous)):
+                if previous is None:
+                    delete(item_id)
+                else:
+                    put(previous)
+            raise
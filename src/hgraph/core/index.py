@@ -0,0 +1,328 @@
+from __future__ import annotations
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Protocol,
+    Tuple,
+    Union,
+)
+from uuid import UUID
+
+if TYPE_CHECKING:
+    from hgraph.core.edge import Edge, Hyperedge
+
+
+# Buckets map `id.int` to the id itself. Hashing the int is done in C,
+# while `UUID.__hash__` is a Python-level call, which dominates insert cost.
+Bucket = Dict[int, UUID]
+
+EMPTY: Bucket = {}
+
+NodeKey = Union[FrozenSet[int], Tuple[int, ...]]
+
+Role = Literal["source", "target"]
+
+
+def canonical_nodes(nodes: Iterable[UUID], unordered: bool) -> NodeKey:
+    """Hashable form of a hyperedge side: order-free when `unordered`."""
+    ints = (node.int for node in nodes)
+    return frozenset(ints) if unordered else tuple(ints)
+
+
+class EdgeLookup(Protocol):
+    """Read side of an edge index, as used by the validator and queries."""
+
+    def from_source(self, edge_type: str, source: UUID) -> Bucket: ...
+
+    def to_target(self, edge_type: str, target: UUID) -> Bucket: ...
+
+    def between(self, edge_type: str, source: UUID, target: UUID) -> Bucket: ...
+
+    def of_type(self, edge_type: str) -> Bucket: ...
+
+    def outgoing(self, node: UUID, edge_type: Optional[str] = None) -> Bucket: ...
+
+    def incoming(self, node: UUID, edge_type: Optional[str] = None) -> Bucket: ...
+
+
+class HyperedgeLookup(Protocol):
+    """Read side of a hyperedge index, as used by the validator and queries."""
+
+    def with_sources(self, edge_type: str, sources: NodeKey) -> Bucket: ...
+
+    def with_targets(self, edge_type: str, targets: NodeKey) -> Bucket: ...
+
+    def with_members(
+        self, edge_type: str, sources: NodeKey, targets: NodeKey
+    ) -> Bucket: ...
+
+    def of_type(self, edge_type: str) -> Bucket: ...
+
+    def containing(
+        self,
+        node: UUID,
+        edge_type: Optional[str] = None,
+        role: Optional[Role] = None,
+    ) -> Bucket: ...
+
+
+class BucketIndex:
+    """Shared bucket maintenance for the hash indexes below."""
+
+    def _add_to(self, table: dict, key: Hashable, item: UUID) -> None:
+        bucket = table.get(key)
+        if bucket is None:
+            table[key] = {item.int: item}
+        else:
+            bucket[item.int] = item
+
+    def _discard_from(self, table: dict, key: Hashable, item: UUID) -> None:
+        bucket = table.get(key)
+        if bucket is None:
+            return
+        bucket.pop(item.int, None)
+        if not bucket:
+            # Drop empty buckets so deleted keys do not pin memory.
+            del table[key]
+
+    def _add_all(
+        self, table: dict, keys: Iterable[Hashable], items: List[UUID]
+    ) -> None:
+        get = table.get
+        for key, item in zip(keys, items):
+            bucket = get(key)
+            if bucket is None:
+                table[key] = {item.int: item}
+            else:
+                bucket[item.int] = item
+
+
+class EdgeIndex(BucketIndex):
+    """
+    Hash indexes over binary edges.
+
+    Buckets map a key to the ids of the edges stored under it, so the
+    constraint checks in `ConstraintValidator` become dictionary lookups
+    instead of scans over every edge in the graph. The untyped `outgoing`
+    and `incoming` tables double as forward and reverse adjacency.
+    """
+
+    def __init__(self, edges: Iterable[Edge] = ()):
+        self.by_type: Dict[str, Bucket] = {}
+        self.by_source: Dict[tuple[str, int], Bucket] = {}
+        self.by_target: Dict[tuple[str, int], Bucket] = {}
+        self.by_pair: Dict[tuple[str, int, int], Bucket] = {}
+        self.outgoing_any: Dict[int, Bucket] = {}
+        self.incoming_any: Dict[int, Bucket] = {}
+        for edge in edges:
+            self.add(edge)
+
+    # --- Maintenance ---
+    def add(self, edge: Edge) -> None:
+        source, target = edge.source.int, edge.target.int
+        self._add_to(self.by_type, edge.type, edge.id)
+        self._add_to(self.by_source, (edge.type, source), edge.id)
+        self._add_to(self.by_target, (edge.type, target), edge.id)
+        self._add_to(self.by_pair, (edge.type, source, target), edge.id)
+        self._add_to(self.outgoing_any, source, edge.id)
+        self._add_to(self.incoming_any, target, edge.id)
+
+    def add_all(self, edges: List[Edge]) -> None:
+        """Index a batch of edges, writing each bucket once."""
+        ids = [edge.id for edge in edges]
+        types = [edge.type for edge in edges]
+        sources = [edge.source.int for edge in edges]
+        targets = [edge.target.int for edge in edges]
+        self._add_all(self.by_type, types, ids)
+        self._add_all(self.by_source, zip(types, sources), ids)
+        self._add_all(self.by_target, zip(types, targets), ids)
+        self._add_all(self.by_pair, zip(types, sources, targets), ids)
+        self._add_all(self.outgoing_any, sources, ids)
+        self._add_all(self.incoming_any, targets, ids)
+
+    def remove(self, edge: Edge) -> None:
+        source, target = edge.source.int, edge.target.int
+        self._discard_from(self.by_type, edge.type, edge.id)
+        self._discard_from(self.by_source, (edge.type, source), edge.id)
+        self._discard_from(self.by_target, (edge.type, target), edge.id)
+        self._discard_from(self.by_pair, (edge.type, source, target), edge.id)
+        self._discard_from(self.outgoing_any, source, edge.id)
+        self._discard_from(self.incoming_any, target, edge.id)
+
+    # --- Lookups ---
+    def from_source(self, edge_type: str, source: UUID) -> Bucket:
+        return self.by_source.get((edge_type, source.int), EMPTY)
+
+    def to_target(self, edge_type: str, target: UUID) -> Bucket:
+        return self.by_target.get((edge_type, target.int), EMPTY)
+
+    def between(self, edge_type: str, source: UUID, target: UUID) -> Bucket:
+        return self.by_pair.get((edge_type, source.int, target.int), EMPTY)
+
+    def of_type(self, edge_type: str) -> Bucket:
+        return self.by_type.get(edge_type, EMPTY)
+
+    def outgoing(self, node: UUID, edge_type: Optional[str] = None) -> Bucket:
+        if edge_type is None:
+            return self.outgoing_any.get(node.int, EMPTY)
+        return self.from_source(edge_type, node)
+
+    def incoming(self, node: UUID, edge_type: Optional[str] = None) -> Bucket:
+        if edge_type is None:
+            return self.incoming_any.get(node.int, EMPTY)
+        return self.to_target(edge_type, node)
+
+
+class PendingEdgeIndex:
+    """
+    `EdgeLookup` over a stored index plus `pending`, an index of edges
+    that are accepted but not stored yet, as a batch validates them.
+    """
+
+    def __init__(self, index: EdgeLookup, pending: EdgeIndex):
+        self.index = index
+        self.pending = pending
+
+    def from_source(self, edge_type: str, source: UUID) -> Bucket:
+        return self._merged(
+            self.index.from_source(edge_type, source),
+            self.pending.from_source(edge_type, source),
+        )
+
+    def to_target(self, edge_type: str, target: UUID) -> Bucket:
+        return self._merged(
+            self.index.to_target(edge_type, target),
+            self.pending.to_target(edge_type, target),
+        )
+
+    def between(self, edge_type: str, source: UUID, target: UUID) -> Bucket:
+        return self._merged(
+            self.index.between(edge_type, source, target),
+            self.pending.between(edge_type, source, target),
+        )
+
+    def of_type(self, edge_type: str) -> Bucket:
+        return self._merged(
+            self.index.of_type(edge_type), self.pending.of_type(edge_type)
+        )
+
+    def outgoing(self, node: UUID, edge_type: Optional[str] = None) -> Bucket:
+        return self._merged(
+            self.index.outgoing(node, edge_type),
+            self.pending.outgoing(node, edge_type),
+        )
+
+    def incoming(self, node: UUID, edge_type: Optional[str] = None) -> Bucket:
+        return self._merged(
+            self.index.incoming(node, edge_type),
+            self.pending.incoming(node, edge_type),
+        )
+
+    @staticmethod
+    def _merged(stored: Bucket, pending: Bucket) -> Bucket:
+        if not pending:
+            return stored
+        if not stored:
+            return pending
+        return {**stored, **pending}
+
+
+class HyperedgeIndex(BucketIndex):
+    """
+    Hash indexes over hyperedges keyed by the canonical form of their
+    source and target node collections (see `canonical_nodes`).
+    """
+
+    def __init__(self, hyperedges: Iterable[Hyperedge] = ()):
+        self.by_type: Dict[str, Bucket] = {}
+        self.by_sources: Dict[tuple[str, NodeKey], Bucket] = {}
+        self.by_targets: Dict[tuple[str, NodeKey], Bucket] = {}
+        self.by_members: Dict[tuple[str, NodeKey, NodeKey], Bucket] = {}
+        # Node -> hyperedge incidence, split by the side the node is on.
+        self.sourced_by: Dict[tuple[str, int], Bucket] = {}
+        self.targeted_by: Dict[tuple[str, int], Bucket] = {}
+        self.sourced_by_any: Dict[int, Bucket] = {}
+        self.targeted_by_any: Dict[int, Bucket] = {}
+        for hyperedge in hyperedges:
+            self.add(hyperedge)
+
+    # --- Maintenance ---
+    def add(self, hyperedge: Hyperedge) -> None:
+        edge_type, edge_id = hyperedge.type, hyperedge.id
+        sources, targets = self.keys(hyperedge)
+        self._add_to(self.by_type, edge_type, edge_id)
+        self._add_to(self.by_sources, (edge_type, sources), edge_id)
+        self._add_to(self.by_targets, (edge_type, targets), edge_id)
+        self._add_to(self.by_members, (edge_type, sources, targets), edge_id)
+        for node in hyperedge.sources:
+            self._add_to(self.sourced_by, (edge_type, node.int), edge_id)
+            self._add_to(self.sourced_by_any, node.int, edge_id)
+        for node in hyperedge.targets:
+            self._add_to(self.targeted_by, (edge_type, node.int), edge_id)
+            self._add_to(self.targeted_by_any, node.int, edge_id)
+
+    def remove(self, hyperedge: Hyperedge) -> None:
+        edge_type, edge_id = hyperedge.type, hyperedge.id
+        sources, targets = self.keys(hyperedge)
+        self._discard_from(self.by_type, edge_type, edge_id)
+        self._discard_from(self.by_sources, (edge_type, sources), edge_id)
+        self._discard_from(self.by_targets, (edge_type, targets), edge_id)
+        self._discard_from(self.by_members, (edge_type, sources, targets), edge_id)
+        for node in hyperedge.sources:
+            self._discard_from(self.sourced_by, (edge_type, node.int), edge_id)
+            self._discard_from(self.sourced_by_any, node.int, edge_id)
+        for node in hyperedge.targets:
+            self._discard_from(self.targeted_by, (edge_type, node.int), edge_id)
+            self._discard_from(self.targeted_by_any, node.int, edge_id)
+
+    @staticmethod
+    def keys(hyperedge: Hyperedge) -> tuple[NodeKey, NodeKey]:
+        unordered = hyperedge.config.unordered
+        return (
+            canonical_nodes(hyperedge.sources, unordered),
+            canonical_nodes(hyperedge.targets, unordered),
+        )
+
+    # --- Lookups ---
+    def with_sources(self, edge_type: str, sources: NodeKey) -> Bucket:
+        return self.by_sources.get((edge_type, sources), EMPTY)
+
+    def with_targets(self, edge_type: str, targets: NodeKey) -> Bucket:
+        return self.by_targets.get((edge_type, targets), EMPTY)
+
+    def with_members(
+        self, edge_type: str, sources: NodeKey, targets: NodeKey
+    ) -> Bucket:
+        return self.by_members.get((edge_type, sources, targets), EMPTY)
+
+    def of_type(self, edge_type: str) -> Bucket:
+        return self.by_type.get(edge_type, EMPTY)
+
+    def containing(
+        self,
+        node: UUID,
+        edge_type: Optional[str] = None,
+        role: Optional[Role] = None,
+    ) -> Bucket:
+        """Hyperedges that have `node` among their sources and/or targets."""
+        if edge_type is None:
+            sourced = self.sourced_by_any.get(node.int, EMPTY)
+            targeted = self.targeted_by_any.get(node.int, EMPTY)
+        else:
+            sourced = self.sourced_by.get((edge_type, node.int), EMPTY)
+            targeted = self.targeted_by.get((edge_type, node.int), EMPTY)
+        if role == "source":
+            return sourced
+        if role == "target":
+            return targeted
+        if not targeted:
+            return sourced
+        if not sourced:
+            return targeted
+        return {**sourced, **targeted}
@@ -0,0 +1,125 @@
+from __future__ import annotations
+import gzip
+import json
+from itertools import groupby, islice
+from typing import IO, TYPE_CHECKING, Iterable, Iterator, Literal, Optional, Tuple
+
+from hgraph.core.registry import SchemaRegistry
+
+if TYPE_CHECKING:
+    from hgraph.core.hypergraph import Hypergraph
+    from hgraph.core.store import GraphStore
+
+# -----------------------------
+# Streaming JSON Lines persistence
+# -----------------------------
+#
+# One record per line: {"kind": "node" | "edge" | "hyperedge", "data": {...}}.
+# Nodes are written first, then edges, then hyperedges, so a reader can
+# commit records as they arrive.
+
+Compression = Literal["gzip", "zstd"]
+
+LOADERS = {
+    "node": SchemaRegistry.load_node,
+    "edge": SchemaRegistry.load_edge,
+    "hyperedge": SchemaRegistry.load_hyperedge,
+}
+
+# Record kind in a line -> kind as `Hypergraph.load_records` names it.
+KINDS = {"node": "nodes", "edge": "edges", "hyperedge": "hyperedges"}
+
+
+def infer_compression(path: str) -> Optional[Compression]:
+    if path.endswith(".gz"):
+        return "gzip"
+    if path.endswith(".zst"):
+        return "zstd"
+    return None
+
+
+def open_text(path: str, mode: str, compression: Optional[Compression]) -> IO[str]:
+    if compression is None:
+        return open(path, mode + "t", encoding="utf-8")
+    if compression == "gzip":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError(
+                "zstd compression requires the 'zstandard' package "
+                "(pip install hgraph[zstd])"
+            ) from e
+        return zstandard.open(path, mode + "t", encoding="utf-8")
+    raise ValueError(f"Unknown compression: {compression!r}")
+
+
+def save_to_json(
+    graph: Hypergraph, path: str, compression: Optional[Compression] = None
+) -> None:
+    """Write `graph` to `path` one record per line, without buffering it."""
+    if compression is None:
+        compression = infer_compression(path)
+    with open_text(path, "w", compression) as f:
+        for kind, models in (
+            ("node", graph.nodes.values()),
+            ("edge", graph.edges.values()),
+            ("hyperedge", graph.hyperedges.values()),
+        ):
+            prefix = f'{{"kind":"{kind}","data":'
+            for model in models:
+                f.write(prefix)
+                f.write(model.model_dump_json())
+                f.write("}\n")
+
+
+def iter_records(
+    path: str, compression: Optional[Compression] = None
+) -> Iterator[Tuple[str, dict]]:
+    """Yield `(kind, data)` for each line of a JSONL snapshot, lazily."""
+    if compression is None:
+        compression = infer_compression(path)
+    with open_text(path, "r", compression) as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                yield record["kind"], record["data"]
+
+
+def iter_models(records: Iterable[Tuple[str, dict]]) -> Iterator[Tuple[str, object]]:
+    """Deserialize records into their registered model classes."""
+    for kind, data in records:
+        yield kind, LOADERS[kind](data)
+
+
+def chunked(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def load_from_json(
+    path: str,
+    store: Optional[GraphStore] = None,
+    trusted: bool = False,
+    compression: Optional[Compression] = None,
+    batch_size: int = 10_000,
+) -> Hypergraph:
+    """
+    Stream a JSONL snapshot into a new `Hypergraph`.
+
+    Records go through a generator pipeline and are committed in batches
+    of `batch_size`, so peak memory is bounded by the batch rather than
+    the file. With `trusted=True` records are put straight into the store
+    without running `ConstraintValidator`; use it only for snapshots known
+    to be valid, such as ones written by `save_to_json`.
+    """
+    from hgraph.core.hypergraph import Hypergraph
+
+    graph = Hypergraph(store)
+    models = iter_models(iter_records(path, compression))
+    for kind, group in groupby(models, key=lambda record: record[0]):
+        for chunk in chunked((model for _, model in group), batch_size):
+            graph.load_records(KINDS[kind], chunk, trusted)
+    return graph
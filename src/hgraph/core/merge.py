@@ -0,0 +1,189 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Dict, List, Literal, Optional, Set, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from hgraph.core.consistency import check_records, dependencies
+from hgraph.core.persistent_store import PersistentStore, persistent_store
+from hgraph.core.validator import ConstraintViolation
+
+if TYPE_CHECKING:
+    from hgraph.core.hypergraph import Hypergraph
+
+# -----------------------------
+# Three-way merge of branches
+# -----------------------------
+#
+# Both sides are diffed against their common base, which costs time in the
+# number of changes since the fork, not in the size of the graph. The merge
+# starts from a branch of `ours` and applies `theirs`' changes straight to
+# the store, without per-record validation. Two kinds of conflict remain:
+#
+# - "concurrent": both sides changed the same record to different values.
+# - a constraint rule: records changed on different sides that together
+#   violate their config, e.g. two new targets of a `functional` edge from
+#   one source, or an edge added on one side whose endpoint the other side
+#   deleted or re-typed. Only the records the merge touched, and those
+#   attached to touched nodes, are re-checked through the indexes (see
+#   `check_records`). A record check also involves what it read: the
+#   endpoints, or the buckets a custom rule's lookups answer from.
+#
+# A strategy of "ours" or "theirs" resolves every conflict by restoring
+# the winning side's version of the records involved, then checks again
+# until no record changed on the losing side conflicts any more.
+
+Kind = Literal["nodes", "edges", "hyperedges"]
+Side = Literal["ours", "theirs"]
+Strategy = Literal["fail", "ours", "theirs"]
+
+
+class Conflict(BaseModel):
+    kind: Kind
+    rule: str
+    """"concurrent", or the constraint the merged records violate together."""
+    type: str
+    ids: List[UUID]
+    """The changed records involved, including nodes a violation depends on."""
+
+
+class MergeConflict(ConstraintViolation):
+    """Raised by `merge(..., strategy="fail")` when the branches conflict."""
+
+    def __init__(self, conflicts: List[Conflict]):
+        self.conflicts = conflicts
+        first = conflicts[0]
+        super().__init__(
+            f"{len(conflicts)} merge conflict(s); first: {first.rule} "
+            f"on {first.type} {[str(i) for i in first.ids]}"
+        )
+
+
+def merge(
+    base: Hypergraph,
+    ours: Hypergraph,
+    theirs: Hypergraph,
+    strategy: Strategy = "fail",
+) -> Tuple[Hypergraph, List[Conflict]]:
+    """
+    Merge `theirs` into a new branch of `ours`, both forked from `base`.
+
+    Returns the merged graph and the conflicts the strategy resolved. With
+    `strategy="fail"` any conflict raises `MergeConflict` instead. The three
+    graphs need a `PersistentStore` and are left unchanged.
+    """
+    merged = ours.branch()
+    store = persistent_store(merged)
+    # Records changed since `base`, per side, keyed by id.
+    changed: Dict[Side, Dict[UUID, Kind]] = {"ours": {}, "theirs": {}}
+    for side, graph in (("ours", ours), ("theirs", theirs)):
+        changes = base.diff(graph)
+        for kind in ("nodes", "edges", "hyperedges"):
+            record_changes = getattr(changes, kind)
+            for record_id in (
+                *record_changes.added,
+                *record_changes.removed,
+                *record_changes.changed,
+            ):
+                changed[side][record_id] = kind
+
+    conflicts: List[Conflict] = []
+    for record_id, kind in changed["theirs"].items():
+        if record_id not in changed["ours"]:
+            put(store, kind, record_id, record(theirs, kind, record_id))
+            continue
+        mine = record(ours, kind, record_id)
+        other = record(theirs, kind, record_id)
+        if mine != other:
+            conflicts.append(
+                Conflict(
+                    kind=kind,
+                    rule="concurrent",
+                    type=(mine or other).type,
+                    ids=[record_id],
+                )
+            )
+
+    conflicts.extend(constraint_conflicts(merged, changed))
+    if not conflicts:
+        return merged, []
+    if strategy == "fail":
+        raise MergeConflict(conflicts)
+
+    resolved = list(conflicts)
+    winner = ours if strategy == "ours" else theirs
+    losing = changed["theirs" if strategy == "ours" else "ours"]
+    while conflicts:
+        for conflict in conflicts:
+            for record_id in conflict.ids:
+                kind = losing.pop(record_id, None)
+                if kind is not None:
+                    put(store, kind, record_id, record(winner, kind, record_id))
+        conflicts = constraint_conflicts(merged, changed)
+        resolved.extend(conflicts)
+    return merged, resolved
+
+
+def record(graph: Hypergraph, kind: Kind, record_id: UUID) -> Optional[BaseModel]:
+    return getattr(graph.store, kind).get(record_id)
+
+
+def put(
+    store: PersistentStore, kind: Kind, record_id: UUID, value: Optional[BaseModel]
+) -> None:
+    """Make `store` hold `value` under `record_id`, or nothing if None."""
+    if value is None:
+        if kind == "nodes":
+            store.pop_node(record_id)
+        elif kind == "edges":
+            store.pop_edge(record_id)
+        else:
+            store.pop_hyperedge(record_id)
+    elif kind == "nodes":
+        store.put_node(value)
+    elif kind == "edges":
+        store.put_edge(value)
+    else:
+        store.put_hyperedge(value)
+
+
+def constraint_conflicts(
+    merged: Hypergraph, changed: Dict[Side, Dict[UUID, Kind]]
+) -> List[Conflict]:
+    """
+    Violations among touched records that involve changes from both sides.
+
+    A violation involves its records and, for a record check, what that
+    check read (see `dependencies`): e.g. an edge added on one side whose
+    target node the other side deleted. The conflict lists every changed
+    record involved, so a strategy can restore the losing side's ones.
+    """
+    ours, theirs = changed["ours"], changed["theirs"]
+    touched: Dict[Kind, Set[UUID]] = {"edges": set(), "hyperedges": set()}
+    for side in (ours, theirs):
+        for record_id, kind in side.items():
+            if kind != "nodes":
+                touched[kind].add(record_id)
+                continue
+            # Records attached to a changed node may now break their
+            # endpoint rules, though neither side changed them.
+            for edge in (
+                *merged.find_edges(source=record_id),
+                *merged.find_edges(target=record_id),
+            ):
+                touched["edges"].add(edge.id)
+            for hyperedge in merged.find_hyperedges(containing=record_id):
+                touched["hyperedges"].add(hyperedge.id)
+    report = check_records(merged, touched["edges"], touched["hyperedges"])
+    conflicts: List[Conflict] = []
+    for violation in report.violations:
+        involved = set(violation.ids) | dependencies(merged, violation)
+        if involved.isdisjoint(ours) or involved.isdisjoint(theirs):
+            continue
+        ids = sorted(i for i in involved if i in ours or i in theirs)
+        conflicts.append(
+            Conflict(
+                kind=violation.kind, rule=violation.rule, type=violation.type, ids=ids
+            )
+        )
+    return conflicts
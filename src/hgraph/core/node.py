@@ -1,18 +1,30 @@
 from __future__ import annotations
-from pydantic import BaseModel, Field
+from typing import Any, ClassVar
+from pydantic import BaseModel, Field, model_validator
 from uuid import UUID, uuid4
 
-from hgraph.core.config import NodeConfig
-from hgraph.core.registry import SchemaRegistry
+from hgraph.core.config import NodeConfig, reject_config, share_config
+from hgraph.core.registry import SchemaRegistry, construct_trusted
 
 
 class Node(BaseModel):
-    config: NodeConfig = Field(default_factory=NodeConfig)
+    config: ClassVar[NodeConfig] = NodeConfig()
 
     id: UUID = Field(default_factory=uuid4)
     type: str = Field(default="Node")
 
     def __init_subclass__(cls, **kwargs):
         cls.type = cls.__name__
+        share_config(cls)
         SchemaRegistry.register_node(cls)
         super().__init_subclass__(**kwargs)
+
+    @model_validator(mode="before")
+    @classmethod
+    def no_instance_config(cls, data: Any) -> Any:
+        return reject_config(data)
+
+    @classmethod
+    def trusted(cls, **fields: Any) -> Node:
+        """Build a node from already-valid values, skipping validation."""
+        return construct_trusted(cls, fields)
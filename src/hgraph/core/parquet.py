@@ -0,0 +1,418 @@
+from __future__ import annotations
+import json
+import os
+from datetime import date, datetime
+from enum import Enum
+from itertools import islice
+from types import NoneType, UnionType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from hgraph.core.registry import SchemaRegistry, construct_trusted
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+    from hgraph.core.hypergraph import Hypergraph
+    from hgraph.core.store import GraphStore
+
+# -----------------------------
+# Parquet/Arrow columnar snapshots
+# -----------------------------
+#
+# One Parquet file per registered type, under a directory per kind:
+#
+#   <path>/nodes/<Type>.parquet
+#   <path>/edges/<Type>.parquet
+#   <path>/hyperedges/<Type>.parquet
+#
+# Pydantic fields become typed columns: UUIDs are 16-byte binaries,
+# hyperedge sources/targets are list columns, and values without a native
+# Arrow type are stored as JSON strings. `config` is a property of the
+# type and is not written per row.
+
+Kind = Literal["nodes", "edges", "hyperedges"]
+
+KINDS: Tuple[Kind, ...] = ("nodes", "edges", "hyperedges")
+
+# Encoders turn a Python value into its column value; decoders are only
+# needed where pydantic cannot validate the column value directly.
+Codec = Tuple["pa.DataType", Callable[[Any], Any], Optional[Callable[[Any], Any]]]
+
+
+def require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Parquet support requires the 'pyarrow' package "
+            "(pip install hgraph[parquet])"
+        ) from e
+    return pyarrow
+
+
+def registered_types(kind: Kind) -> Dict[str, type]:
+    return {
+        "nodes": SchemaRegistry.node_types,
+        "edges": SchemaRegistry.edge_types,
+        "hyperedges": SchemaRegistry.hyperedge_types,
+    }[kind]
+
+
+def model_for(kind: Kind, type_name: str) -> type[BaseModel]:
+    """Registered class for `type_name`, falling back to the base model."""
+    from hgraph.core.node import Node
+    from hgraph.core.edge import Edge, Hyperedge
+
+    base = {"nodes": Node, "edges": Edge, "hyperedges": Hyperedge}[kind]
+    return registered_types(kind).get(type_name, base)
+
+
+def identity(value: Any) -> Any:
+    return value
+
+
+def uuid_bytes(value: Optional[UUID]) -> Optional[bytes]:
+    return None if value is None else value.bytes
+
+
+def to_json(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, BaseModel):
+        return value.model_dump_json()
+    return json.dumps(value, default=str)
+
+
+def uuid_from_bytes(value: Optional[bytes]) -> Optional[UUID]:
+    return None if value is None else UUID(bytes=value)
+
+
+def from_json(value: Optional[str]) -> Any:
+    return None if value is None else json.loads(value)
+
+
+def each(convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def convert_all(values: Any) -> Any:
+        return None if values is None else [convert(v) for v in values]
+
+    return convert_all
+
+
+def codec_for(annotation: Any) -> Codec:
+    """Arrow type plus encoder/decoder for a pydantic field annotation."""
+    pa = require_pyarrow()
+    origin = get_origin(annotation)
+
+    if origin in (Union, UnionType):
+        members = [arg for arg in get_args(annotation) if arg is not NoneType]
+        if len(members) == 1:
+            return codec_for(members[0])
+        return pa.string(), to_json, from_json
+
+    if origin in (list, List, tuple, set, frozenset):
+        args = get_args(annotation)
+        item_type, item_encode, item_decode = codec_for(args[0] if args else Any)
+        return (
+            pa.list_(item_type),
+            each(item_encode),
+            None if item_decode is None else each(item_decode),
+        )
+
+    if annotation is UUID:
+        return pa.binary(16), uuid_bytes, None
+    if annotation is bool:
+        return pa.bool_(), identity, None
+    if annotation is int:
+        return pa.int64(), identity, None
+    if annotation is float:
+        return pa.float64(), identity, None
+    if annotation is str:
+        return pa.string(), identity, None
+    if annotation is datetime:
+        return pa.timestamp("us"), identity, None
+    if annotation is date:
+        return pa.date32(), identity, None
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return pa.string(), lambda v: None if v is None else str(v.value), None
+    return pa.string(), to_json, from_json
+
+
+def model_codecs(model: type[BaseModel]) -> Dict[str, Codec]:
+    return {
+        name: codec_for(field.annotation) for name, field in model.model_fields.items()
+    }
+
+
+def trusted_decoder(annotation: Any) -> Tuple[bool, Optional[Callable[[Any], Any]]]:
+    """
+    Whether a column of `annotation` can be turned into the field's value
+    without validation, and the converter needed for it, if any. Columns
+    stored as JSON or as enum values can only be rebuilt by pydantic.
+    """
+    origin = get_origin(annotation)
+    if origin in (Union, UnionType):
+        members = [arg for arg in get_args(annotation) if arg is not NoneType]
+        return trusted_decoder(members[0]) if len(members) == 1 else (False, None)
+    if origin in (list, List):
+        args = get_args(annotation)
+        supported, item_decode = trusted_decoder(args[0]) if args else (False, None)
+        return supported, None if item_decode is None else each(item_decode)
+    if annotation is UUID:
+        return True, uuid_from_bytes
+    if annotation in (bool, int, float, str, datetime, date):
+        return True, None
+    return False, None
+
+
+def trusted_decoders(
+    model: type[BaseModel],
+) -> Optional[Dict[str, Optional[Callable[[Any], Any]]]]:
+    """Per-field converters for `trusted_decoder`, or None if any field lacks one."""
+    decoders = {}
+    for name, field in model.model_fields.items():
+        supported, decode = trusted_decoder(field.annotation)
+        if not supported:
+            return None
+        decoders[name] = decode
+    return decoders
+
+
+def file_path(path: str, kind: Kind, type_name: str) -> str:
+    return os.path.join(path, kind, f"{type_name}.parquet")
+
+
+# --- Writing ---
+def models_by_type(graph: Hypergraph, kind: Kind) -> Iterator[Tuple[str, Iterable]]:
+    """Yield `(type, models)` for every type stored in `graph` under `kind`."""
+    if kind == "nodes":
+        # There is no node-type index, so group node ids in one pass.
+        groups: Dict[str, List[UUID]] = {}
+        for node in graph.nodes.values():
+            groups.setdefault(node.type, []).append(node.id)
+        for type_name, ids in groups.items():
+            yield type_name, (graph.nodes[i] for i in ids)
+        return
+
+    records = graph.edges if kind == "edges" else graph.hyperedges
+    index = graph.edge_index if kind == "edges" else graph.hyperedge_index
+    seen = 0
+    for type_name in registered_types(kind):
+        bucket = index.of_type(type_name)
+        if bucket:
+            seen += len(bucket)
+            yield type_name, (records[i] for i in bucket.values())
+    if seen < len(records):
+        # Types that were never registered (e.g. base `Edge` instances).
+        leftovers: Dict[str, List[UUID]] = {}
+        for record_id, record in records.items():
+            if record.type not in registered_types(kind):
+                leftovers.setdefault(record.type, []).append(record_id)
+        for type_name, ids in leftovers.items():
+            yield type_name, (records[i] for i in ids)
+
+
+def write_type(
+    path: str,
+    kind: Kind,
+    type_name: str,
+    models: Iterable[BaseModel],
+    row_group_size: int,
+    compression: str,
+) -> int:
+    pa = require_pyarrow()
+    import pyarrow.parquet as pq
+
+    iterator = iter(models)
+    first = next(iterator, None)
+    if first is None:
+        return 0
+    codecs = model_codecs(type(first))
+    schema = pa.schema([(name, codec[0]) for name, codec in codecs.items()])
+    os.makedirs(os.path.dirname(file_path(path, kind, type_name)), exist_ok=True)
+
+    rows = 0
+    pending = [first, *islice(iterator, row_group_size - 1)]
+    with pq.ParquetWriter(
+        file_path(path, kind, type_name), schema, compression=compression
+    ) as writer:
+        while pending:
+            columns = {
+                name: [encode(getattr(model, name)) for model in pending]
+                for name, (_, encode, _) in codecs.items()
+            }
+            writer.write_table(pa.table(columns, schema=schema))
+            rows += len(pending)
+            pending = list(islice(iterator, row_group_size))
+    return rows
+
+
+def save_to_parquet(
+    graph: Hypergraph,
+    path: str,
+    row_group_size: int = 65_536,
+    compression: str = "zstd",
+) -> Dict[str, Dict[str, int]]:
+    """
+    Write `graph` as one Parquet file per type. Returns the row count
+    written for each kind and type.
+    """
+    written: Dict[str, Dict[str, int]] = {}
+    for kind in KINDS:
+        written[kind] = {}
+        for type_name, models in models_by_type(graph, kind):
+            written[kind][type_name] = write_type(
+                path, kind, type_name, models, row_group_size, compression
+            )
+    return written
+
+
+# --- Reading ---
+def stored_types(path: str, kind: Kind) -> List[str]:
+    directory = os.path.join(path, kind)
+    if not os.path.isdir(directory):
+        return []
+    return sorted(
+        name[: -len(".parquet")]
+        for name in os.listdir(directory)
+        if name.endswith(".parquet")
+    )
+
+
+def read_table(
+    path: str,
+    kind: Kind,
+    type_name: str,
+    columns: Optional[List[str]] = None,
+    filters: Optional[Any] = None,
+) -> pa.Table:
+    """
+    Read one type's table, projecting `columns` and pushing `filters`
+    (in `pyarrow.parquet.read_table` form) down to the row groups.
+    """
+    require_pyarrow()
+    import pyarrow.parquet as pq
+
+    return pq.read_table(
+        file_path(path, kind, type_name), columns=columns, filters=filters
+    )
+
+
+def scan(
+    path: str,
+    kind: Kind,
+    types: Optional[Iterable[str]] = None,
+    columns: Optional[List[str]] = None,
+    filters: Optional[Any] = None,
+) -> Iterator[Tuple[str, pa.Table]]:
+    """Yield `(type, table)` for the selected types; other files are not opened."""
+    selected = stored_types(path, kind) if types is None else list(types)
+    for type_name in selected:
+        if os.path.exists(file_path(path, kind, type_name)):
+            yield type_name, read_table(path, kind, type_name, columns, filters)
+
+
+def iter_models(
+    path: str,
+    kind: Kind,
+    types: Optional[Iterable[str]],
+    batch_size: int,
+    trusted: bool = False,
+    columns: Optional[Iterable[str]] = None,
+) -> Iterator[BaseModel]:
+    """
+    Models stored for the selected types. With `trusted=True`, files whose
+    columns all decode to their field types are built through
+    `construct_trusted` instead of being validated row by row.
+
+    `columns` projects the read: besides `id`, `type` and the fields a
+    model requires, only the named columns are read, and other fields
+    keep their defaults.
+    """
+    require_pyarrow()
+    import pyarrow.parquet as pq
+
+    selected = stored_types(path, kind) if types is None else list(types)
+    for type_name in selected:
+        location = file_path(path, kind, type_name)
+        if not os.path.exists(location):
+            continue
+        model = model_for(kind, type_name)
+        parquet_file = pq.ParquetFile(location)
+        typed = trusted_decoders(model) if trusted else None
+        # Files written for an older version of the model are validated.
+        stored = set(parquet_file.schema_arrow.names)
+        construct = typed is not None and stored == set(typed)
+        read = None
+        if columns is not None:
+            wanted = {"id", "type", *columns}
+            wanted.update(
+                name
+                for name, field in model.model_fields.items()
+                if field.is_required()
+            )
+            read = [name for name in parquet_file.schema_arrow.names if name in wanted]
+        if construct:
+            decoders = {name: decode for name, decode in typed.items() if decode}
+        else:
+            decoders = {
+                name: decode
+                for name, (_, _, decode) in model_codecs(model).items()
+                if decode is not None
+            }
+        for batch in parquet_file.iter_batches(batch_size=batch_size, columns=read):
+            for row in batch.to_pylist():
+                for name, decode in decoders.items():
+                    if name in row:
+                        row[name] = decode(row[name])
+                if construct:
+                    yield construct_trusted(model, row)
+                else:
+                    yield model.model_validate(row)
+
+
+def load_from_parquet(
+    path: str,
+    store: Optional[GraphStore] = None,
+    trusted: bool = False,
+    types: Optional[Iterable[str]] = None,
+    batch_size: int = 65_536,
+    columns: Optional[Iterable[str]] = None,
+) -> Hypergraph:
+    """
+    Load a Parquet snapshot into a new `Hypergraph`, optionally only the
+    given types. `trusted=True` skips `ConstraintValidator`, as in
+    `load_from_json`. `columns` projects the optional fields read, see
+    `iter_models`; the unread ones are left at their defaults.
+    """
+    from hgraph.core.hypergraph import Hypergraph
+
+    selected = None if types is None else set(types)
+    columns = None if columns is None else list(columns)
+    graph = Hypergraph(store)
+    for kind in KINDS:
+        kind_types = (
+            None
+            if selected is None
+            else [t for t in stored_types(path, kind) if t in selected]
+        )
+        models = iter_models(path, kind, kind_types, batch_size, trusted, columns)
+        while chunk := list(islice(models, batch_size)):
+            graph.load_records(kind, chunk, trusted)
+    return graph
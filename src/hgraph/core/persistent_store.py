@@ -0,0 +1,221 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Dict, Hashable, Iterable, List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from hgraph.core.edge import Edge, Hyperedge
+from hgraph.core.hamt import HAMT, PersistentDict
+from hgraph.core.index import BucketIndex, EdgeIndex, HyperedgeIndex
+from hgraph.core.node import Node
+from hgraph.core.store import InMemoryStore
+
+if TYPE_CHECKING:
+    from hgraph.core.hypergraph import Hypergraph
+
+# -----------------------------
+# Copy-on-write store for snapshots and branches
+# -----------------------------
+#
+# Records and every index table live in `PersistentDict`s, and index
+# buckets are `HAMT`s themselves, so nothing is ever updated in place.
+# Forking the store copies a fixed number of handles; after that, the two
+# stores share every trie node until one of them writes, and each write
+# copies only the few nodes on its path. `diff` walks two versions side
+# by side and skips the subtrees they still share.
+
+
+# Buckets up to this size are plain dicts copied on write, which is
+# cheaper than a trie update; larger ones are promoted to a `HAMT`.
+SMALL_BUCKET = 16
+
+
+class PersistentBuckets(BucketIndex):
+    """Bucket maintenance that replaces buckets instead of mutating them."""
+
+    def _add_to(self, table: PersistentDict, key: Hashable, item: UUID) -> None:
+        bucket = table.get(key)
+        if bucket is None:
+            table[key] = {item.int: item}
+        elif type(bucket) is dict and len(bucket) < SMALL_BUCKET:
+            table[key] = {**bucket, item.int: item}
+        elif type(bucket) is dict:
+            table[key] = HAMT.from_items(bucket.items()).set(item.int, item)
+        else:
+            table[key] = bucket.set(item.int, item)
+
+    def _discard_from(self, table: PersistentDict, key: Hashable, item: UUID) -> None:
+        bucket = table.get(key)
+        if bucket is None or item.int not in bucket:
+            return
+        if type(bucket) is dict:
+            bucket = {k: v for k, v in bucket.items() if k != item.int}
+        else:
+            bucket = bucket.delete(item.int)
+        if bucket:
+            table[key] = bucket
+        else:
+            # Drop empty buckets so deleted keys do not pin memory.
+            del table[key]
+
+    def _add_all(
+        self, table: PersistentDict, keys: Iterable[Hashable], items: List[UUID]
+    ) -> None:
+        # Grouped first, so each key's trie path is copied once per batch
+        # rather than once per item.
+        groups: Dict[Hashable, dict] = {}
+        for key, item in zip(keys, items):
+            group = groups.get(key)
+            if group is None:
+                groups[key] = {item.int: item}
+            else:
+                group[item.int] = item
+        for key, group in groups.items():
+            if key in table or len(group) > SMALL_BUCKET:
+                for item in group.values():
+                    self._add_to(table, key, item)
+            else:
+                table[key] = group
+
+    def fork(self) -> "PersistentBuckets":
+        clone = object.__new__(type(self))
+        for name, table in vars(self).items():
+            setattr(clone, name, table.copy())
+        return clone
+
+
+class PersistentEdgeIndex(PersistentBuckets, EdgeIndex):
+    def __init__(self):
+        self.by_type = PersistentDict()
+        self.by_source = PersistentDict()
+        self.by_target = PersistentDict()
+        self.by_pair = PersistentDict()
+        self.outgoing_any = PersistentDict()
+        self.incoming_any = PersistentDict()
+
+
+class PersistentHyperedgeIndex(PersistentBuckets, HyperedgeIndex):
+    def __init__(self):
+        self.by_type = PersistentDict()
+        self.by_sources = PersistentDict()
+        self.by_targets = PersistentDict()
+        self.by_members = PersistentDict()
+        self.sourced_by = PersistentDict()
+        self.targeted_by = PersistentDict()
+        self.sourced_by_any = PersistentDict()
+        self.targeted_by_any = PersistentDict()
+
+
+class PersistentStore(InMemoryStore):
+    """
+    `GraphStore` with O(1) `fork()`. Lookups and writes walk a trie instead
+    of hashing into a dict, which makes them several times slower than with
+    `InMemoryStore`; in exchange a fork costs memory only for what changes
+    after it. A `frozen` store rejects writes.
+    """
+
+    def __init__(self):
+        self.nodes = PersistentDict()
+        self.edges = PersistentDict()
+        self.hyperedges = PersistentDict()
+        self.edge_index = PersistentEdgeIndex()
+        self.hyperedge_index = PersistentHyperedgeIndex()
+        self.frozen = False
+
+    def fork(self, frozen: bool = False) -> "PersistentStore":
+        clone = object.__new__(type(self))
+        clone.nodes = self.nodes.copy()
+        clone.edges = self.edges.copy()
+        clone.hyperedges = self.hyperedges.copy()
+        clone.edge_index = self.edge_index.fork()
+        clone.hyperedge_index = self.hyperedge_index.fork()
+        clone.frozen = frozen
+        return clone
+
+    # --- Writes ---
+    def put_node(self, node: Node) -> None:
+        self._writable()
+        super().put_node(node)
+
+    def put_nodes(self, nodes: Iterable[Node]) -> None:
+        self._writable()
+        super().put_nodes(nodes)
+
+    def pop_node(self, node_id: UUID) -> Optional[Node]:
+        self._writable()
+        return super().pop_node(node_id)
+
+    def put_edge(self, edge: Edge) -> None:
+        self._writable()
+        super().put_edge(edge)
+
+    def put_edges(self, edges: List[Edge]) -> None:
+        self._writable()
+        super().put_edges(edges)
+
+    def pop_edge(self, edge_id: UUID) -> Optional[Edge]:
+        self._writable()
+        return super().pop_edge(edge_id)
+
+    def put_hyperedge(self, hyperedge: Hyperedge) -> None:
+        self._writable()
+        super().put_hyperedge(hyperedge)
+
+    def pop_hyperedge(self, hyperedge_id: UUID) -> Optional[Hyperedge]:
+        self._writable()
+        return super().pop_hyperedge(hyperedge_id)
+
+    def _writable(self) -> None:
+        if self.frozen:
+            raise TypeError("This store is a read-only snapshot; branch() it")
+
+
+# --- Diff ---
+class RecordChanges(BaseModel):
+    added: List[UUID] = Field(default_factory=list)
+    removed: List[UUID] = Field(default_factory=list)
+    changed: List[UUID] = Field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+class GraphDiff(BaseModel):
+    """Ids that differ going from one graph version to another."""
+
+    nodes: RecordChanges = Field(default_factory=RecordChanges)
+    edges: RecordChanges = Field(default_factory=RecordChanges)
+    hyperedges: RecordChanges = Field(default_factory=RecordChanges)
+
+    @property
+    def empty(self) -> bool:
+        return not (self.nodes or self.edges or self.hyperedges)
+
+
+def persistent_store(graph: Hypergraph) -> PersistentStore:
+    if not isinstance(graph.store, PersistentStore):
+        raise TypeError(
+            "Snapshots, branches and diffs need a copy-on-write store: "
+            "create the graph with Hypergraph(store=PersistentStore())"
+        )
+    return graph.store
+
+
+def diff(a: Hypergraph, b: Hypergraph) -> GraphDiff:
+    """
+    What changed from `a` to `b`. For versions forked from each other the
+    cost follows the number of changes, not the size of the graphs.
+    """
+    before, after = persistent_store(a), persistent_store(b)
+    result = GraphDiff()
+    for kind in ("nodes", "edges", "hyperedges"):
+        changes: RecordChanges = getattr(result, kind)
+        old, new = getattr(before, kind).map, getattr(after, kind).map
+        for record_id, previous, current in old.diff(new):
+            if previous is None:
+                changes.added.append(record_id)
+            elif current is None:
+                changes.removed.append(record_id)
+            else:
+                changes.changed.append(record_id)
+    return result
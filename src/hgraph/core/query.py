@@ -0,0 +1,527 @@
+from __future__ import annotations
+import re
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from hgraph.core.index import Role
+from hgraph.core.registry import SchemaRegistry
+
+if TYPE_CHECKING:
+    from hgraph.core.edge import Edge
+    from hgraph.core.hypergraph import Hypergraph
+
+# -----------------------------
+# Pattern matching
+# -----------------------------
+#
+# A `QueryPattern` is a conjunction of clauses over variables, in the
+# spirit of a Datalog rule body:
+#
+#   Person(p), HasChild(p, c), HasChild(c, g)
+#
+# Each match binds every variable to an id. Variables are not required to
+# bind distinct ids (homomorphism semantics, as in Datalog). A node clause
+# also matches subtypes of its type, and edge clauses see the edges that
+# `inverses="virtual"` implies, as `find_edges` does.
+#
+# Execution is a pipeline of joins that partial bindings stream through,
+# so a `limit` stops it as soon as enough matches are found. The planner
+# orders clauses greedily by estimated result size, using per-type counts
+# from the indexes, and every join probes an adjacency index once per
+# distinct bound value instead of looping over all edges.
+
+
+class NodePattern(BaseModel):
+    var: str
+    type: Optional[str] = None
+    where: Dict[str, Any] = Field(default_factory=dict)
+
+
+class EdgePattern(BaseModel):
+    source: str
+    target: str
+    type: Optional[str] = None
+    var: Optional[str] = None
+    """Optionally bind the matched edge's id as well."""
+    where: Dict[str, Any] = Field(default_factory=dict)
+
+
+class MemberPattern(BaseModel):
+    """`node` is a member of hyperedge `hyperedge`, on either or one side."""
+
+    hyperedge: str
+    node: str
+    type: Optional[str] = None
+    role: Optional[Role] = None
+
+
+Clause = Union[NodePattern, EdgePattern, MemberPattern]
+
+CLAUSE = re.compile(r"\s*(\w+)\s*\(([^)]*)\)\s*(?:,|$)")
+
+
+class QueryPattern(BaseModel):
+    clauses: List[Clause] = Field(default_factory=list)
+
+    # --- Builder ---
+    def node(
+        self, var: str, type: Optional[str] = None, **where: Any
+    ) -> "QueryPattern":
+        self.clauses.append(NodePattern(var=var, type=type, where=where))
+        return self
+
+    def edge(
+        self,
+        source: str,
+        target: str,
+        type: Optional[str] = None,
+        var: Optional[str] = None,
+        **where: Any,
+    ) -> "QueryPattern":
+        self.clauses.append(
+            EdgePattern(source=source, target=target, type=type, var=var, where=where)
+        )
+        return self
+
+    def member(
+        self,
+        hyperedge: str,
+        node: str,
+        type: Optional[str] = None,
+        role: Optional[Role] = None,
+    ) -> "QueryPattern":
+        self.clauses.append(
+            MemberPattern(hyperedge=hyperedge, node=node, type=type, role=role)
+        )
+        return self
+
+    @classmethod
+    def parse(cls, text: str) -> "QueryPattern":
+        """
+        Parse `Type(args), ...` using the registered types:
+
+        - node type, one argument: `Person(p)`
+        - edge type, two or three arguments: `HasChild(p, c)`, `HasChild(p, c, e)`
+        - hyperedge type, two arguments: `CoAuthored(h, author)`
+        """
+        pattern = cls()
+        position = 0
+        text = text.strip()
+        while position < len(text):
+            found = CLAUSE.match(text, position)
+            if found is None:
+                raise ValueError(f"Cannot parse pattern at: {text[position:]!r}")
+            name = found.group(1)
+            args = [arg.strip() for arg in found.group(2).split(",") if arg.strip()]
+            if name in SchemaRegistry.node_types and len(args) == 1:
+                pattern.node(args[0], name)
+            elif name in SchemaRegistry.edge_types and len(args) in (2, 3):
+                pattern.edge(args[0], args[1], name, *args[2:])
+            elif name in SchemaRegistry.hyperedge_types and len(args) == 2:
+                pattern.member(args[0], args[1], name)
+            else:
+                raise ValueError(f"Unknown type or arity: {found.group(0).strip()!r}")
+            position = found.end()
+        return pattern
+
+
+def variables(clause: Clause) -> Tuple[str, ...]:
+    if isinstance(clause, NodePattern):
+        return (clause.var,)
+    if isinstance(clause, EdgePattern):
+        return tuple(v for v in (clause.source, clause.target, clause.var) if v)
+    return (clause.hyperedge, clause.node)
+
+
+# --- Statistics ---
+class Statistics:
+    """
+    Cardinality estimates for the planner. Edge and hyperedge counts per
+    type are exact (index bucket sizes); node type shares and hyperedge
+    sizes are estimated from a sample, since nodes have no type index.
+    """
+
+    def __init__(self, graph: Hypergraph, sample_size: int = 1024):
+        self.graph = graph
+        self.node_count = max(len(graph.nodes), 1)
+        sample = list(islice(graph.nodes.values(), sample_size))
+        self.node_shares: Dict[str, float] = {}
+        for node in sample:
+            self.node_shares[node.type] = self.node_shares.get(node.type, 0) + 1
+        for type_name in self.node_shares:
+            self.node_shares[type_name] /= len(sample)
+        self.member_counts: Dict[Optional[str], float] = {}
+
+    def node_share(self, type: Optional[str]) -> float:
+        if type is None:
+            return 1.0
+        share = sum(
+            self.node_shares.get(name, 0.0)
+            for name in SchemaRegistry.node_subtypes(type)
+        )
+        # Types missing from the sample may still exist; assume they are rare.
+        return share or 1 / self.node_count
+
+    def edges(self, type: Optional[str]) -> int:
+        if type is None:
+            return len(self.graph.edges)
+        types = [type]
+        if self.graph.inverses == "virtual":
+            types.extend(SchemaRegistry.inverse_types(type))
+        return sum(len(self.graph.edge_index.of_type(name)) for name in types)
+
+    def hyperedges(self, type: Optional[str]) -> int:
+        if type is None:
+            return len(self.graph.hyperedges)
+        return len(self.graph.hyperedge_index.of_type(type))
+
+    def members_per_hyperedge(self, type: Optional[str]) -> float:
+        cached = self.member_counts.get(type)
+        if cached is None:
+            if type is None:
+                ids = islice(self.graph.hyperedges.keys(), 64)
+            else:
+                ids = islice(self.graph.hyperedge_index.of_type(type).values(), 64)
+            sizes = [
+                len(self.graph.hyperedges[i].sources)
+                + len(self.graph.hyperedges[i].targets)
+                for i in ids
+            ]
+            cached = sum(sizes) / len(sizes) if sizes else 0.0
+            self.member_counts[type] = cached
+        return cached
+
+
+def estimate(clause: Clause, bound: set, stats: Statistics) -> float:
+    """Rows produced per input row when `clause` joins on `bound` variables."""
+    if isinstance(clause, NodePattern):
+        selectivity = stats.node_share(clause.type) * 0.1 ** len(clause.where)
+        if clause.var in bound:
+            return selectivity
+        return stats.node_count * selectivity
+    if isinstance(clause, EdgePattern):
+        count = stats.edges(clause.type) * 0.1 ** len(clause.where)
+        if clause.var is not None and clause.var in bound:
+            return 1 / stats.node_count
+        ends = (clause.source in bound) + (clause.target in bound)
+        return count / stats.node_count**ends
+    members = stats.hyperedges(clause.type) * stats.members_per_hyperedge(clause.type)
+    if clause.hyperedge in bound and clause.node in bound:
+        return 1 / stats.node_count
+    if clause.hyperedge in bound:
+        return stats.members_per_hyperedge(clause.type)
+    if clause.node in bound:
+        return members / stats.node_count
+    return members
+
+
+def plan(pattern: QueryPattern, stats: Statistics) -> List[Tuple[Clause, float]]:
+    """
+    Order clauses greedily: at each step take the clause joined to the
+    bound variables that yields the fewest estimated rows. Clauses sharing
+    no variable with the prefix are only taken when nothing else is left.
+    Returns each clause with the estimated row count after it.
+    """
+    remaining = list(pattern.clauses)
+    bound: set = set()
+    rows = 1.0
+    steps: List[Tuple[Clause, float]] = []
+    while remaining:
+        connected = [
+            clause
+            for clause in remaining
+            if not bound or bound.intersection(variables(clause))
+        ]
+        best = min(
+            connected or remaining, key=lambda clause: estimate(clause, bound, stats)
+        )
+        rows *= estimate(best, bound, stats)
+        steps.append((best, rows))
+        bound.update(variables(best))
+        remaining.remove(best)
+    return steps
+
+
+# --- Execution ---
+Row = Tuple[UUID, ...]
+
+
+class Matcher:
+    """
+    Runs a planned pattern over a graph as a pipeline of joins. Rows flow
+    through one at a time, so taking only the first matches stops every
+    join early; each join still probes its index once per distinct bound
+    value, remembering the answer for later rows.
+    """
+
+    def __init__(self, graph: Hypergraph):
+        self.graph = graph
+        self.columns: Dict[str, int] = {}
+        self.rows: Iterable[Row] = [()]
+        # Implied edges bound to an edge variable, which is not stored.
+        self.implied: Dict[UUID, Edge] = {}
+
+    def run(
+        self, steps: Iterable[Clause], limit: Optional[int] = None
+    ) -> List[Dict[str, UUID]]:
+        for clause in steps:
+            if isinstance(clause, NodePattern):
+                self.join_node(clause)
+            elif isinstance(clause, EdgePattern):
+                self.join_edge(clause)
+            else:
+                self.join_member(clause)
+        names = list(self.columns)
+        return [dict(zip(names, row)) for row in islice(self.rows, limit)]
+
+    # --- Joins ---
+    def extend(
+        self,
+        keys: Tuple[str, ...],
+        new: Tuple[str, ...],
+        expand: Callable[[Row], Iterable[Row]],
+    ) -> None:
+        """
+        Join on the bound `keys`: `expand` gives the values of the `new`
+        variables once per distinct key, and every row is followed by each
+        of them.
+        """
+        positions = [self.columns[key] for key in keys]
+        for var in new:
+            self.columns[var] = len(self.columns)
+        self.rows = self._extended(self.rows, positions, expand)
+
+    @staticmethod
+    def _extended(
+        rows: Iterable[Row],
+        positions: List[int],
+        expand: Callable[[Row], Iterable[Row]],
+    ) -> Iterator[Row]:
+        if not positions:
+            # A scan: stream it for the first row, replay it for the rest.
+            values: Optional[List[Row]] = None
+            for row in rows:
+                if values is None:
+                    values = []
+                    for value in expand(()):
+                        values.append(value)
+                        yield row + value
+                else:
+                    yield from [row + value for value in values]
+            return
+        expanded: Dict[Tuple[int, ...], List[Row]] = {}
+        for row in rows:
+            key = tuple([row[p].int for p in positions])
+            values = expanded.get(key)
+            if values is None:
+                values = expanded[key] = list(
+                    expand(tuple([row[p] for p in positions]))
+                )
+            if values:
+                yield from [row + value for value in values]
+
+    def filter(self, vars: Tuple[str, ...], keep: Callable[..., bool]) -> None:
+        """Keep the rows whose values for `vars` pass `keep`."""
+        positions = [self.columns[var] for var in vars]
+        self.rows = self._filtered(self.rows, positions, keep)
+
+    @staticmethod
+    def _filtered(
+        rows: Iterable[Row], positions: List[int], keep: Callable[..., bool]
+    ) -> Iterator[Row]:
+        verdicts: Dict[Tuple[int, ...], bool] = {}
+        for row in rows:
+            key = tuple(row[p].int for p in positions)
+            verdict = verdicts.get(key)
+            if verdict is None:
+                verdict = verdicts[key] = keep(*(row[p] for p in positions))
+            if verdict:
+                yield row
+
+    def join_node(self, clause: NodePattern) -> None:
+        nodes = self.graph.nodes
+
+        def keep(node_id: UUID) -> bool:
+            node = nodes.get(node_id)
+            return node is not None and self.matches_node(node, clause)
+
+        if clause.var in self.columns:
+            self.filter((clause.var,), keep)
+            return
+        self.extend(
+            (),
+            (clause.var,),
+            lambda _: (
+                (node.id,) for node in nodes.values() if self.matches_node(node, clause)
+            ),
+        )
+
+    def join_edge(self, clause: EdgePattern) -> None:
+        graph, index, edges = self.graph, self.graph.edge_index, self.graph.edges
+        edge_type = clause.type
+        slots = [
+            (var, attribute)
+            for var, attribute in (
+                (clause.source, "source"),
+                (clause.target, "target"),
+                (clause.var, "id"),
+            )
+            if var is not None
+        ]
+        names = list(dict.fromkeys(var for var, _ in slots))
+        keys = tuple(var for var in names if var in self.columns)
+        new = tuple(var for var in names if var not in self.columns)
+
+        if clause.var in keys:
+
+            def lookup(bound: Dict[str, UUID]) -> Iterable[Edge]:
+                edge_id = bound[clause.var]
+                edge = edges.get(edge_id) or self.implied.get(edge_id)
+                return [] if edge is None else [edge]
+
+        elif graph.inverses == "virtual" or (
+            clause.source in keys and clause.target in keys
+        ):
+            # `find_edges` walks the smaller side of a bound pair and adds
+            # the edges that `inverses="virtual"` implies.
+            def lookup(bound: Dict[str, UUID]) -> Iterable[Edge]:
+                return graph.find_edges(
+                    bound.get(clause.source), bound.get(clause.target), edge_type
+                )
+
+        elif clause.source in keys:
+
+            def lookup(bound: Dict[str, UUID]) -> Iterable[Edge]:
+                edge_ids = index.outgoing(bound[clause.source], edge_type)
+                return map(edges.__getitem__, edge_ids.values())
+
+        elif clause.target in keys:
+
+            def lookup(bound: Dict[str, UUID]) -> Iterable[Edge]:
+                edge_ids = index.incoming(bound[clause.target], edge_type)
+                return map(edges.__getitem__, edge_ids.values())
+
+        elif edge_type is None:
+
+            def lookup(bound: Dict[str, UUID]) -> Iterable[Edge]:
+                return edges.values()
+
+        else:
+
+            def lookup(bound: Dict[str, UUID]) -> Iterable[Edge]:
+                return map(edges.__getitem__, index.of_type(edge_type).values())
+
+        def expand(key: Row) -> Iterable[Row]:
+            bound = dict(zip(keys, key))
+            for edge in lookup(bound):
+                if not self.matches(edge, edge_type, clause.where):
+                    continue
+                binding: Dict[str, UUID] = dict(bound)
+                # A variable used in two slots (e.g. a self-loop) must agree.
+                if all(
+                    binding.setdefault(var, getattr(edge, attribute))
+                    == getattr(edge, attribute)
+                    for var, attribute in slots
+                ):
+                    if clause.var is not None and edge.id not in edges:
+                        self.implied[edge.id] = edge
+                    yield tuple(binding[var] for var in new)
+
+        self.extend(keys, new, expand)
+
+    def join_member(self, clause: MemberPattern) -> None:
+        graph, index = self.graph, self.graph.hyperedge_index
+
+        def members(hyperedge_id: UUID) -> List[UUID]:
+            hyperedge = graph.hyperedges.get(hyperedge_id)
+            if hyperedge is None or (
+                clause.type is not None and hyperedge.type != clause.type
+            ):
+                return []
+            if clause.role == "source":
+                nodes = hyperedge.sources
+            elif clause.role == "target":
+                nodes = hyperedge.targets
+            else:
+                nodes = hyperedge.sources + hyperedge.targets
+            # A node listed twice is still one binding.
+            return list(dict.fromkeys(nodes))
+
+        hyperedge_bound = clause.hyperedge in self.columns
+        node_bound = clause.node in self.columns
+        if hyperedge_bound and node_bound:
+            self.filter(
+                (clause.hyperedge, clause.node),
+                lambda hyperedge_id, node: node in members(hyperedge_id),
+            )
+        elif hyperedge_bound:
+            self.extend(
+                (clause.hyperedge,),
+                (clause.node,),
+                lambda key: [(node,) for node in members(key[0])],
+            )
+        elif node_bound:
+            self.extend(
+                (clause.node,),
+                (clause.hyperedge,),
+                lambda key: [
+                    (hyperedge_id,)
+                    for hyperedge_id in index.containing(
+                        key[0], clause.type, clause.role
+                    ).values()
+                ],
+            )
+        else:
+            scanned = (
+                graph.hyperedges.keys()
+                if clause.type is None
+                else index.of_type(clause.type).values()
+            )
+            self.extend(
+                (),
+                (clause.hyperedge, clause.node),
+                lambda _: (
+                    (hyperedge_id, node)
+                    for hyperedge_id in scanned
+                    for node in members(hyperedge_id)
+                ),
+            )
+
+    @classmethod
+    def matches_node(cls, node: BaseModel, clause: NodePattern) -> bool:
+        """A node pattern's type also matches registered subtypes of it."""
+        if clause.type is not None:
+            if node.type not in SchemaRegistry.node_subtypes(clause.type):
+                return False
+        return cls.matches(node, None, clause.where)
+
+    @staticmethod
+    def matches(model: BaseModel, type: Optional[str], where: Dict[str, Any]) -> bool:
+        if type is not None and model.type != type:
+            return False
+        return all(getattr(model, key, None) == value for key, value in where.items())
+
+
+def match(
+    graph: Hypergraph,
+    pattern: Union[QueryPattern, str],
+    limit: Optional[int] = None,
+) -> List[Dict[str, UUID]]:
+    if isinstance(pattern, str):
+        pattern = QueryPattern.parse(pattern)
+    steps = plan(pattern, Statistics(graph))
+    return Matcher(graph).run((clause for clause, _ in steps), limit)
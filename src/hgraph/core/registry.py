@@ -1,39 +1,193 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Dict, Type
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 if TYPE_CHECKING:
     from hgraph.core.node import Node
     from hgraph.core.edge import Edge, Hyperedge
+    from hgraph.core.config import EdgeConfig
+    from hgraph.core.validator import ValidationPlan
+
+M = TypeVar("M")
+
+
+def construct_trusted(model: Type[M], fields: Dict[str, Any]) -> M:
+    """
+    An instance of `model` holding `fields` as given, with defaults for
+    any field left out. Nothing is validated or converted, so the values
+    must already have their field types, as in records read back from a
+    store. About half the cost of `model_construct`, which resolves
+    defaults and aliases on every call.
+    """
+    if model.__private_attributes__:
+        return model.model_construct(**fields)
+    instance = object.__new__(model)
+    values = fields
+    if len(fields) != len(model.__pydantic_fields__):
+        values = {}
+        for name, info in model.__pydantic_fields__.items():
+            if name in fields:
+                values[name] = fields[name]
+            elif info.is_required():
+                # Let validation report the missing field.
+                return model.model_validate(fields)
+            else:
+                values[name] = info.get_default(
+                    call_default_factory=True, validated_data=values
+                )
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(fields))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+def stored_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    `data` without the `config` that records dumped before configs became
+    class attributes still carry; the registered class's config applies.
+    """
+    if "config" in data:
+        data = {key: value for key, value in data.items() if key != "config"}
+    return data
 
 
 class SchemaRegistry:
     node_types: Dict[str, Type[Node]] = {}
     edge_types: Dict[str, Type[Edge]] = {}
     hyperedge_types: Dict[str, Type[Hyperedge]] = {}
+    # Cache for `inverse_types`, cleared whenever an edge type registers.
+    inverse_cache: Dict[str, List[str]] = {}
+    # Cache for `node_subtypes`, cleared whenever a node type registers.
+    subtype_cache: Dict[str, FrozenSet[str]] = {}
+    # Validation plan per type, with the config it was compiled for; see
+    # `edge_plan`.
+    edge_plans: Dict[str, Tuple[object, ValidationPlan]] = {}
+    hyperedge_plans: Dict[str, Tuple[object, ValidationPlan]] = {}
 
     @classmethod
     def register_node(cls, node_type: Type[Node]):
         cls.node_types[node_type.__name__] = node_type
+        cls.subtype_cache.clear()
 
     @classmethod
     def register_edge(cls, edge_type: Type[Edge]):
         cls.edge_types[edge_type.__name__] = edge_type
+        cls.inverse_cache.clear()
+        cls.edge_plans.pop(edge_type.__name__, None)
 
     @classmethod
     def register_hyperedge(cls, hyperedge_type: Type[Hyperedge]):
         cls.hyperedge_types[hyperedge_type.__name__] = hyperedge_type
+        cls.hyperedge_plans.pop(hyperedge_type.__name__, None)
+
+    @classmethod
+    def edge_config(cls, edge_type: str) -> Optional[EdgeConfig]:
+        """Config of a registered edge type."""
+        model = cls.edge_types.get(edge_type)
+        return None if model is None else model.config
+
+    @classmethod
+    def inverse_types(cls, edge_type: str) -> List[str]:
+        """
+        Types whose edges, read backwards, are `edge_type` edges: the type
+        itself if symmetric, its declared `inverse`, and every type that
+        declares `edge_type` as its inverse. The relation is symmetric.
+        """
+        cached = cls.inverse_cache.get(edge_type)
+        if cached is not None:
+            return cached
+        types: Dict[str, None] = {}
+        config = cls.edge_config(edge_type)
+        if config is not None:
+            if config.symmetric:
+                types[edge_type] = None
+            if config.inverse is not None:
+                types[config.inverse] = None
+        for name in cls.edge_types:
+            other = cls.edge_config(name)
+            if other.inverse == edge_type:
+                types[name] = None
+        cls.inverse_cache[edge_type] = list(types)
+        return cls.inverse_cache[edge_type]
+
+    @classmethod
+    def edge_plan(cls, edge: Edge) -> ValidationPlan:
+        """
+        The checks `edge`'s type needs, compiled once per type: those of
+        its config, then its custom rules (see `hgraph.core.rules`).
+        Configs are frozen class attributes, so an identity check tells
+        whether the class config was replaced since.
+        """
+        cached = cls.edge_plans.get(edge.type)
+        if cached is not None and cached[0] is edge.config:
+            return cached[1]
+        from hgraph.core.validator import compile_edge_plan
+
+        plan = cls._type_plan(edge, cls.edge_types, compile_edge_plan)
+        cls.edge_plans[edge.type] = (edge.config, plan)
+        return plan
+
+    @classmethod
+    def hyperedge_plan(cls, hyperedge: Hyperedge) -> ValidationPlan:
+        """Hyperedge counterpart of `edge_plan`."""
+        cached = cls.hyperedge_plans.get(hyperedge.type)
+        if cached is not None and cached[0] is hyperedge.config:
+            return cached[1]
+        from hgraph.core.validator import compile_hyperedge_plan
+
+        plan = cls._type_plan(hyperedge, cls.hyperedge_types, compile_hyperedge_plan)
+        cls.hyperedge_plans[hyperedge.type] = (hyperedge.config, plan)
+        return plan
+
+    @classmethod
+    def _type_plan(cls, record, types: dict, compile) -> ValidationPlan:
+        from hgraph.core.rules import custom_rules
+        from hgraph.core.validator import ValidationPlan
+
+        plan = compile(record.config)
+        rules = custom_rules(types.get(record.type, type(record)))
+        if rules:
+            plan = ValidationPlan(plan.checks + rules, plan.endpoints)
+        return plan
+
+    @classmethod
+    def node_subtypes(cls, node_type: str) -> FrozenSet[str]:
+        """Names of `node_type` and of every registered subclass of it."""
+        cached = cls.subtype_cache.get(node_type)
+        if cached is not None:
+            return cached
+        base = cls.node_types.get(node_type)
+        names = {node_type}
+        if base is not None:
+            names.update(
+                name
+                for name, model in cls.node_types.items()
+                if issubclass(model, base)
+            )
+        cls.subtype_cache[node_type] = frozenset(names)
+        return cls.subtype_cache[node_type]
 
     @classmethod
     def load_node(cls, data: dict) -> Node:
         node_class = cls.node_types[data["type"]]
-        return node_class.model_validate(data)
+        return node_class.model_validate(stored_fields(data))
 
     @classmethod
     def load_edge(cls, data: dict) -> Edge:
         edge_class = cls.edge_types[data["type"]]
-        return edge_class.model_validate(data)
+        return edge_class.model_validate(stored_fields(data))
 
     @classmethod
     def load_hyperedge(cls, data: dict) -> Hyperedge:
         edge_class = cls.hyperedge_types[data["type"]]
-        return edge_class.model_validate(data)
+        return edge_class.model_validate(stored_fields(data))
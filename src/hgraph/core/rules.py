@@ -0,0 +1,227 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from uuid import UUID
+
+from hgraph.core.index import Bucket, Role
+
+if TYPE_CHECKING:
+    from hgraph.core.edge import Edge, Hyperedge
+    from hgraph.core.validator import ConstraintValidator
+
+# -----------------------------
+# Custom constraints with declared lookups
+# -----------------------------
+#
+# A custom rule is a method of an edge or hyperedge class decorated with
+# `@validator(...)`. Instead of reading the graph itself, it declares the
+# lookups it needs as keyword arguments, and the validator answers each
+# one from the maintained indexes before calling it:
+#
+#     class Employs(Edge):
+#         @validator(staff=EdgesFrom("Employs", count=True))
+#         def at_most_fifty(self, staff: int) -> bool:
+#             return staff < 50
+#
+# A lookup's `node` names a field of the record being inserted, so
+# `EdgesFrom("Employs")` is "Employs edges from this record's source". A
+# rule passes by returning anything but `False`; it may also raise a
+# `ConstraintViolation` with its own message. Rules are inherited by
+# subclasses and compiled into the type's validation plan, so only the
+# rules of the inserted type run, each costing a few hash lookups however
+# large the graph is.
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+Record = Union["Edge", "Hyperedge"]
+
+# Attribute a decorated method carries its declared lookups in.
+LOOKUPS = "__hgraph_lookups__"
+
+
+class Lookup(ABC):
+    """
+    An index query a rule declares, resolved against the record being
+    validated. Records never see themselves: on an update the record is
+    already indexed under its own id, and that entry is left out.
+
+    `node` names the record field holding the node to look up. If the
+    field is a list (a hyperedge side), the result maps each member to
+    its own answer. With `count=True` the answer is the number of matches
+    instead of the matching ids. Subclasses say which index bucket
+    answers the query for one node.
+    """
+
+    def __init__(self, node: str, count: bool = False):
+        self.node = node
+        self.count = count
+
+    def resolve(self, validator: ConstraintValidator, record: Record) -> Any:
+        value = getattr(record, self.node)
+        if isinstance(value, UUID):
+            return self._answer(self.bucket(validator, record, value), record.id)
+        return {
+            node: self._answer(self.bucket(validator, record, node), record.id)
+            for node in value
+        }
+
+    def read(self, validator: ConstraintValidator, record: Record) -> Set[UUID]:
+        """Ids of the other records `resolve` answers from."""
+        value = getattr(record, self.node)
+        nodes = [value] if isinstance(value, UUID) else value
+        found = {
+            record_id
+            for node in nodes
+            for record_id in self.bucket(validator, record, node).values()
+        }
+        found.discard(record.id)
+        return found
+
+    @abstractmethod
+    def bucket(
+        self, validator: ConstraintValidator, record: Record, node: UUID
+    ) -> Bucket:
+        """The ids matching the query for `node`, a value of the `node` field."""
+
+    def _answer(self, bucket: Bucket, own_id: UUID) -> Union[int, Bucket]:
+        if own_id.int in bucket:
+            if self.count:
+                return len(bucket) - 1
+            bucket = {key: value for key, value in bucket.items() if value != own_id}
+        return len(bucket) if self.count else bucket
+
+
+class EdgesFrom(Lookup):
+    """`edge_type` edges whose source is the record's `node`."""
+
+    def __init__(self, edge_type: str, node: str = "source", count: bool = False):
+        super().__init__(node, count)
+        self.edge_type = edge_type
+
+    def bucket(
+        self, validator: ConstraintValidator, record: Record, node: UUID
+    ) -> Bucket:
+        return validator.edge_index.from_source(self.edge_type, node)
+
+
+class EdgesTo(Lookup):
+    """`edge_type` edges whose target is the record's `node`."""
+
+    def __init__(self, edge_type: str, node: str = "target", count: bool = False):
+        super().__init__(node, count)
+        self.edge_type = edge_type
+
+    def bucket(
+        self, validator: ConstraintValidator, record: Record, node: UUID
+    ) -> Bucket:
+        return validator.edge_index.to_target(self.edge_type, node)
+
+
+class EdgesBetween(Lookup):
+    """`edge_type` edges from the record's `source` field to its `target`."""
+
+    def __init__(
+        self,
+        edge_type: str,
+        source: str = "source",
+        target: str = "target",
+        count: bool = False,
+    ):
+        super().__init__(source, count)
+        self.edge_type = edge_type
+        self.target = target
+
+    def bucket(
+        self, validator: ConstraintValidator, record: Record, node: UUID
+    ) -> Bucket:
+        target = getattr(record, self.target)
+        return validator.edge_index.between(self.edge_type, node, target)
+
+
+class HyperedgesContaining(Lookup):
+    """
+    Hyperedges that have the record's `node` among their members, of any
+    type unless `edge_type` is given, on either side unless `role` is.
+    """
+
+    def __init__(
+        self,
+        node: str,
+        edge_type: Optional[str] = None,
+        role: Optional[Role] = None,
+        count: bool = False,
+    ):
+        super().__init__(node, count)
+        self.edge_type = edge_type
+        self.role = role
+
+    def bucket(
+        self, validator: ConstraintValidator, record: Record, node: UUID
+    ) -> Bucket:
+        return validator.hyperedge_index.containing(node, self.edge_type, self.role)
+
+
+def validator(**lookups: Lookup) -> Callable[[F], F]:
+    """Mark a model method as a custom rule that receives `lookups`."""
+
+    def mark(method: F) -> F:
+        setattr(method, LOOKUPS, lookups)
+        return method
+
+    return mark
+
+
+class CustomRule:
+    """A decorated method bound to its lookups, run as a plan check."""
+
+    __slots__ = ("name", "method", "lookups")
+
+    def __init__(self, name: str, method: Callable, lookups: Dict[str, Lookup]):
+        self.name = name
+        self.method = method
+        self.lookups = lookups
+
+    def __call__(
+        self, validator: ConstraintValidator, record: Record, *keys: Any
+    ) -> None:
+        from hgraph.core.validator import ConstraintViolation
+
+        answers = {
+            name: lookup.resolve(validator, record)
+            for name, lookup in self.lookups.items()
+        }
+        if self.method(record, **answers) is False:
+            raise ConstraintViolation(f"{record.type} violates {self.name}")
+
+    def read(self, validator: ConstraintValidator, record: Record) -> Set[UUID]:
+        """Ids of the other records the rule's verdict on `record` depends on."""
+        return {
+            record_id
+            for lookup in self.lookups.values()
+            for record_id in lookup.read(validator, record)
+        }
+
+
+def custom_rules(model: type) -> Tuple[CustomRule, ...]:
+    """The rules `model` declares or inherits; a subclass may override one."""
+    methods: Dict[str, Callable] = {}
+    for klass in reversed(model.__mro__):
+        for name, value in vars(klass).items():
+            if callable(value) and hasattr(value, LOOKUPS):
+                methods[name] = value
+            elif name in methods:
+                del methods[name]
+    return tuple(
+        CustomRule(name, method, getattr(method, LOOKUPS))
+        for name, method in methods.items()
+    )
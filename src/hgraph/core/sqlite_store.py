@@ -0,0 +1,537 @@
+from __future__ import annotations
+import json
+import sqlite3
+from collections.abc import ItemsView, ValuesView
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from hgraph.core.bloom import BloomFilter
+from hgraph.core.node import Node
+from hgraph.core.edge import Edge, Hyperedge
+from hgraph.core.index import Bucket, HyperedgeIndex, NodeKey, Role
+from hgraph.core.registry import SchemaRegistry, stored_fields
+
+# -----------------------------
+# SQLite storage backend
+# -----------------------------
+#
+# Ids are 16-byte blobs. Each record keeps its structural fields in typed
+# columns and everything a subclass adds in a JSON `data` column. The
+# constraint lookups used by `ConstraintValidator` are indexed queries, so
+# validation keeps working when the graph does not fit in memory.
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS nodes (
+    id BLOB PRIMARY KEY,
+    type TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS nodes_type ON nodes (type);
+
+CREATE TABLE IF NOT EXISTS edges (
+    id BLOB PRIMARY KEY,
+    type TEXT NOT NULL,
+    source BLOB NOT NULL,
+    target BLOB NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS edges_type_source_target
+    ON edges (type, source, target);
+CREATE INDEX IF NOT EXISTS edges_type_target ON edges (type, target);
+CREATE INDEX IF NOT EXISTS edges_source ON edges (source);
+CREATE INDEX IF NOT EXISTS edges_target ON edges (target);
+
+CREATE TABLE IF NOT EXISTS hyperedges (
+    id BLOB PRIMARY KEY,
+    type TEXT NOT NULL,
+    sources BLOB NOT NULL,
+    targets BLOB NOT NULL,
+    sources_key BLOB NOT NULL,
+    targets_key BLOB NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS hyperedges_type_members
+    ON hyperedges (type, sources_key, targets_key);
+CREATE INDEX IF NOT EXISTS hyperedges_type_targets ON hyperedges (type, targets_key);
+
+CREATE TABLE IF NOT EXISTS hyperedge_members (
+    hyperedge_id BLOB NOT NULL,
+    node_id BLOB NOT NULL,
+    type TEXT NOT NULL,
+    role TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (hyperedge_id, role, position)
+);
+CREATE INDEX IF NOT EXISTS hyperedge_members_node
+    ON hyperedge_members (node_id, type, role);
+"""
+
+NODE_COLUMNS = frozenset({"id", "type"})
+EDGE_COLUMNS = frozenset({"id", "type", "source", "target"})
+HYPEREDGE_COLUMNS = frozenset({"id", "type", "sources", "targets"})
+
+
+def pack_ids(ids: Iterable[int]) -> bytes:
+    return b"".join(i.to_bytes(16, "big") for i in ids)
+
+
+def unpack_ids(blob: bytes) -> list[UUID]:
+    return [UUID(bytes=blob[i : i + 16]) for i in range(0, len(blob), 16)]
+
+
+def encode_key(key: NodeKey) -> bytes:
+    """Blob form of a canonical hyperedge side (see `canonical_nodes`)."""
+    return pack_ids(sorted(key) if isinstance(key, frozenset) else key)
+
+
+def encode_data(model: BaseModel, columns: frozenset) -> str:
+    """JSON for the fields a subclass adds on top of the typed columns."""
+    fields = {name for name in type(model).model_fields if name not in columns}
+    return model.model_dump_json(include=fields) if fields else "{}"
+
+
+def bucket_of(rows: Iterable[Tuple[bytes]]) -> Bucket:
+    bucket = {}
+    for (blob,) in rows:
+        record_id = UUID(bytes=blob)
+        bucket[record_id.int] = record_id
+    return bucket
+
+
+# Ids bound per `IN (...)` query, below SQLite's historical limit of 999.
+IN_BATCH = 500
+
+
+class SQLiteStore:
+    """
+    `GraphStore` backed by a SQLite database file.
+
+    Writes are grouped into transactions of up to `commit_every`
+    statements; call `commit()` (or `close()`) to make them durable. Reads
+    on the same store always see uncommitted writes. The `nodes`, `edges`
+    and `hyperedges` mappings stream rows from paged cursors instead of
+    materialising lists.
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        commit_every: int = 10_000,
+        page_size: int = 1_000,
+    ):
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        self.commit_every = commit_every
+        self.page_size = page_size
+        self._pending = 0
+        # Built on the first `node_types` call, then kept up to date.
+        self.node_filter: Optional[BloomFilter] = None
+
+        self.nodes = SQLiteRecords(self, "nodes", self.node_from_row, "id, type, data")
+        self.edges = SQLiteRecords(
+            self, "edges", self.edge_from_row, "id, type, source, target, data"
+        )
+        self.hyperedges = SQLiteRecords(
+            self,
+            "hyperedges",
+            self.hyperedge_from_row,
+            "id, type, sources, targets, data",
+        )
+        self.edge_index = SQLiteEdgeIndex(self)
+        self.hyperedge_index = SQLiteHyperedgeIndex(self)
+
+    # --- Transactions ---
+    def execute(self, sql: str, parameters: tuple = ()) -> sqlite3.Cursor:
+        return self.connection.execute(sql, parameters)
+
+    def _wrote(self, statements: int = 1) -> None:
+        self._pending += statements
+        if self._pending >= self.commit_every:
+            self.commit()
+
+    def commit(self) -> None:
+        self.connection.commit()
+        self._pending = 0
+
+    def close(self) -> None:
+        self.commit()
+        self.connection.close()
+
+    # --- Row decoding ---
+    @staticmethod
+    def node_from_row(row: tuple) -> Node:
+        record_id, type_name, data = row
+        model = SchemaRegistry.node_types.get(type_name, Node)
+        # Typed columns need no validation; only JSON-encoded fields do.
+        if data == "{}":
+            return model.trusted(id=UUID(bytes=record_id), type=type_name)
+        return model.model_validate(
+            {
+                "id": UUID(bytes=record_id),
+                "type": type_name,
+                **stored_fields(json.loads(data)),
+            }
+        )
+
+    @staticmethod
+    def edge_from_row(row: tuple) -> Edge:
+        record_id, type_name, source, target, data = row
+        model = SchemaRegistry.edge_types.get(type_name, Edge)
+        if data == "{}":
+            return model.trusted(
+                id=UUID(bytes=record_id),
+                type=type_name,
+                source=UUID(bytes=source),
+                target=UUID(bytes=target),
+            )
+        return model.model_validate(
+            {
+                "id": UUID(bytes=record_id),
+                "type": type_name,
+                "source": UUID(bytes=source),
+                "target": UUID(bytes=target),
+                **stored_fields(json.loads(data)),
+            }
+        )
+
+    @staticmethod
+    def hyperedge_from_row(row: tuple) -> Hyperedge:
+        record_id, type_name, sources, targets, data = row
+        model = SchemaRegistry.hyperedge_types.get(type_name, Hyperedge)
+        if data == "{}":
+            return model.trusted(
+                id=UUID(bytes=record_id),
+                type=type_name,
+                sources=unpack_ids(sources),
+                targets=unpack_ids(targets),
+            )
+        return model.model_validate(
+            {
+                "id": UUID(bytes=record_id),
+                "type": type_name,
+                "sources": unpack_ids(sources),
+                "targets": unpack_ids(targets),
+                **stored_fields(json.loads(data)),
+            }
+        )
+
+    # --- Nodes ---
+    def put_node(self, node: Node) -> None:
+        self.execute(
+            "INSERT OR REPLACE INTO nodes (id, type, data) VALUES (?, ?, ?)",
+            (node.id.bytes, node.type, encode_data(node, NODE_COLUMNS)),
+        )
+        self._wrote()
+        if self.node_filter is not None:
+            self._remember_node(node.id)
+
+    def put_nodes(self, nodes: Iterable[Node]) -> None:
+        rows = [
+            (node.id.bytes, node.type, encode_data(node, NODE_COLUMNS))
+            for node in nodes
+        ]
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO nodes (id, type, data) VALUES (?, ?, ?)", rows
+        )
+        self._wrote(len(rows))
+        if self.node_filter is not None:
+            for row in rows:
+                self._remember_node(UUID(bytes=row[0]))
+
+    def pop_node(self, node_id: UUID) -> Optional[Node]:
+        node = self.nodes.get(node_id)
+        if node is not None:
+            self.execute("DELETE FROM nodes WHERE id = ?", (node_id.bytes,))
+            self._wrote()
+        return node
+
+    def node_types(self, node_ids: Iterable[UUID]) -> Dict[UUID, str]:
+        """
+        Ids the Bloom filter rules out are answered without a query; the
+        rest are looked up `IN_BATCH` at a time.
+        """
+        if self.node_filter is None:
+            count = self.execute("SELECT COUNT(*) FROM nodes").fetchone()[0]
+            ids = self.connection.execute("SELECT id FROM nodes")
+            self.node_filter = BloomFilter.of(
+                (int.from_bytes(blob, "big") for (blob,) in ids), count
+            )
+        node_filter = self.node_filter
+        candidates = [node_id for node_id in node_ids if node_id.int in node_filter]
+        found: Dict[UUID, str] = {}
+        for start in range(0, len(candidates), IN_BATCH):
+            page = candidates[start : start + IN_BATCH]
+            placeholders = ", ".join("?" * len(page))
+            rows = self.execute(
+                f"SELECT id, type FROM nodes WHERE id IN ({placeholders})",
+                tuple(node_id.bytes for node_id in page),
+            )
+            found.update((UUID(bytes=blob), type_name) for blob, type_name in rows)
+        return found
+
+    def _remember_node(self, node_id: UUID) -> None:
+        self.node_filter.add(node_id.int)
+        if self.node_filter.full:
+            # Rebuilt with room to grow on the next lookup.
+            self.node_filter = None
+
+    # --- Edges ---
+    def put_edge(self, edge: Edge) -> None:
+        self.execute(
+            "INSERT OR REPLACE INTO edges (id, type, source, target, data) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                edge.id.bytes,
+                edge.type,
+                edge.source.bytes,
+                edge.target.bytes,
+                encode_data(edge, EDGE_COLUMNS),
+            ),
+        )
+        self._wrote()
+
+    def put_edges(self, edges: List[Edge]) -> None:
+        rows = [
+            (
+                edge.id.bytes,
+                edge.type,
+                edge.source.bytes,
+                edge.target.bytes,
+                encode_data(edge, EDGE_COLUMNS),
+            )
+            for edge in edges
+        ]
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO edges (id, type, source, target, data) "
+            "VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        self._wrote(len(rows))
+
+    def pop_edge(self, edge_id: UUID) -> Optional[Edge]:
+        edge = self.edges.get(edge_id)
+        if edge is not None:
+            self.execute("DELETE FROM edges WHERE id = ?", (edge_id.bytes,))
+            self._wrote()
+        return edge
+
+    # --- Hyperedges ---
+    def put_hyperedge(self, hyperedge: Hyperedge) -> None:
+        self._delete_members(hyperedge.id)
+        sources_key, targets_key = HyperedgeIndex.keys(hyperedge)
+        self.execute(
+            "INSERT OR REPLACE INTO hyperedges "
+            "(id, type, sources, targets, sources_key, targets_key, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                hyperedge.id.bytes,
+                hyperedge.type,
+                pack_ids(n.int for n in hyperedge.sources),
+                pack_ids(n.int for n in hyperedge.targets),
+                encode_key(sources_key),
+                encode_key(targets_key),
+                encode_data(hyperedge, HYPEREDGE_COLUMNS),
+            ),
+        )
+        members = [
+            (hyperedge.id.bytes, node.bytes, hyperedge.type, role, position)
+            for role, nodes in (
+                ("source", hyperedge.sources),
+                ("target", hyperedge.targets),
+            )
+            for position, node in enumerate(nodes)
+        ]
+        self.connection.executemany(
+            "INSERT INTO hyperedge_members "
+            "(hyperedge_id, node_id, type, role, position) VALUES (?, ?, ?, ?, ?)",
+            members,
+        )
+        self._wrote(1 + len(members))
+
+    def pop_hyperedge(self, hyperedge_id: UUID) -> Optional[Hyperedge]:
+        hyperedge = self.hyperedges.get(hyperedge_id)
+        if hyperedge is not None:
+            self.execute("DELETE FROM hyperedges WHERE id = ?", (hyperedge_id.bytes,))
+            self._delete_members(hyperedge_id)
+            self._wrote(2)
+        return hyperedge
+
+    def _delete_members(self, hyperedge_id: UUID) -> None:
+        self.execute(
+            "DELETE FROM hyperedge_members WHERE hyperedge_id = ?",
+            (hyperedge_id.bytes,),
+        )
+
+
+class SQLiteRecords(Mapping[UUID, BaseModel]):
+    """Read-only mapping over one table; iteration pages through a cursor."""
+
+    def __init__(
+        self,
+        store: SQLiteStore,
+        table: str,
+        decode: Callable[[tuple], BaseModel],
+        columns: str,
+    ):
+        self.store = store
+        self.table = table
+        self.decode = decode
+        self.columns = columns
+
+    def __getitem__(self, record_id: UUID) -> BaseModel:
+        row = self.store.execute(
+            f"SELECT {self.columns} FROM {self.table} WHERE id = ?",
+            (record_id.bytes,),
+        ).fetchone()
+        if row is None:
+            raise KeyError(record_id)
+        return self.decode(row)
+
+    def __contains__(self, record_id: object) -> bool:
+        if not isinstance(record_id, UUID):
+            return False
+        return (
+            self.store.execute(
+                f"SELECT 1 FROM {self.table} WHERE id = ?", (record_id.bytes,)
+            ).fetchone()
+            is not None
+        )
+
+    def __iter__(self) -> Iterator[UUID]:
+        for (blob,) in self._paged(f"SELECT id FROM {self.table}"):
+            yield UUID(bytes=blob)
+
+    def __len__(self) -> int:
+        return self.store.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def values(self) -> ValuesView:
+        return SQLiteValues(self)
+
+    def items(self) -> ItemsView:
+        return SQLiteItems(self)
+
+    def iter_rows(self) -> Iterator[BaseModel]:
+        for row in self._paged(f"SELECT {self.columns} FROM {self.table}"):
+            yield self.decode(row)
+
+    def _paged(self, sql: str) -> Iterator[tuple]:
+        # A dedicated cursor, so writes made while iterating do not reset it.
+        cursor = self.store.connection.cursor()
+        cursor.execute(sql)
+        while rows := cursor.fetchmany(self.store.page_size):
+            yield from rows
+
+
+class SQLiteValues(ValuesView):
+    def __iter__(self) -> Iterator[BaseModel]:
+        return self._mapping.iter_rows()
+
+
+class SQLiteItems(ItemsView):
+    def __iter__(self) -> Iterator[Tuple[UUID, BaseModel]]:
+        for model in self._mapping.iter_rows():
+            yield model.id, model
+
+
+class SQLiteEdgeIndex:
+    """`EdgeLookup` answered by indexed queries on the `edges` table."""
+
+    def __init__(self, store: SQLiteStore):
+        self.store = store
+
+    def _ids(self, where: str, parameters: tuple) -> Bucket:
+        return bucket_of(
+            self.store.execute(f"SELECT id FROM edges WHERE {where}", parameters)
+        )
+
+    def from_source(self, edge_type: str, source: UUID) -> Bucket:
+        return self._ids("type = ? AND source = ?", (edge_type, source.bytes))
+
+    def to_target(self, edge_type: str, target: UUID) -> Bucket:
+        return self._ids("type = ? AND target = ?", (edge_type, target.bytes))
+
+    def between(self, edge_type: str, source: UUID, target: UUID) -> Bucket:
+        return self._ids(
+            "type = ? AND source = ? AND target = ?",
+            (edge_type, source.bytes, target.bytes),
+        )
+
+    def of_type(self, edge_type: str) -> Bucket:
+        return self._ids("type = ?", (edge_type,))
+
+    def outgoing(self, node: UUID, edge_type: Optional[str] = None) -> Bucket:
+        if edge_type is not None:
+            return self.from_source(edge_type, node)
+        return self._ids("source = ?", (node.bytes,))
+
+    def incoming(self, node: UUID, edge_type: Optional[str] = None) -> Bucket:
+        if edge_type is not None:
+            return self.to_target(edge_type, node)
+        return self._ids("target = ?", (node.bytes,))
+
+
+class SQLiteHyperedgeIndex:
+    """`HyperedgeLookup` answered by indexed queries."""
+
+    def __init__(self, store: SQLiteStore):
+        self.store = store
+
+    def _ids(self, where: str, parameters: tuple) -> Bucket:
+        return bucket_of(
+            self.store.execute(f"SELECT id FROM hyperedges WHERE {where}", parameters)
+        )
+
+    def with_sources(self, edge_type: str, sources: NodeKey) -> Bucket:
+        return self._ids(
+            "type = ? AND sources_key = ?", (edge_type, encode_key(sources))
+        )
+
+    def with_targets(self, edge_type: str, targets: NodeKey) -> Bucket:
+        return self._ids(
+            "type = ? AND targets_key = ?", (edge_type, encode_key(targets))
+        )
+
+    def with_members(
+        self, edge_type: str, sources: NodeKey, targets: NodeKey
+    ) -> Bucket:
+        return self._ids(
+            "type = ? AND sources_key = ? AND targets_key = ?",
+            (edge_type, encode_key(sources), encode_key(targets)),
+        )
+
+    def of_type(self, edge_type: str) -> Bucket:
+        return self._ids("type = ?", (edge_type,))
+
+    def containing(
+        self,
+        node: UUID,
+        edge_type: Optional[str] = None,
+        role: Optional[Role] = None,
+    ) -> Bucket:
+        where = ["node_id = ?"]
+        parameters: list = [node.bytes]
+        if edge_type is not None:
+            where.append("type = ?")
+            parameters.append(edge_type)
+        if role is not None:
+            where.append("role = ?")
+            parameters.append(role)
+        rows = self.store.execute(
+            "SELECT DISTINCT hyperedge_id FROM hyperedge_members WHERE "
+            + " AND ".join(where),
+            tuple(parameters),
+        )
+        return bucket_of(rows)
@@ -0,0 +1,111 @@
+from __future__ import annotations
+from typing import Dict, Iterable, List, Mapping, Optional, Protocol, runtime_checkable
+from uuid import UUID
+
+from hgraph.core.node import Node
+from hgraph.core.edge import Edge, Hyperedge
+from hgraph.core.index import EdgeIndex, EdgeLookup, HyperedgeIndex, HyperedgeLookup
+
+
+@runtime_checkable
+class GraphStore(Protocol):
+    """
+    Storage backend behind `Hypergraph`.
+
+    A store owns the node, edge and hyperedge records together with the
+    indexes over them, and keeps the two consistent on every write. Reads
+    go through the read-only mappings and the index lookups, so the CRUD
+    and query API of `Hypergraph` is the same for every backend.
+    """
+
+    nodes: Mapping[UUID, Node]
+    edges: Mapping[UUID, Edge]
+    hyperedges: Mapping[UUID, Hyperedge]
+    edge_index: EdgeLookup
+    hyperedge_index: HyperedgeLookup
+
+    def put_node(self, node: Node) -> None: ...
+
+    def put_nodes(self, nodes: Iterable[Node]) -> None: ...
+
+    def pop_node(self, node_id: UUID) -> Optional[Node]: ...
+
+    def node_types(self, node_ids: Iterable[UUID]) -> Dict[UUID, str]:
+        """Type name of each given id that is a stored node; others are left out."""
+        ...
+
+    def put_edge(self, edge: Edge) -> None:
+        """Insert `edge`, replacing (and unindexing) any edge with its id."""
+        ...
+
+    def put_edges(self, edges: List[Edge]) -> None:
+        """Insert a batch of edges, none of whose ids is stored yet."""
+        ...
+
+    def pop_edge(self, edge_id: UUID) -> Optional[Edge]: ...
+
+    def put_hyperedge(self, hyperedge: Hyperedge) -> None: ...
+
+    def pop_hyperedge(self, hyperedge_id: UUID) -> Optional[Hyperedge]: ...
+
+
+class InMemoryStore:
+    """Default `GraphStore`: plain dicts of models plus hash indexes."""
+
+    def __init__(self):
+        self.nodes: Dict[UUID, Node] = {}
+        self.edges: Dict[UUID, Edge] = {}
+        self.hyperedges: Dict[UUID, Hyperedge] = {}
+        self.edge_index = EdgeIndex()
+        self.hyperedge_index = HyperedgeIndex()
+
+    # --- Nodes ---
+    def put_node(self, node: Node) -> None:
+        self.nodes[node.id] = node
+
+    def put_nodes(self, nodes: Iterable[Node]) -> None:
+        self.nodes.update((node.id, node) for node in nodes)
+
+    def pop_node(self, node_id: UUID) -> Optional[Node]:
+        return self.nodes.pop(node_id, None)
+
+    def node_types(self, node_ids: Iterable[UUID]) -> Dict[UUID, str]:
+        nodes = self.nodes
+        found = {}
+        for node_id in node_ids:
+            node = nodes.get(node_id)
+            if node is not None:
+                found[node_id] = node.type
+        return found
+
+    # --- Edges ---
+    def put_edge(self, edge: Edge) -> None:
+        previous = self.edges.get(edge.id)
+        if previous is not None:
+            self.edge_index.remove(previous)
+        self.edges[edge.id] = edge
+        self.edge_index.add(edge)
+
+    def put_edges(self, edges: List[Edge]) -> None:
+        self.edges.update((edge.id, edge) for edge in edges)
+        self.edge_index.add_all(edges)
+
+    def pop_edge(self, edge_id: UUID) -> Optional[Edge]:
+        edge = self.edges.pop(edge_id, None)
+        if edge is not None:
+            self.edge_index.remove(edge)
+        return edge
+
+    # --- Hyperedges ---
+    def put_hyperedge(self, hyperedge: Hyperedge) -> None:
+        previous = self.hyperedges.get(hyperedge.id)
+        if previous is not None:
+            self.hyperedge_index.remove(previous)
+        self.hyperedges[hyperedge.id] = hyperedge
+        self.hyperedge_index.add(hyperedge)
+
+    def pop_hyperedge(self, hyperedge_id: UUID) -> Optional[Hyperedge]:
+        hyperedge = self.hyperedges.pop(hyperedge_id, None)
+        if hyperedge is not None:
+            self.hyperedge_index.remove(hyperedge)
+        return hyperedge
@@ -0,0 +1,111 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Dict, List, Literal, Tuple
+from uuid import UUID
+
+if TYPE_CHECKING:
+    from hgraph.core.hypergraph import Hypergraph
+
+# -----------------------------
+# Undo log for Hypergraph.transaction()
+# -----------------------------
+#
+# Every write made while a transaction is open logs the record it replaces
+# (or None when it inserts). Rolling back replays the log backwards straight
+# against the store, so its cost is proportional to the number of writes,
+# not to the size of the graph. Like `_insert_batch`, the log is kept as
+# parallel lists so logging allocates no tuples.
+#
+# Store indexes stay live, since validating later writes in the transaction
+# reads them. Transitive closures are derived data that validation never
+# reads, so their maintenance is deferred: commit applies the net change
+# per record once, and a rollback leaves them untouched. Until commit,
+# reachability queries do not see the transaction's writes.
+
+Kind = Literal["nodes", "edges", "hyperedges"]
+
+
+class Transaction:
+    """Undo log of one `Hypergraph.transaction()` block."""
+
+    def __init__(self, graph: Hypergraph):
+        self.graph = graph
+        self.kinds: List[Kind] = []
+        self.ids: List[UUID] = []
+        self.previous: list = []
+        # Closures that existed when the transaction opened; any built
+        # inside it are rebuilt on commit and dropped on rollback.
+        self.closure_types = set(graph.closures)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def record(self, kind: Kind, record_id: UUID, previous: object) -> None:
+        self.kinds.append(kind)
+        self.ids.append(record_id)
+        self.previous.append(previous)
+
+    def rollback(self, savepoint: int = 0) -> None:
+        """Undo every write logged after `savepoint`, newest first."""
+        store = self.graph.store
+        entries = zip(
+            reversed(self.kinds[savepoint:]),
+            reversed(self.ids[savepoint:]),
+            reversed(self.previous[savepoint:]),
+        )
+        for kind, record_id, previous in entries:
+            if kind == "nodes":
+                if previous is None:
+                    store.pop_node(record_id)
+                else:
+                    store.put_node(previous)
+            elif kind == "edges":
+                if previous is None:
+                    store.pop_edge(record_id)
+                else:
+                    store.put_edge(previous)
+            elif previous is None:
+                store.pop_hyperedge(record_id)
+            else:
+                store.put_hyperedge(previous)
+        del self.kinds[savepoint:]
+        del self.ids[savepoint:]
+        del self.previous[savepoint:]
+        closures = self.graph.closures
+        for type_name in set(closures) - self.closure_types:
+            del closures[type_name]
+
+    def commit(self) -> None:
+        """Bring the closures up to date with the net change of each record."""
+        graph = self.graph
+        for type_name in set(graph.closures) - self.closure_types:
+            graph.infer_transitive_closure(type_name)
+        closures = {
+            type_name: graph.closures[type_name]
+            for type_name in self.closure_types
+            if type_name in graph.closures
+        }
+        if not closures:
+            return
+        original: Dict[Tuple[Kind, UUID], object] = {}
+        for kind, record_id, previous in zip(self.kinds, self.ids, self.previous):
+            if kind != "nodes":
+                original.setdefault((kind, record_id), previous)
+        removed: Dict[str, List[Tuple[UUID, UUID]]] = {}
+        added: Dict[str, List[Tuple[UUID, UUID]]] = {}
+        for (kind, record_id), before in original.items():
+            records = graph.edges if kind == "edges" else graph.hyperedges
+            after = records.get(record_id)
+            if before == after:
+                continue
+            for record, links in ((before, removed), (after, added)):
+                if record is None:
+                    continue
+                for type_name, link in graph._closure_links(record):
+                    if type_name in closures:
+                        links.setdefault(type_name, []).append(link)
+        # Removals first, batched, so each closure recomputes once.
+        for type_name, links in removed.items():
+            closures[type_name].remove_links(links)
+        for type_name, links in added.items():
+            for source, target in links:
+                closures[type_name].add_link(source, target)
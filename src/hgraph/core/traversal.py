@@ -0,0 +1,214 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+if TYPE_CHECKING:
+    from hgraph.core.hypergraph import Direction, Hypergraph
+
+# -----------------------------
+# Bounded path search and k-hop traversal
+# -----------------------------
+#
+# Hops follow binary edges and, optionally, hyperedges read as bipartite
+# hops: a node on the source side reaches every node on the target side
+# through the hyperedge in one hop. Visited sets and parent pointers are
+# keyed by `id.int`, like the index buckets, and neighbors come straight
+# from the adjacency indexes, so a search touches only the nodes it visits.
+
+REVERSED: Dict[str, str] = {"out": "in", "in": "out", "both": "both"}
+
+# Visited node -> (node, parent key or None, link from the parent, depth).
+Visited = Dict[int, Tuple[UUID, Optional[int], Optional[UUID], int]]
+
+
+class Path(BaseModel):
+    nodes: List[UUID] = Field(default_factory=list)
+    links: List[UUID] = Field(default_factory=list)
+    """`links[i]` is the edge or hyperedge joining `nodes[i]` to `nodes[i + 1]`."""
+
+    @property
+    def length(self) -> int:
+        return len(self.links)
+
+
+class Traversal:
+    """Hop rules for one search: edge type, direction and hyperedge hops."""
+
+    def __init__(
+        self,
+        graph: Hypergraph,
+        type: Optional[str] = None,
+        direction: Direction = "out",
+        hyperedges: bool = False,
+    ):
+        self.graph = graph
+        self.type = type
+        self.direction = direction
+        self.hyperedges = hyperedges
+
+    def hops(self, node: UUID, forward: bool = True) -> List[Tuple[UUID, UUID]]:
+        """`(neighbor, link)` for every hop from `node`, or into it if not `forward`."""
+        graph, type = self.graph, self.type
+        direction = self.direction if forward else REVERSED[self.direction]
+        edges, index = graph.edges, graph.edge_index
+        virtual = graph.inverses == "virtual"
+        found: List[Tuple[UUID, UUID]] = []
+        if direction in ("out", "both"):
+            for edge_id in index.outgoing(node, type).values():
+                found.append((edges[edge_id].target, edge_id))
+            if virtual:
+                for edge in graph._virtual_edges(node, None, type):
+                    found.append((edge.target, edge.id))
+            if self.hyperedges:
+                found.extend(self._members(node, "source"))
+        if direction in ("in", "both"):
+            for edge_id in index.incoming(node, type).values():
+                found.append((edges[edge_id].source, edge_id))
+            if virtual:
+                for edge in graph._virtual_edges(None, node, type):
+                    found.append((edge.source, edge.id))
+            if self.hyperedges:
+                found.extend(self._members(node, "target"))
+        return found
+
+    def _members(self, node: UUID, role: str) -> List[Tuple[UUID, UUID]]:
+        hyperedges = self.graph.hyperedges
+        containing = self.graph.hyperedge_index.containing(node, self.type, role)
+        found = []
+        for hyperedge_id in containing.values():
+            hyperedge = hyperedges[hyperedge_id]
+            other = hyperedge.targets if role == "source" else hyperedge.sources
+            found.extend((member, hyperedge_id) for member in other)
+        return found
+
+    # --- Searches ---
+    def find_path(self, start: UUID, end: UUID, max_depth: int) -> Optional[Path]:
+        """
+        A shortest path of at most `max_depth` hops, by bidirectional BFS:
+        whichever side has the smaller frontier grows by one full level until
+        the two visited sets meet.
+        """
+        if start == end:
+            return Path(nodes=[start])
+        forward: Visited = {start.int: (start, None, None, 0)}
+        backward: Visited = {end.int: (end, None, None, 0)}
+        forward_frontier, backward_frontier = [start], [end]
+        depth = 0
+        while forward_frontier and backward_frontier and depth < max_depth:
+            grow_forward = len(forward_frontier) <= len(backward_frontier)
+            if grow_forward:
+                frontier, seen, other = forward_frontier, forward, backward
+            else:
+                frontier, seen, other = backward_frontier, backward, forward
+            level = seen[frontier[0].int][3] + 1
+            grown: List[UUID] = []
+            for node in frontier:
+                parent = node.int
+                for neighbor, link in self.hops(node, grow_forward):
+                    key = neighbor.int
+                    if key in seen:
+                        continue
+                    seen[key] = (neighbor, parent, link, level)
+                    if key in other:
+                        # Nothing met before this level, so every meeting
+                        # found in it closes a path of the same, shortest,
+                        # length.
+                        return self._stitch(forward, backward, key)
+                    grown.append(neighbor)
+            if grow_forward:
+                forward_frontier = grown
+            else:
+                backward_frontier = grown
+            depth += 1
+        return None
+
+    def distances(
+        self, origin: UUID, max_depth: int, forward: bool = True
+    ) -> Dict[int, Tuple[UUID, int]]:
+        """Hop count to every node within `max_depth` hops of `origin`."""
+        reached = {origin.int: (origin, 0)}
+        frontier = [origin]
+        for depth in range(1, max_depth + 1):
+            grown = []
+            for node in frontier:
+                for neighbor, _ in self.hops(node, forward):
+                    if neighbor.int not in reached:
+                        reached[neighbor.int] = (neighbor, depth)
+                        grown.append(neighbor)
+            if not grown:
+                break
+            frontier = grown
+        return reached
+
+    def all_paths(
+        self, start: UUID, end: UUID, max_depth: int, limit: Optional[int]
+    ) -> List[Path]:
+        """
+        Simple paths (no repeated node) of at most `max_depth` hops, shortest
+        first, stopping after `limit`. Distances to `end`, found by one reverse
+        BFS, prune every branch that can no longer arrive in time.
+        """
+        if start == end:
+            return [Path(nodes=[start])]
+        remaining = {
+            key: depth
+            for key, (_, depth) in self.distances(end, max_depth, False).items()
+        }
+        if start.int not in remaining:
+            return []
+        paths: List[Path] = []
+        for length in range(remaining[start.int], max_depth + 1):
+            for path in self._paths_of_length(start, end, length, remaining):
+                paths.append(path)
+                if limit is not None and len(paths) >= limit:
+                    return paths
+        return paths
+
+    def _paths_of_length(
+        self, start: UUID, end: UUID, length: int, remaining: Dict[int, int]
+    ) -> Iterator[Path]:
+        nodes, links = [start], []
+        on_path = {start.int}
+        stack = [iter(self.hops(start))]
+        while stack:
+            for neighbor, link in stack[-1]:
+                key = neighbor.int
+                budget = length - len(links) - 1
+                if key in on_path or remaining.get(key, budget + 1) > budget:
+                    continue
+                if key == end.int:
+                    if budget == 0:
+                        yield Path(nodes=[*nodes, neighbor], links=[*links, link])
+                    continue
+                nodes.append(neighbor)
+                links.append(link)
+                on_path.add(key)
+                stack.append(iter(self.hops(neighbor)))
+                break
+            else:
+                stack.pop()
+                if links:
+                    on_path.discard(nodes.pop().int)
+                    links.pop()
+
+    @staticmethod
+    def _stitch(forward: Visited, backward: Visited, meeting: int) -> Path:
+        nodes: List[UUID] = []
+        links: List[UUID] = []
+        key: Optional[int] = meeting
+        while key is not None:
+            node, key, link, _ = forward[key]
+            nodes.append(node)
+            if link is not None:
+                links.append(link)
+        nodes.reverse()
+        links.reverse()
+        _, key, link, _ = backward[meeting]
+        while key is not None:
+            links.append(link)
+            node, parent, link, _ = backward[key]
+            nodes.append(node)
+            key = parent
+        return Path(nodes=nodes, links=links)
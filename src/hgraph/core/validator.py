@@ -1,5 +1,25 @@
+from hgraph.core.config import EdgeConfig, HyperedgeConfig
 from hgraph.core.edge import Edge, Hyperedge
-from typing import Dict
+from hgraph.core.index import (
+    Bucket,
+    EdgeIndex,
+    EdgeLookup,
+    HyperedgeIndex,
+    HyperedgeLookup,
+    PendingEdgeIndex,
+)
+from hgraph.core.registry import SchemaRegistry
+from copy import copy
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 from uuid import UUID
 
 
@@ -7,146 +27,409 @@ class ConstraintViolation(Exception):
     pass
 
 
+class BatchConstraintViolation(ConstraintViolation):
+    """
+    Raised by the batch `Hypergraph.add_*` methods when collecting
+    violations instead of failing fast.
+
+    `violations` holds `(position, violation)` pairs, where position is
+    the offset of the rejected item in the submitted batch.
+    """
+
+    def __init__(self, violations: List[Tuple[int, ConstraintViolation]]):
+        self.violations = violations
+        first_position, first = violations[0]
+        super().__init__(
+            f"{len(violations)} constraint violation(s) in batch; "
+            f"first at position {first_position}: {first}"
+        )
+
+
+class ValidationPlan:
+    """
+    The checks one config needs, in order, compiled once per config by
+    `SchemaRegistry`. `endpoints` tells whether one of them already looks
+    up the record's nodes, which integrity checking then reuses.
+    """
+
+    __slots__ = ("checks", "endpoints")
+
+    def __init__(self, checks: Tuple[Callable, ...], endpoints: bool):
+        self.checks = checks
+        self.endpoints = endpoints
+
+
+class BatchLayout:
+    """
+    How `ConstraintValidator.validate_edges` checks the edges of one plan:
+    which keyed conflicts to look for, and whether the plan has checks
+    (custom rules) that only the regular path can run. `loops` tells
+    whether the reverse check also covers self-loops, as it does for
+    asymmetric types.
+    """
+
+    __slots__ = (
+        "plan",
+        "custom",
+        "irreflexive",
+        "reverse",
+        "loops",
+        "functional",
+        "inverse_functional",
+        "unique",
+        "endpoints",
+    )
+
+    def __init__(self, plan: ValidationPlan, endpoints: bool):
+        checks = set(plan.checks)
+        cls = ConstraintValidator
+        self.plan = plan
+        self.custom = not checks <= BATCH_EDGE_CHECKS
+        self.irreflexive = cls._irreflexive in checks
+        self.reverse = bool(checks & {cls._asymmetric, cls._antisymmetric})
+        self.loops = cls._asymmetric in checks
+        self.functional = cls._functional in checks
+        self.inverse_functional = cls._inverse_functional in checks
+        self.unique = cls._no_duplicates in checks
+        self.endpoints = endpoints
+
+
 class ConstraintValidator:
-    def __init__(self, edges: Dict[UUID, Edge], hyperedges: Dict[UUID, Hyperedge]):
+    def __init__(
+        self,
+        edges: Mapping[UUID, Edge],
+        hyperedges: Mapping[UUID, Hyperedge],
+        edge_index: Optional[EdgeLookup] = None,
+        hyperedge_index: Optional[HyperedgeLookup] = None,
+        node_types: Optional[Callable[[Iterable[UUID]], Mapping[UUID, str]]] = None,
+        integrity: bool = False,
+    ):
         self.edges = edges
         self.hyperedges = hyperedges
+        # Type name of each stored node among the given ids (see
+        # `GraphStore.node_types`). Without it, endpoints are not checked.
+        self.node_types = node_types
+        # Whether every endpoint must be a stored node, not just the ones
+        # a `domain` or `range` applies to.
+        self.integrity = integrity
+        # Without a maintained index, build one once so every check below
+        # is still a lookup rather than a scan.
+        self.edge_index = (
+            edge_index if edge_index is not None else EdgeIndex(edges.values())
+        )
+        self.hyperedge_index = (
+            hyperedge_index
+            if hyperedge_index is not None
+            else HyperedgeIndex(hyperedges.values())
+        )
 
-    def validate_edge(self, new_edge: Edge):
-        for edge in self.edges.values():
-            # --- IRREFLEXIVE ---
-            if new_edge.config.irreflexive and new_edge.source == new_edge.target:
-                raise ConstraintViolation(
-                    f"{new_edge.type} is irreflexive but source == target"
-                )
-
-            # --- ASYMMETRIC ---
-            if new_edge.config.asymmetric:
-                if self._has_edge(new_edge.type, new_edge.target, new_edge.source):
-                    raise ConstraintViolation(
-                        f"{new_edge.type} is asymmetric but reverse exists"
-                    )
+    def validate_edge(self, new_edge: Edge, plan: Optional[ValidationPlan] = None):
+        if plan is None:
+            plan = SchemaRegistry.edge_plan(new_edge)
+        for check in plan.checks:
+            check(self, new_edge)
+        if self.integrity and not plan.endpoints and self.node_types is not None:
+            self._check_endpoints(new_edge, [new_edge.source], [new_edge.target])
 
-            # --- ANTISYMMETRIC ---
-            if new_edge.config.antisymmetric:
-                if new_edge.source != new_edge.target and self._has_edge(
-                    new_edge.type, new_edge.target, new_edge.source
-                ):
-                    raise ConstraintViolation(
-                        f"{new_edge.type} is antisymmetric but reverse exists"
-                    )
+    def validate_edges(
+        self, edges: List[Edge], fail_fast: bool = True
+    ) -> List[Tuple[int, ConstraintViolation]]:
+        """
+        Validate a batch of new edges with distinct ids against the graph
+        and against the edges accepted before them, without storing any,
+        and return the `(position, violation)` pairs of the rejected ones.
 
-            # --- FUNCTIONAL ---
-            if new_edge.config.functional:
-                if any(
-                    e.type == new_edge.type
-                    and e.source == new_edge.source
-                    and e.id != new_edge.id
-                    for e in self.edges.values()
-                ):
-                    raise ConstraintViolation(
-                        f"{new_edge.type} is functional: multiple targets from same source"
+        The config checks run as one pass over dicts keyed like the index
+        buckets, so the index is probed once per distinct key rather than
+        once per edge. An edge in conflict, or with custom rules, goes
+        through the regular checks instead, against the stored edges plus
+        the accepted ones, so it fails with its usual violation.
+        """
+        between = self.edge_index.between
+        from_source = self.edge_index.from_source
+        to_target = self.edge_index.to_target
+        pending = EdgeIndex()
+        checker = copy(self)
+        checker.edge_index = PendingEdgeIndex(self.edge_index, pending)
+        accepted: List[Edge] = []
+        synced = 0
+        violations: List[Tuple[int, ConstraintViolation]] = []
+        # Whether a key has an edge yet, among the stored and accepted ones;
+        # a key missing here has not been looked up in the index yet.
+        pairs: Dict[tuple, bool] = {}
+        sources: Dict[tuple, bool] = {}
+        targets: Dict[tuple, bool] = {}
+        layouts: Dict[str, BatchLayout] = {}
+        for position, edge in enumerate(edges):
+            edge_type = edge.type
+            layout = layouts.get(edge_type)
+            if layout is None:
+                layout = layouts[edge_type] = self._batch_layout(edge)
+            source, target = edge.source.int, edge.target.int
+            pair = (edge_type, source, target)
+            slow = layout.custom or (layout.irreflexive and source == target)
+            if not slow and layout.reverse and (layout.loops or source != target):
+                reverse = (edge_type, target, source)
+                slow = pairs.get(reverse)
+                if slow is None:
+                    slow = pairs[reverse] = bool(
+                        between(edge_type, edge.target, edge.source)
                     )
+            if not slow and layout.functional:
+                key = (edge_type, source)
+                slow = sources.get(key)
+                if slow is None:
+                    slow = sources[key] = bool(from_source(edge_type, edge.source))
+            if not slow and layout.inverse_functional:
+                key = (edge_type, target)
+                slow = targets.get(key)
+                if slow is None:
+                    slow = targets[key] = bool(to_target(edge_type, edge.target))
+            if not slow and layout.unique:
+                slow = pairs.get(pair)
+                if slow is None:
+                    slow = bool(between(edge_type, edge.source, edge.target))
+            try:
+                if slow:
+                    pending.add_all(accepted[synced:])
+                    synced = len(accepted)
+                    checker.validate_edge(edge, layout.plan)
+                elif layout.endpoints:
+                    self._check_endpoints(edge, [edge.source], [edge.target])
+            except ConstraintViolation as violation:
+                if fail_fast:
+                    raise
+                violations.append((position, violation))
+                continue
+            accepted.append(edge)
+            if layout.reverse or layout.unique:
+                pairs[pair] = True
+            if layout.functional:
+                sources[(edge_type, source)] = True
+            if layout.inverse_functional:
+                targets[(edge_type, target)] = True
+        return violations
 
-            # --- INVERSE FUNCTIONAL ---
-            if new_edge.config.inverse_functional:
-                if any(
-                    e.type == new_edge.type
-                    and e.target == new_edge.target
-                    and e.id != new_edge.id
-                    for e in self.edges.values()
-                ):
-                    raise ConstraintViolation(
-                        f"{new_edge.type} is inverse-functional: multiple sources to same target"
-                    )
-            # --- DUPLICATES ---
-            if not new_edge.config.allows_duplicates:
-                if any(
-                    e.type == new_edge.type
-                    and e.source == new_edge.source
-                    and e.target == new_edge.target
-                    and e.id != new_edge.id
-                    for e in self.edges.values()
-                ):
-                    raise ConstraintViolation(
-                        f"Duplicate {new_edge.type} edge between {new_edge.source} and {new_edge.target}"
-                    )
-        # reflexive=True and symmetric=True imply permission, not enforcement → no check needed
+    def _batch_layout(self, edge: Edge) -> BatchLayout:
+        plan = SchemaRegistry.edge_plan(edge)
+        return BatchLayout(
+            plan, self.node_types is not None and (plan.endpoints or self.integrity)
+        )
 
-    def validate_hyperedge(self, new_edge: Hyperedge):
-        cfg = new_edge.config
+    def validate_hyperedge(
+        self, new_edge: Hyperedge, plan: Optional[ValidationPlan] = None
+    ):
+        if plan is None:
+            plan = SchemaRegistry.hyperedge_plan(new_edge)
+        if plan.checks:
+            sources, targets = HyperedgeIndex.keys(new_edge)
+            for check in plan.checks:
+                check(self, new_edge, sources, targets)
+        if self.integrity and not plan.endpoints and self.node_types is not None:
+            self._check_endpoints(new_edge, new_edge.sources, new_edge.targets)
+
+    # --- Edge checks ---
+    def _irreflexive(self, new_edge: Edge) -> None:
+        if new_edge.source == new_edge.target:
+            raise ConstraintViolation(
+                f"{new_edge.type} is irreflexive but source == target"
+            )
+
+    def _asymmetric(self, new_edge: Edge) -> None:
+        if self._has_edge(
+            new_edge.type, new_edge.target, new_edge.source, exclude=new_edge.id
+        ):
+            raise ConstraintViolation(
+                f"{new_edge.type} is asymmetric but reverse exists"
+            )
+
+    def _antisymmetric(self, new_edge: Edge) -> None:
+        if new_edge.source != new_edge.target and self._has_edge(
+            new_edge.type, new_edge.target, new_edge.source, exclude=new_edge.id
+        ):
+            raise ConstraintViolation(
+                f"{new_edge.type} is antisymmetric but reverse exists"
+            )
+
+    def _functional(self, new_edge: Edge) -> None:
+        if self._has_other(
+            self.edge_index.from_source(new_edge.type, new_edge.source), new_edge.id
+        ):
+            raise ConstraintViolation(
+                f"{new_edge.type} is functional: multiple targets from same source"
+            )
 
-        # --- IRREFLEXIVITY/CYCLICITY ---
-        if not cfg.cyclic:
-            overlap = set(new_edge.sources).intersection(set(new_edge.targets))
-            if overlap:
-                raise ConstraintViolation(
-                    f"{new_edge.type} is non-cyclic but has overlapping nodes in sources and targets: {overlap}"
-                )
+    def _inverse_functional(self, new_edge: Edge) -> None:
+        if self._has_other(
+            self.edge_index.to_target(new_edge.type, new_edge.target), new_edge.id
+        ):
+            raise ConstraintViolation(
+                f"{new_edge.type} is inverse-functional: multiple sources to same target"
+            )
 
-        if cfg.reflexive is False and new_edge.sources == new_edge.targets:
-            # No exact reflexive mapping if not allowed
+    def _no_duplicates(self, new_edge: Edge) -> None:
+        if self._has_edge(
+            new_edge.type, new_edge.source, new_edge.target, exclude=new_edge.id
+        ):
+            raise ConstraintViolation(
+                f"Duplicate {new_edge.type} edge between {new_edge.source} and {new_edge.target}"
+            )
+
+    def _edge_endpoints(self, new_edge: Edge) -> None:
+        if self.node_types is not None:
+            self._check_endpoints(new_edge, [new_edge.source], [new_edge.target])
+
+    # --- Hyperedge checks ---
+    # Each takes the canonical `sources` and `targets` keys of the record.
+    def _acyclic(self, new_edge: Hyperedge, sources, targets) -> None:
+        overlap = set(new_edge.sources).intersection(set(new_edge.targets))
+        if overlap:
+            raise ConstraintViolation(
+                f"{new_edge.type} is non-cyclic but has overlapping nodes in sources and targets: {overlap}"
+            )
+
+    def _irreflexive_sides(self, new_edge: Hyperedge, sources, targets) -> None:
+        # No exact reflexive mapping if not allowed
+        if sources == targets:
             raise ConstraintViolation(
                 f"{new_edge.type} is not reflexive but sources == targets"
             )
 
-        # --- DUPLICATE CHECK ---
-        if not cfg.allows_duplicates:
-            for edge in self.hyperedges.values():
-                if (
-                    edge.type == new_edge.type
-                    and self._compare_node_sets(
-                        edge.sources, new_edge.sources, unordered=cfg.unordered
-                    )
-                    and self._compare_node_sets(
-                        edge.targets, new_edge.targets, unordered=cfg.unordered
-                    )
-                ):
-                    raise ConstraintViolation(
-                        f"Duplicate hyperedge of type {new_edge.type} with same sources and targets"
-                    )
+    def _unique_members(self, new_edge: Hyperedge, sources, targets) -> None:
+        same_members = self.hyperedge_index.with_members(
+            new_edge.type, sources, targets
+        )
+        if self._has_other(same_members, new_edge.id):
+            raise ConstraintViolation(
+                f"Duplicate hyperedge of type {new_edge.type} with same sources and targets"
+            )
 
-        # --- FUNCTIONAL ---
-        if cfg.functional:
-            for edge in self.hyperedges.values():
-                if (
-                    edge.type == new_edge.type
-                    and self._compare_node_sets(
-                        edge.sources, new_edge.sources, unordered=cfg.unordered
-                    )
-                    and edge.id != new_edge.id
-                    and not self._compare_node_sets(
-                        edge.targets, new_edge.targets, unordered=cfg.unordered
-                    )
-                ):
-                    raise ConstraintViolation(
-                        f"{new_edge.type} is functional but multiple target sets exist for same sources"
-                    )
+    def _functional_sides(self, new_edge: Hyperedge, sources, targets) -> None:
+        # Every hyperedge sharing both sides also shares each side, so any
+        # surplus in the one-sided bucket has a different opposite side.
+        index = self.hyperedge_index
+        if self._count_other(
+            index.with_sources(new_edge.type, sources), new_edge.id
+        ) > self._count_other(
+            index.with_members(new_edge.type, sources, targets), new_edge.id
+        ):
+            raise ConstraintViolation(
+                f"{new_edge.type} is functional but multiple target sets exist for same sources"
+            )
 
-        # --- INVERSE FUNCTIONAL ---
-        if cfg.inverse_functional:
-            for edge in self.hyperedges.values():
-                if (
-                    edge.type == new_edge.type
-                    and self._compare_node_sets(
-                        edge.targets, new_edge.targets, unordered=cfg.unordered
-                    )
-                    and edge.id != new_edge.id
-                    and not self._compare_node_sets(
-                        edge.sources, new_edge.sources, unordered=cfg.unordered
+    def _inverse_functional_sides(self, new_edge: Hyperedge, sources, targets) -> None:
+        index = self.hyperedge_index
+        if self._count_other(
+            index.with_targets(new_edge.type, targets), new_edge.id
+        ) > self._count_other(
+            index.with_members(new_edge.type, sources, targets), new_edge.id
+        ):
+            raise ConstraintViolation(
+                f"{new_edge.type} is inverse-functional but multiple source sets exist for same targets"
+            )
+
+    def _hyperedge_endpoints(self, new_edge: Hyperedge, sources, targets) -> None:
+        if self.node_types is not None:
+            self._check_endpoints(new_edge, new_edge.sources, new_edge.targets)
+
+    def _check_endpoints(
+        self,
+        new_edge: Union[Edge, Hyperedge],
+        sources: List[UUID],
+        targets: List[UUID],
+    ) -> None:
+        cfg = new_edge.config
+        stored = self.node_types([*sources, *targets])
+        for role, nodes, required in (
+            ("source", sources, cfg.domain),
+            ("target", targets, cfg.range),
+        ):
+            if required is None and not self.integrity:
+                continue
+            for node in nodes:
+                node_type = stored.get(node)
+                if node_type is None:
+                    raise ConstraintViolation(
+                        f"{new_edge.type} {role} {node} is not a stored node"
                     )
+                if required is not None and node_type not in (
+                    SchemaRegistry.node_subtypes(required)
                 ):
                     raise ConstraintViolation(
-                        f"{new_edge.type} is inverse-functional but multiple source sets exist for same targets"
+                        f"{new_edge.type} {role} must be a {required} node, "
+                        f"but {node} is a {node_type}"
                     )
 
-    def _compare_node_sets(
-        self, a: list[UUID], b: list[UUID], unordered: bool = False
+    def _has_edge(
+        self,
+        edge_type: str,
+        source: UUID,
+        target: UUID,
+        exclude: Optional[UUID] = None,
     ) -> bool:
-        return set(a) == set(b) if unordered else a == b
+        return self._has_other(
+            self.edge_index.between(edge_type, source, target), exclude
+        )
+
+    @staticmethod
+    def _count_other(bucket: Bucket, exclude: Optional[UUID]) -> int:
+        # An update re-validates an edge that is already indexed under its
+        # own id, so that entry must not count as a conflict.
+        if exclude is not None and exclude.int in bucket:
+            return len(bucket) - 1
+        return len(bucket)
+
+    @classmethod
+    def _has_other(cls, bucket: Bucket, exclude: Optional[UUID]) -> bool:
+        return cls._count_other(bucket, exclude) > 0
+
+
+# The config checks `validate_edges` runs in its single pass.
+BATCH_EDGE_CHECKS = frozenset(
+    {
+        ConstraintValidator._irreflexive,
+        ConstraintValidator._asymmetric,
+        ConstraintValidator._antisymmetric,
+        ConstraintValidator._functional,
+        ConstraintValidator._inverse_functional,
+        ConstraintValidator._no_duplicates,
+        ConstraintValidator._edge_endpoints,
+    }
+)
+
+
+# --- Compiled plans ---
+def compile_edge_plan(cfg: EdgeConfig) -> ValidationPlan:
+    # reflexive=True and symmetric=True imply permission, not enforcement → no check needed
+    endpoints = cfg.domain is not None or cfg.range is not None
+    checks = [
+        check
+        for enabled, check in (
+            (cfg.irreflexive, ConstraintValidator._irreflexive),
+            (cfg.asymmetric, ConstraintValidator._asymmetric),
+            (cfg.antisymmetric, ConstraintValidator._antisymmetric),
+            (cfg.functional, ConstraintValidator._functional),
+            (cfg.inverse_functional, ConstraintValidator._inverse_functional),
+            (not cfg.allows_duplicates, ConstraintValidator._no_duplicates),
+            (endpoints, ConstraintValidator._edge_endpoints),
+        )
+        if enabled
+    ]
+    return ValidationPlan(tuple(checks), endpoints)
+
 
-    def _has_edge(self, edge_type: str, source: UUID, target: UUID) -> bool:
-        return any(
-            e.type == edge_type and e.source == source and e.target == target
-            for e in self.edges.values()
+def compile_hyperedge_plan(cfg: HyperedgeConfig) -> ValidationPlan:
+    endpoints = cfg.domain is not None or cfg.range is not None
+    checks = [
+        check
+        for enabled, check in (
+            (not cfg.cyclic, ConstraintValidator._acyclic),
+            (cfg.reflexive is False, ConstraintValidator._irreflexive_sides),
+            (not cfg.allows_duplicates, ConstraintValidator._unique_members),
+            (cfg.functional, ConstraintValidator._functional_sides),
+            (cfg.inverse_functional, ConstraintValidator._inverse_functional_sides),
+            (endpoints, ConstraintValidator._hyperedge_endpoints),
         )
+        if enabled
+    ]
+    return ValidationPlan(tuple(checks), endpoints)
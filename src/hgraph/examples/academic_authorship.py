@@ -1,4 +1,4 @@
-from uuid import uuid4
+from uuid import UUID, uuid4
 from hgraph.core.node import Node
 from hgraph.core.edge import Hyperedge
 from hgraph.core.config import HyperedgeConfig
@@ -22,8 +22,8 @@ class Paper(Node):
 
 
 class CoAuthored(Hyperedge):
-    sources: list
-    targets: list
+    sources: list[UUID]
+    targets: list[UUID]
     config: HyperedgeConfig = HyperedgeConfig(
         unordered=True,
         allows_duplicates=False,
@@ -1,4 +1,4 @@
-from uuid import uuid4
+from uuid import UUID, uuid4
 from hgraph.core.node import Node
 from hgraph.core.edge import Hyperedge
 from hgraph.core.config import HyperedgeConfig
@@ -24,8 +24,8 @@ class Diagnosis(Node):
 
 
 class CausesDiagnosis(Hyperedge):
-    sources: list
-    targets: list
+    sources: list[UUID]
+    targets: list[UUID]
     config: HyperedgeConfig = HyperedgeConfig(
         unordered=False,
         allows_duplicates=False,
@@ -52,7 +52,9 @@ class SiblingOf(Edge):
 
 
 # --- Initialize Hypergraph ---
-graph = Hypergraph()
+# Symmetric and inverse edges (SiblingOf, MarriedTo, HasParent, ...) are
+# answered from the stored direction instead of being stored twice.
+graph = Hypergraph(inverses="virtual")
 
 # --- Add Persons ---
 james = Person(name="James Smith", age=45)
@@ -84,9 +86,6 @@ siblings = [thomas, thalia, timothy, tula]
 for i in range(len(siblings)):
     for j in range(i + 1, len(siblings)):
         edges.append(SiblingOf(source=siblings[i].id, target=siblings[j].id))
-        edges.append(
-            SiblingOf(source=siblings[j].id, target=siblings[i].id)
-        )  # symmetric edge
 
 # Add all edges
 for edge in edges:
@@ -100,3 +99,8 @@ for node in graph.list_nodes():
 print("\n🔗 Edges:")
 for edge in graph.list_edges():
     print(f"- {edge.type}: {edge.source} → {edge.target}")
+
+print("\n🔁 Implied edges:")
+for edge in graph.find_edges(source=thomas.id):
+    if edge.id not in graph.edges:
+        print(f"- {edge.type}: {edge.source} → {edge.target}")
@@ -0,0 +1,19 @@
+import pytest
+
+from hgraph.core.columnar import ColumnarStore
+from hgraph.core.persistent_store import PersistentStore
+from hgraph.core.sqlite_store import SQLiteStore
+from hgraph.core.store import InMemoryStore
+
+STORES = {
+    "memory": InMemoryStore,
+    "columnar": ColumnarStore,
+    "sqlite": lambda: SQLiteStore(":memory:"),
+    "persistent": PersistentStore,
+}
+
+
+@pytest.fixture(params=list(STORES))
+def store(request):
+    """A fresh instance of every `GraphStore` backend in turn."""
+    return STORES[request.param]()
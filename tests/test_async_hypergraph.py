@@ -0,0 +1,104 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from hgraph.core.async_hypergraph import AsyncHypergraph
+from hgraph.core.config import EdgeConfig
+from hgraph.core.edge import Edge
+from hgraph.core.hypergraph import Hypergraph
+from hgraph.core.node import Node
+from hgraph.core.persistent_store import PersistentStore
+from hgraph.core.validator import ConstraintViolation
+
+
+class AsyncOwns(Edge):
+    config: EdgeConfig = EdgeConfig(functional=True)
+
+
+def graphs():
+    return [Hypergraph(), Hypergraph(PersistentStore())]
+
+
+@pytest.mark.parametrize("graph", graphs(), ids=["memory", "persistent"])
+def test_queued_writes_share_commits(graph):
+    commits = []
+
+    async def main():
+        async with AsyncHypergraph(graph) as hg:
+            apply = hg._apply
+            hg._apply = lambda ops: commits.append(len(ops)) or apply(ops)
+            nodes = [Node() for _ in range(50)]
+            await asyncio.gather(*(hg.add_node(node) for node in nodes))
+            assert await hg.get_node(nodes[-1].id) == nodes[-1]
+
+    asyncio.run(main())
+    assert len(graph.nodes) == 50
+    assert sum(commits) == 50 and len(commits) < 50
+
+
+@pytest.mark.parametrize("graph", graphs(), ids=["memory", "persistent"])
+def test_violation_fails_only_its_own_write(graph):
+    source = uuid4()
+    first = AsyncOwns(source=source, target=uuid4())
+    second = AsyncOwns(source=source, target=uuid4())
+    other = AsyncOwns(source=uuid4(), target=uuid4())
+
+    async def main():
+        async with AsyncHypergraph(graph) as hg:
+            results = await asyncio.gather(
+                hg.add_edge(first),
+                hg.add_edge(second),
+                hg.add_edge(other),
+                return_exceptions=True,
+            )
+            assert isinstance(results[1], ConstraintViolation)
+            assert not any(isinstance(r, Exception) for r in results[::2])
+            found = await hg.find_edges(source=source, type="AsyncOwns")
+            assert [edge.id for edge in found] == [first.id]
+
+    asyncio.run(main())
+    assert set(graph.edges) == {first.id, other.id}
+
+
+def test_max_batch_splits_the_queue():
+    sizes = []
+
+    async def main():
+        hg = AsyncHypergraph(max_batch=4)
+        apply = hg._apply
+        hg._apply = lambda ops: sizes.append(len(ops)) or apply(ops)
+        await asyncio.gather(*(hg.add_node(Node()) for _ in range(10)))
+        await hg.close()
+        return hg.graph
+
+    graph = asyncio.run(main())
+    assert len(graph.nodes) == 10
+    assert max(sizes) <= 4
+
+
+def test_reads_see_the_published_snapshot():
+    async def main():
+        async with AsyncHypergraph(Hypergraph(PersistentStore())) as hg:
+            a, b = Node(), Node()
+            await asyncio.gather(hg.add_node(a), hg.add_node(b))
+            await hg.add_edge(AsyncOwns(source=a.id, target=b.id))
+            before = hg.current
+            assert [n.id for n in await hg.get_neighbors(a.id)] == [b.id]
+            await hg.delete_edge(next(iter(hg.graph.edges)))
+            assert hg.current is not before
+            assert await hg.get_neighbors(a.id) == []
+            assert len(before.edges) == 1
+
+    asyncio.run(main())
+
+
+def test_close_applies_queued_writes():
+    async def main():
+        hg = AsyncHypergraph()
+        futures = [hg.add_node(Node()) for _ in range(5)]
+        await hg.close()
+        assert all(future.done() for future in futures)
+        return hg.graph
+
+    assert len(asyncio.run(main()).nodes) == 5
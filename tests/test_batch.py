@@ -0,0 +1,164 @@
+import gc
+from uuid import uuid4
+
+import pytest
+
+from hgraph.core.config import EdgeConfig, HyperedgeConfig
+from hgraph.core.edge import Edge, Hyperedge
+from hgraph.core.hypergraph import Hypergraph
+from hgraph.core.node import Node
+from hgraph.core.persistent_store import PersistentStore
+from hgraph.core.validator import BatchConstraintViolation, ConstraintViolation
+
+
+class BatchMarried(Edge):
+    config: EdgeConfig = EdgeConfig(irreflexive=True, allows_duplicates=False)
+
+
+class BatchTeam(Hyperedge):
+    config: HyperedgeConfig = HyperedgeConfig(unordered=True)
+
+
+def test_add_nodes():
+    graph = Hypergraph()
+    nodes = [Node() for _ in range(3)]
+    graph.add_nodes(nodes)
+    assert {node.id for node in graph.list_nodes()} == {node.id for node in nodes}
+
+
+def test_batch_is_validated_against_itself():
+    a, b = uuid4(), uuid4()
+    graph = Hypergraph()
+    with pytest.raises(ConstraintViolation, match="Duplicate"):
+        graph.add_edges(
+            [BatchMarried(source=a, target=b), BatchMarried(source=a, target=b)]
+        )
+
+
+def test_failed_batch_leaves_nothing_behind():
+    a, b, c = uuid4(), uuid4(), uuid4()
+    graph = Hypergraph()
+    kept = BatchMarried(source=a, target=b)
+    graph.add_edge(kept)
+    batch = [BatchMarried(source=b, target=c), BatchMarried(source=c, target=c)]
+    with pytest.raises(ConstraintViolation):
+        graph.add_edges(batch)
+    assert list(graph.edges) == [kept.id]
+    assert not graph.find_edges(source=b)
+
+
+def test_collected_violations_report_positions():
+    a, b = uuid4(), uuid4()
+    graph = Hypergraph()
+    batch = [
+        BatchMarried(source=a, target=b),
+        BatchMarried(source=a, target=a),
+        BatchMarried(source=a, target=b),
+    ]
+    with pytest.raises(BatchConstraintViolation) as raised:
+        graph.add_edges(batch, fail_fast=False)
+    assert [position for position, _ in raised.value.violations] == [1, 2]
+    assert not graph.edges
+
+
+def test_failed_batch_restores_replaced_records():
+    a, b, c = uuid4(), uuid4(), uuid4()
+    graph = Hypergraph()
+    original = BatchMarried(source=a, target=b)
+    graph.add_edge(original)
+    replacement = BatchMarried(id=original.id, source=a, target=c)
+    with pytest.raises(ConstraintViolation):
+        graph.add_edges([replacement, BatchMarried(source=b, target=b)])
+    assert graph.get_edge(original.id) == original
+
+
+def test_hyperedge_batch_rollback():
+    a, b, c = uuid4(), uuid4(), uuid4()
+    graph = Hypergraph()
+    batch = [
+        BatchTeam(sources=[a], targets=[b]),
+        BatchTeam(sources=[b, c], targets=[c]),
+    ]
+    with pytest.raises(ConstraintViolation):
+        graph.add_hyperedges(batch)
+    assert not graph.hyperedges
+
+
+class BatchManages(Edge):
+    config: EdgeConfig = EdgeConfig(
+        functional=True, asymmetric=True, allows_duplicates=False
+    )
+
+
+class BatchMentors(Edge):
+    config: EdgeConfig = EdgeConfig(inverse_functional=True, antisymmetric=True)
+
+
+def one_by_one(graph, edges):
+    """(position, message) of each edge `add_edge` rejects, in order."""
+    rejected = []
+    for position, edge in enumerate(edges):
+        try:
+            graph.add_edge(edge)
+        except ConstraintViolation as violation:
+            rejected.append((position, str(violation)))
+    return rejected
+
+
+def test_set_based_pass_rejects_what_add_edge_rejects(store):
+    a, b, c, d = uuid4(), uuid4(), uuid4(), uuid4()
+    stored = [BatchManages(source=a, target=b), BatchMentors(source=c, target=d)]
+    batch = [
+        BatchManages(source=b, target=c),
+        BatchManages(source=a, target=c),  # a already manages b
+        BatchManages(source=c, target=b),  # b -> c was accepted above
+        BatchManages(source=d, target=d),  # no other edge reverses it
+        BatchMentors(source=d, target=a),
+        BatchMentors(source=b, target=a),  # a already has a mentor
+        BatchMentors(source=d, target=c),  # reverses a stored edge
+        BatchMentors(source=a, target=a),  # a got a mentor at 4
+        BatchMarried(source=b, target=d),
+        BatchMarried(source=b, target=d),
+    ]
+    expected = Hypergraph()
+    for edge in stored:
+        expected.add_edge(edge)
+    graph = Hypergraph(store)
+    graph.add_edges(stored)
+
+    with pytest.raises(BatchConstraintViolation) as raised:
+        graph.add_edges(batch, fail_fast=False)
+    found = [(p, str(violation)) for p, violation in raised.value.violations]
+    assert found == one_by_one(expected, batch)
+    assert [p for p, _ in found] == [1, 2, 5, 6, 7, 9]
+    assert set(graph.edges) == {edge.id for edge in stored}
+
+
+def test_clean_batch_is_indexed_like_single_inserts(store):
+    hub = uuid4()
+    edges = [BatchMentors(source=hub, target=uuid4()) for _ in range(20)]
+    graph = Hypergraph(store)
+    graph.add_edges(edges)
+    assert {edge.id for edge in graph.find_edges(source=hub)} == {
+        edge.id for edge in edges
+    }
+    assert [e.id for e in graph.find_edges(target=edges[3].target)] == [edges[3].id]
+    with pytest.raises(ConstraintViolation, match="inverse-functional"):
+        graph.add_edge(BatchMentors(source=uuid4(), target=edges[0].target))
+
+
+def test_batch_into_a_branch_leaves_the_parent_alone():
+    hub = uuid4()
+    graph = Hypergraph(PersistentStore())
+    graph.add_edges([BatchMentors(source=hub, target=uuid4()) for _ in range(3)])
+    branch = graph.branch()
+    branch.add_edges([BatchMentors(source=hub, target=uuid4()) for _ in range(30)])
+    assert len(graph.find_edges(source=hub)) == 3
+    assert len(branch.find_edges(source=hub)) == 33
+
+
+def test_failed_batch_turns_the_collector_back_on():
+    a = uuid4()
+    with pytest.raises(ConstraintViolation):
+        Hypergraph().add_edges([BatchMarried(source=a, target=a)])
+    assert gc.isenabled()
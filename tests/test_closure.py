@@ -0,0 +1,127 @@
+import random
+from uuid import uuid4
+
+import pytest
+
+from hgraph.core.config import EdgeConfig, HyperedgeConfig
+from hgraph.core.edge import Edge, Hyperedge
+from hgraph.core.hypergraph import Hypergraph
+from hgraph.core.validator import ConstraintViolation
+
+
+class ClosureAncestorOf(Edge):
+    config: EdgeConfig = EdgeConfig(transitive=True, irreflexive=True)
+
+
+class ClosurePrecedes(Hyperedge):
+    config: HyperedgeConfig = HyperedgeConfig(transitive=True)
+
+
+def reachable(graph, source, target, type):
+    """Reference answer by breadth-first search over the stored edges."""
+    frontier, seen = [source], set()
+    while frontier:
+        node = frontier.pop()
+        for edge in graph.find_edges(source=node, type=type):
+            if edge.target == target:
+                return True
+            if edge.target not in seen:
+                seen.add(edge.target)
+                frontier.append(edge.target)
+    return False
+
+
+def test_infer_builds_every_transitive_type():
+    graph = Hypergraph()
+    closures = graph.infer_transitive_closure()
+    assert {"ClosureAncestorOf", "ClosurePrecedes"} <= set(closures)
+    assert "Edge" not in closures
+
+
+def test_chain_is_reachable_one_way():
+    graph = Hypergraph()
+    a, b, c = uuid4(), uuid4(), uuid4()
+    graph.add_edge(ClosureAncestorOf(source=a, target=b))
+    graph.add_edge(ClosureAncestorOf(source=b, target=c))
+    assert graph.is_reachable(a, c, "ClosureAncestorOf")
+    assert not graph.is_reachable(c, a, "ClosureAncestorOf")
+    assert set(graph.descendants(a, "ClosureAncestorOf")) == {b, c}
+    assert set(graph.ancestors(c, "ClosureAncestorOf")) == {a, b}
+
+
+def test_writes_after_build_update_the_closure():
+    graph = Hypergraph()
+    a, b, c = uuid4(), uuid4(), uuid4()
+    graph.infer_transitive_closure("ClosureAncestorOf")
+    graph.add_edge(ClosureAncestorOf(source=a, target=b))
+    second = ClosureAncestorOf(source=b, target=c)
+    graph.add_edge(second)
+    assert graph.is_reachable(a, c, "ClosureAncestorOf")
+    graph.delete_edge(second.id)
+    assert not graph.is_reachable(a, c, "ClosureAncestorOf")
+    assert graph.is_reachable(a, b, "ClosureAncestorOf")
+
+
+def test_link_survives_until_its_last_copy_is_removed():
+    graph = Hypergraph()
+    a, b = uuid4(), uuid4()
+    first = ClosureAncestorOf(source=a, target=b)
+    graph.add_edges([first, ClosureAncestorOf(source=a, target=b)])
+    graph.infer_transitive_closure("ClosureAncestorOf")
+    graph.delete_edge(first.id)
+    assert graph.is_reachable(a, b, "ClosureAncestorOf")
+
+
+def test_update_moves_the_link():
+    graph = Hypergraph()
+    a, b, c = uuid4(), uuid4(), uuid4()
+    edge = ClosureAncestorOf(source=a, target=b)
+    graph.add_edge(edge)
+    graph.infer_transitive_closure("ClosureAncestorOf")
+    graph.update_edge(edge.id, ClosureAncestorOf(source=a, target=c))
+    assert graph.is_reachable(a, c, "ClosureAncestorOf")
+    assert not graph.is_reachable(a, b, "ClosureAncestorOf")
+
+
+def test_hyperedge_links_every_source_to_every_target():
+    graph = Hypergraph()
+    a, b, c, d = uuid4(), uuid4(), uuid4(), uuid4()
+    graph.add_hyperedge(ClosurePrecedes(sources=[a, b], targets=[c]))
+    last = ClosurePrecedes(sources=[c], targets=[d])
+    graph.add_hyperedge(last)
+    assert graph.is_reachable(b, d, "ClosurePrecedes")
+    graph.delete_hyperedge(last.id)
+    assert not graph.is_reachable(a, d, "ClosurePrecedes")
+
+
+def test_rolled_back_transaction_leaves_closure_unchanged():
+    graph = Hypergraph()
+    a, b = uuid4(), uuid4()
+    graph.infer_transitive_closure("ClosureAncestorOf")
+    with pytest.raises(ConstraintViolation):
+        with graph.transaction():
+            graph.add_edge(ClosureAncestorOf(source=a, target=b))
+            graph.add_edge(ClosureAncestorOf(source=b, target=b))
+    assert not graph.is_reachable(a, b, "ClosureAncestorOf")
+    with graph.transaction():
+        graph.add_edge(ClosureAncestorOf(source=a, target=b))
+    assert graph.is_reachable(a, b, "ClosureAncestorOf")
+
+
+def test_incremental_matches_search_under_random_writes():
+    rng = random.Random(7)
+    graph = Hypergraph()
+    nodes = [uuid4() for _ in range(12)]
+    graph.infer_transitive_closure("ClosureAncestorOf")
+    for _ in range(150):
+        edges = graph.find_edges(type="ClosureAncestorOf")
+        if edges and rng.random() < 0.35:
+            graph.delete_edge(rng.choice(edges).id)
+        else:
+            source, target = rng.sample(nodes, 2)
+            graph.add_edge(ClosureAncestorOf(source=source, target=target))
+    for source in nodes:
+        for target in nodes:
+            assert graph.is_reachable(source, target, "ClosureAncestorOf") == reachable(
+                graph, source, target, "ClosureAncestorOf"
+            )
@@ -0,0 +1,143 @@
+from uuid import uuid4
+
+from hgraph.core.columnar import ColumnarStore
+from hgraph.core.config import HyperedgeConfig
+from hgraph.core.edge import Edge, Hyperedge
+from hgraph.core.hypergraph import Hypergraph
+
+
+class ColumnarCites(Edge):
+    weight: float = 1.0
+
+
+class ColumnarLinks(Edge):
+    pass
+
+
+class ColumnarPanel(Hyperedge):
+    pass
+
+
+class ColumnarPool(Hyperedge):
+    config: HyperedgeConfig = HyperedgeConfig(unordered=True)
+
+
+def of_type(store, edge_type):
+    return set(store.edge_index.of_type(edge_type).values())
+
+
+def test_of_type_tracks_inserts_deletes_and_replacements():
+    store = ColumnarStore()
+    cites = [ColumnarCites(source=uuid4(), target=uuid4()) for _ in range(4)]
+    link = ColumnarLinks(source=uuid4(), target=uuid4())
+    for edge in [*cites, link]:
+        store.put_edge(edge)
+    assert of_type(store, "ColumnarCites") == {edge.id for edge in cites}
+    assert of_type(store, "ColumnarLinks") == {link.id}
+
+    store.pop_edge(cites[0].id)
+    store.put_edge(ColumnarCites(id=cites[1].id, source=uuid4(), target=uuid4()))
+    assert of_type(store, "ColumnarCites") == {edge.id for edge in cites[1:]}
+    assert of_type(store, "Missing") == set()
+
+
+def test_of_type_reads_only_rows_of_that_type():
+    store = ColumnarStore()
+    for _ in range(50):
+        store.put_edge(ColumnarLinks(source=uuid4(), target=uuid4()))
+    cite = ColumnarCites(source=uuid4(), target=uuid4())
+    store.put_edge(cite)
+    type_id = store.edge_types.ids["ColumnarCites"]
+    assert len(store.edge_index.by_type[type_id]) == 1
+    assert of_type(store, "ColumnarCites") == {cite.id}
+
+
+def test_dead_rows_are_dropped_from_type_buckets():
+    store = ColumnarStore()
+    edges = [ColumnarLinks(source=uuid4(), target=uuid4()) for _ in range(10)]
+    for edge in edges:
+        store.put_edge(edge)
+    for edge in edges[:8]:
+        store.pop_edge(edge.id)
+    assert of_type(store, "ColumnarLinks") == {edge.id for edge in edges[8:]}
+    type_id = store.edge_types.ids["ColumnarLinks"]
+    assert len(store.edge_index.by_type[type_id]) == 2
+
+
+def test_rows_materialise_with_their_fields_and_survive_compact():
+    store = ColumnarStore()
+    graph = Hypergraph(store)
+    a, b, c = uuid4(), uuid4(), uuid4()
+    cite = ColumnarCites(source=a, target=b, weight=0.5)
+    panel = ColumnarPanel(sources=[a, b], targets=[c])
+    graph.add_edge(cite)
+    graph.add_edge(ColumnarCites(source=b, target=c))
+    graph.add_hyperedge(panel)
+    graph.delete_edge(graph.find_edges(source=b)[0].id)
+    store.compact()
+    assert graph.get_edge(cite.id) == cite
+    assert graph.get_hyperedge(panel.id) == panel
+    assert of_type(store, "ColumnarCites") == {cite.id}
+    assert [edge.id for edge in graph.find_edges(source=a, target=b)] == [cite.id]
+
+
+def test_deletes_around_a_hub_leave_dead_rows_until_read():
+    store = ColumnarStore()
+    hub = uuid4()
+    edges = [ColumnarLinks(source=hub, target=uuid4()) for _ in range(20)]
+    for edge in edges:
+        store.put_edge(edge)
+    for edge in edges[:15]:
+        store.pop_edge(edge.id)
+    position = store.interner.find(hub)
+    type_id = store.edge_types.ids["ColumnarLinks"]
+    assert len(store.edge_index.by_source[(type_id, position)]) == 20
+    live = {edge.id for edge in edges[15:]}
+    assert set(store.edge_index.outgoing(hub, "ColumnarLinks").values()) == live
+    assert len(store.edge_index.by_source[(type_id, position)]) == 5
+    assert set(store.edge_index.outgoing(hub).values()) == live
+    for edge in edges[15:]:
+        store.pop_edge(edge.id)
+    assert store.edge_index.outgoing(hub) == {}
+    assert position not in store.edge_index.outgoing_any
+
+
+def test_hyperedge_lookups_read_row_arrays():
+    store = ColumnarStore()
+    a, b, c, d = uuid4(), uuid4(), uuid4(), uuid4()
+    panel = ColumnarPanel(sources=[a, b], targets=[c])
+    reversed_panel = ColumnarPanel(sources=[b, a], targets=[c])
+    pool = ColumnarPool(sources=[a, b], targets=[c, d])
+    for hyperedge in (panel, reversed_panel, pool):
+        store.put_hyperedge(hyperedge)
+    index = store.hyperedge_index
+
+    def ids(bucket):
+        return set(bucket.values())
+
+    assert ids(index.with_sources("ColumnarPanel", (a.int, b.int))) == {panel.id}
+    assert ids(index.with_targets("ColumnarPanel", (c.int,))) == {
+        panel.id,
+        reversed_panel.id,
+    }
+    assert ids(index.with_members("ColumnarPanel", (b.int, a.int), (c.int,))) == {
+        reversed_panel.id
+    }
+    assert ids(
+        index.with_members(
+            "ColumnarPool", frozenset({b.int, a.int}), frozenset({d.int, c.int})
+        )
+    ) == {pool.id}
+    assert index.with_sources("ColumnarPanel", (a.int, uuid4().int)) == {}
+    assert ids(index.containing(c, role="target")) == {
+        panel.id,
+        reversed_panel.id,
+        pool.id,
+    }
+    assert ids(index.containing(d, "ColumnarPool", role="source")) == set()
+
+    store.pop_hyperedge(panel.id)
+    assert ids(index.containing(a, "ColumnarPanel")) == {reversed_panel.id}
+    assert ids(index.of_type("ColumnarPanel")) == {reversed_panel.id}
+    type_id = store.hyperedge_types.ids["ColumnarPanel"]
+    assert list(index.by_type[type_id]) == [store.hyperedge_rows[reversed_panel.id.int]]
@@ -0,0 +1,69 @@
+import threading
+from uuid import uuid4
+
+import pytest
+
+from hgraph.core.concurrent import ConcurrentHypergraph
+from hgraph.core.config import EdgeConfig
+from hgraph.core.edge import Edge
+from hgraph.core.hypergraph import Hypergraph
+from hgraph.core.node import Node
+from hgraph.core.validator import ConstraintViolation
+
+
+class SharedOwns(Edge):
+    config: EdgeConfig = EdgeConfig(functional=True)
+
+
+def test_readers_see_published_snapshots_only():
+    graph = ConcurrentHypergraph()
+    before = graph.snapshot()
+    with graph.write() as live:
+        live.add_node(Node())
+        assert not graph.snapshot().nodes
+    assert len(graph.snapshot().nodes) == 1
+    assert not before.nodes
+
+
+def test_failed_write_publishes_nothing():
+    graph = ConcurrentHypergraph()
+    source = uuid4()
+    graph.add_edge(SharedOwns(source=source, target=uuid4()))
+    published = graph.snapshot()
+    with pytest.raises(ConstraintViolation):
+        with graph.write() as live:
+            live.add_node(Node())
+            live.add_edge(SharedOwns(source=source, target=uuid4()))
+    assert graph.snapshot() is published
+    assert not graph.graph.nodes
+
+
+def test_requires_a_persistent_store():
+    with pytest.raises(TypeError):
+        ConcurrentHypergraph(Hypergraph())
+
+
+def test_racing_writers_cannot_break_a_constraint():
+    graph = ConcurrentHypergraph()
+    sources = [uuid4() for _ in range(20)]
+    barrier = threading.Barrier(8)
+    accepted = []
+
+    def writer():
+        barrier.wait()
+        for source in sources:
+            try:
+                graph.add_edge(SharedOwns(source=source, target=uuid4()))
+            except ConstraintViolation:
+                continue
+            accepted.append(source)
+
+    threads = [threading.Thread(target=writer) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(accepted) == sorted(sources)
+    snapshot = graph.snapshot()
+    assert len(snapshot.edges) == len(sources)
+    assert snapshot.check_consistency(processes=1).ok
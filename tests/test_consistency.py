@@ -0,0 +1,152 @@
+from uuid import uuid4
+
+import pytest
+
+from hgraph.core import consistency
+from hgraph.core.config import EdgeConfig, HyperedgeConfig
+from hgraph.core.edge import Edge, Hyperedge
+from hgraph.core.hypergraph import Hypergraph
+from hgraph.core.node import Node
+from hgraph.core.rules import EdgesFrom, validator
+
+
+class AuditFollows(Edge):
+    config: EdgeConfig = EdgeConfig(
+        functional=True, allows_duplicates=False, asymmetric=True
+    )
+
+
+class AuditTeam(Hyperedge):
+    config: HyperedgeConfig = HyperedgeConfig(functional=True)
+
+
+class AuditPerson(Node):
+    pass
+
+
+class AuditEmploys(Edge):
+    config: EdgeConfig = EdgeConfig(domain="AuditPerson")
+
+    @validator(staff=EdgesFrom("AuditEmploys", count=True))
+    def at_most_one(self, staff: int) -> bool:
+        return staff < 1
+
+
+class AuditCrew(Hyperedge):
+    config: HyperedgeConfig = HyperedgeConfig(range="AuditPerson")
+
+
+class InlineExecutor:
+    """Stands in for `ProcessPoolExecutor`, running tasks in this process."""
+
+    started = 0
+
+    def __init__(self, max_workers=None):
+        InlineExecutor.started += 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def map(self, function, items):
+        return map(function, items)
+
+
+@pytest.fixture
+def executor(monkeypatch):
+    InlineExecutor.started = 0
+    monkeypatch.setattr(consistency, "ProcessPoolExecutor", InlineExecutor)
+    monkeypatch.setattr(consistency.os, "cpu_count", lambda: 4)
+    return InlineExecutor
+
+
+def inconsistent():
+    """A graph loaded past validation with one violation per rule family."""
+    graph = Hypergraph()
+    a, b, c = uuid4(), uuid4(), uuid4()
+    for source, target in ((a, b), (a, b), (b, a), (b, c)):
+        graph.store.put_edge(AuditFollows(source=source, target=target))
+    graph.store.put_hyperedge(AuditTeam(sources=[a], targets=[b]))
+    graph.store.put_hyperedge(AuditTeam(sources=[a], targets=[c]))
+    return graph
+
+
+def found(report):
+    return sorted((v.rule, v.type, tuple(v.ids)) for v in report.violations)
+
+
+def test_reports_each_rule():
+    report = inconsistent().check_consistency(processes=1)
+    assert not report.ok
+    assert set(report.by_rule()) == {"duplicate", "asymmetric", "functional"}
+    assert report.checked == {"AuditFollows": 4, "AuditTeam": 2}
+
+
+def test_small_graph_runs_in_process_by_default(executor):
+    graph = inconsistent()
+    report = graph.check_consistency()
+    assert executor.started == 0
+    assert found(report) == found(graph.check_consistency(processes=1))
+
+
+def test_large_graph_uses_a_pool_by_default(executor, monkeypatch):
+    monkeypatch.setattr(consistency, "PARALLEL_MIN_ROWS", 1)
+    graph = inconsistent()
+    report = graph.check_consistency()
+    assert executor.started == 1
+    assert found(report) == found(graph.check_consistency(processes=1))
+
+
+def test_explicit_processes_always_use_a_pool(executor):
+    inconsistent().check_consistency(processes=2)
+    assert executor.started == 1
+
+
+def test_sharding_does_not_change_the_result():
+    graph = inconsistent()
+    expected = found(graph.check_consistency(processes=1))
+    assert found(graph.check_consistency(processes=1, shard_size=1)) == expected
+
+
+def test_audits_endpoints_and_custom_rules():
+    graph = Hypergraph()
+    person, thing = AuditPerson(), Node()
+    graph.add_nodes([person, thing])
+    kept = AuditEmploys(source=person.id, target=thing.id)
+    wrong_type = AuditEmploys(source=thing.id, target=person.id)
+    dangling = AuditEmploys(source=uuid4(), target=person.id)
+    crew = AuditCrew(sources=[person.id], targets=[thing.id])
+    for edge in (kept, wrong_type, dangling):
+        graph.store.put_edge(edge)
+    graph.store.put_edge(AuditEmploys(source=person.id, target=person.id))
+    graph.store.put_hyperedge(crew)
+    report = graph.check_consistency(processes=1)
+    rules = report.by_rule()
+    assert [v.ids for v in rules["domain"]] == [[wrong_type.id]]
+    assert [v.ids for v in rules["integrity"]] == [[dangling.id]]
+    assert [v.ids for v in rules["range"]] == [[crew.id]]
+    # Each of `person`'s two edges sees the other one.
+    assert len(rules["at_most_one"]) == 2
+
+
+def test_integrity_follows_the_graph_unless_given():
+    graph = Hypergraph(integrity=True)
+    graph.store.put_edge(AuditFollows(source=uuid4(), target=uuid4()))
+    assert set(graph.check_consistency(processes=1).by_rule()) == {"integrity"}
+    assert graph.check_consistency(processes=1, integrity=False).ok
+    assert not Hypergraph(graph.store).check_consistency(processes=1, integrity=True).ok
+
+
+def test_check_records_runs_record_checks():
+    graph = Hypergraph()
+    person = AuditPerson()
+    graph.add_node(person)
+    bad = AuditEmploys(source=uuid4(), target=person.id)
+    good = AuditEmploys(source=person.id, target=person.id)
+    graph.store.put_edge(bad)
+    graph.store.put_edge(good)
+    assert consistency.check_records(graph, edge_ids=[good.id]).ok
+    report = consistency.check_records(graph, edge_ids=[bad.id])
+    assert list(report.by_rule()) == ["integrity"]
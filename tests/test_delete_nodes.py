@@ -0,0 +1,88 @@
+from uuid import uuid4
+
+import pytest
+
+from hgraph.core.config import EdgeConfig, HyperedgeConfig
+from hgraph.core.edge import Edge, Hyperedge
+from hgraph.core.hypergraph import Hypergraph
+from hgraph.core.node import Node
+from hgraph.core.validator import ConstraintViolation
+
+
+class CascadeLinks(Edge):
+    pass
+
+
+class CascadeGroup(Hyperedge):
+    pass
+
+
+def populated(store=None):
+    graph = Hypergraph(store)
+    a, b, c = Node(), Node(), Node()
+    graph.add_nodes([a, b, c])
+    ab = CascadeLinks(source=a.id, target=b.id)
+    bc = CascadeLinks(source=b.id, target=c.id)
+    graph.add_edges([ab, bc])
+    return graph, a, b, c, ab, bc
+
+
+def test_default_leaves_edges_in_place(store):
+    graph, a, b, c, ab, bc = populated(store)
+    removed = graph.delete_node(b.id)
+    assert removed.nodes.removed == [b.id]
+    assert not removed.edges and not removed.hyperedges
+    assert set(graph.edges) == {ab.id, bc.id}
+
+
+def test_cascade_reports_deleted_edges(store):
+    graph, a, b, c, ab, bc = populated(store)
+    removed = graph.delete_node(b.id, cascade=True)
+    assert sorted(removed.edges.removed) == sorted([ab.id, bc.id])
+    assert not graph.edges
+    assert not graph.edge_index.outgoing(a.id)
+    assert graph.delete_node(uuid4(), cascade=True).empty
+
+
+def test_cascade_shrinks_or_deletes_hyperedges(store):
+    graph, a, b, c, _, _ = populated(store)
+    shrinks = CascadeGroup(sources=[a.id, b.id], targets=[c.id])
+    empties = CascadeGroup(sources=[b.id], targets=[c.id])
+    graph.add_hyperedges([shrinks, empties])
+    removed = graph.delete_nodes([b.id], cascade=True)
+    assert removed.hyperedges.changed == [shrinks.id]
+    assert removed.hyperedges.removed == [empties.id]
+    assert graph.hyperedges[shrinks.id].sources == [a.id]
+    assert not graph.hyperedge_index.containing(b.id)
+
+
+def test_shrink_that_breaks_a_config_raises_and_rolls_back():
+    class CascadeTeam(Hyperedge):
+        config: HyperedgeConfig = HyperedgeConfig(allows_duplicates=False)
+
+    graph, a, b, c, ab, bc = populated()
+    pair = CascadeTeam(sources=[a.id, b.id], targets=[c.id])
+    graph.add_hyperedges([pair, CascadeTeam(sources=[b.id], targets=[c.id])])
+    # Dropping `a` would leave `pair` a duplicate of the other team.
+    with pytest.raises(ConstraintViolation):
+        graph.delete_node(a.id, cascade=True)
+    assert a.id in graph.nodes
+    assert set(graph.edges) == {ab.id, bc.id}
+    assert graph.hyperedges[pair.id] == pair
+
+
+def test_cascade_removes_materialised_inverses():
+    class CascadeParentOf(Edge):
+        config: EdgeConfig = EdgeConfig(inverse="CascadeChildOf")
+
+    class CascadeChildOf(Edge):
+        config: EdgeConfig = EdgeConfig(inverse="CascadeParentOf")
+
+    graph = Hypergraph(inverses="materialize")
+    a, b = Node(), Node()
+    graph.add_nodes([a, b])
+    graph.add_edge(CascadeParentOf(source=a.id, target=b.id))
+    assert len(graph.edges) == 2
+    removed = graph.delete_node(a.id, cascade=True)
+    assert len(removed.edges.removed) == 2
+    assert not graph.edges
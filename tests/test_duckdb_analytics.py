@@ -0,0 +1,73 @@
+import pytest
+
+from hgraph.core.config import EdgeConfig, HyperedgeConfig
+from hgraph.core.edge import Edge, Hyperedge
+from hgraph.core.hypergraph import Hypergraph
+from hgraph.core.node import Node
+from hgraph.core.parquet import save_to_parquet
+
+pytest.importorskip("duckdb")
+pytest.importorskip("pyarrow")
+
+
+class DuckFollows(Edge):
+    config: EdgeConfig = EdgeConfig(functional=True, irreflexive=True)
+
+
+class DuckGroup(Hyperedge):
+    config: HyperedgeConfig = HyperedgeConfig(cyclic=False)
+
+
+def populated():
+    graph = Hypergraph()
+    a, b, c = Node(), Node(), Node()
+    graph.add_nodes([a, b, c])
+    graph.add_edge(DuckFollows(source=a.id, target=b.id))
+    graph.add_edge(DuckFollows(source=b.id, target=c.id))
+    graph.add_hyperedge(DuckGroup(sources=[a.id], targets=[b.id, c.id]))
+    return graph, (a, b, c)
+
+
+def test_mirror_counts_and_degrees():
+    graph, _ = populated()
+    analytics = graph.to_duckdb()
+    assert analytics.type_counts("nodes") == {"Node": 3}
+    assert analytics.type_counts("edges") == {"DuckFollows": 2}
+    assert analytics.degree_distribution("out") == {0: 1, 1: 2}
+    assert analytics.degree_distribution("both") == {1: 2, 2: 1}
+    assert analytics.hyperedge_degree_distribution() == {1: 3}
+    with pytest.raises(ValueError):
+        analytics.degree_distribution("sideways")
+
+
+def test_mirror_replaces_previous_contents():
+    graph, _ = populated()
+    analytics = graph.to_duckdb()
+    analytics.mirror(Hypergraph())
+    assert analytics.type_counts("edges") == {}
+
+
+def test_consistency_matches_in_memory_audit():
+    graph, (a, b, c) = populated()
+    graph.store.put_edge(DuckFollows(source=a.id, target=c.id))
+    graph.store.put_edge(DuckFollows(source=c.id, target=c.id))
+    graph.store.put_hyperedge(DuckGroup(sources=[a.id], targets=[a.id]))
+
+    def found(report):
+        return sorted((v.rule, v.type, tuple(v.ids)) for v in report.violations)
+
+    mirrored = graph.to_duckdb().check_consistency()
+    assert found(mirrored) == found(graph.check_consistency(processes=1))
+    rules = {"functional", "irreflexive", "cyclic", "reflexive"}
+    assert set(mirrored.by_rule()) == rules
+
+
+def test_import_parquet_filters_types(tmp_path):
+    graph, _ = populated()
+    save_to_parquet(graph, str(tmp_path))
+    analytics = graph.to_duckdb()
+    analytics.clear()
+    analytics.import_parquet(str(tmp_path), types=["DuckFollows"])
+    assert analytics.type_counts("edges") == {"DuckFollows": 2}
+    assert analytics.type_counts("hyperedges") == {}
+    assert analytics.check_consistency().ok
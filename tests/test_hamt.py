@@ -0,0 +1,77 @@
+import random
+
+import pytest
+
+from hgraph.core.hamt import HAMT, PersistentDict
+
+
+class Colliding:
+    """A key whose hash is shared with many others."""
+
+    def __init__(self, value: int):
+        self.value = value
+
+    def __hash__(self) -> int:
+        return self.value % 3
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Colliding) and other.value == self.value
+
+    def __repr__(self) -> str:
+        return f"Colliding({self.value})"
+
+
+@pytest.mark.parametrize("make_key", [int, Colliding])
+def test_matches_dict_under_random_writes(make_key):
+    rng = random.Random(11)
+    persistent, expected = PersistentDict(), {}
+    for step in range(3000):
+        key = make_key(rng.randrange(400))
+        if rng.random() < 0.3:
+            assert persistent.pop(key, None) == expected.pop(key, None)
+        else:
+            persistent[key] = expected[key] = step
+        if step % 500 == 0:
+            persistent = persistent.copy()
+    assert len(persistent) == len(expected)
+    assert dict(persistent.items()) == expected
+
+
+def test_copies_do_not_see_each_others_writes():
+    original = PersistentDict()
+    for key in range(100):
+        original[key] = key
+    copy = original.copy()
+    copy[0] = "changed"
+    del copy[1]
+    original[2] = "mine"
+    assert original[0] == 0 and 1 in original
+    assert copy[2] == 2
+    with pytest.raises(KeyError):
+        del copy[1]
+
+
+def test_hamt_is_immutable():
+    empty = HAMT()
+    one = empty.set("a", 1)
+    assert "a" not in empty
+    assert one["a"] == 1
+    assert one.delete("a") == {}
+    assert HAMT.from_items([("a", 1), ("b", 2)]) == {"a": 1, "b": 2}
+
+
+@pytest.mark.parametrize("make_key", [int, Colliding])
+def test_diff_reports_added_removed_and_changed(make_key):
+    base = PersistentDict()
+    for key in range(200):
+        base[make_key(key)] = key
+    old = base.copy()
+    base[make_key(5)] = "changed"
+    del base[make_key(6)]
+    base[make_key(500)] = 500
+    changes = {
+        key.value if isinstance(key, Colliding) else key: (before, after)
+        for key, before, after in old.map.diff(base.map)
+    }
+    assert changes == {5: (5, "changed"), 6: (6, None), 500: (None, 500)}
+    assert list(base.map.diff(base.map)) == []
@@ -0,0 +1,68 @@
+from uuid import uuid4
+
+import pytest
+
+from hgraph.core.config import HyperedgeConfig
+from hgraph.core.edge import Hyperedge
+from hgraph.core.hypergraph import Hypergraph
+from hgraph.core.index import HyperedgeIndex, canonical_nodes
+from hgraph.core.validator import ConstraintViolation
+
+
+class KeyedGroup(Hyperedge):
+    config: HyperedgeConfig = HyperedgeConfig(unordered=True)
+
+
+class KeyedDelegation(Hyperedge):
+    config: HyperedgeConfig = HyperedgeConfig(functional=True, inverse_functional=True)
+
+
+def test_canonical_nodes_ignores_order_only_when_unordered():
+    a, b = uuid4(), uuid4()
+    assert canonical_nodes([a, b], True) == canonical_nodes([b, a], True)
+    assert canonical_nodes([a, b], False) != canonical_nodes([b, a], False)
+
+
+def test_member_and_incidence_buckets():
+    a, b, c = uuid4(), uuid4(), uuid4()
+    group = KeyedGroup(sources=[a, b], targets=[c])
+    index = HyperedgeIndex([group])
+    sources, targets = HyperedgeIndex.keys(KeyedGroup(sources=[b, a], targets=[c]))
+
+    assert list(index.with_members("KeyedGroup", sources, targets).values()) == [
+        group.id
+    ]
+    assert list(index.containing(a, role="source").values()) == [group.id]
+    assert not index.containing(a, role="target")
+    assert list(index.containing(c, "KeyedGroup").values()) == [group.id]
+
+    index.remove(group)
+    assert not index.of_type("KeyedGroup")
+    assert not index.containing(a)
+
+
+def test_unordered_duplicates_are_rejected_in_any_order():
+    a, b, c = uuid4(), uuid4(), uuid4()
+    graph = Hypergraph()
+    graph.add_hyperedge(KeyedGroup(sources=[a, b], targets=[c]))
+    with pytest.raises(ConstraintViolation, match="Duplicate"):
+        graph.add_hyperedge(KeyedGroup(sources=[b, a], targets=[c]))
+
+
+def test_functional_sides():
+    a, b, c, d = uuid4(), uuid4(), uuid4(), uuid4()
+    graph = Hypergraph()
+    graph.add_hyperedge(KeyedDelegation(sources=[a], targets=[b]))
+    with pytest.raises(ConstraintViolation, match="functional"):
+        graph.add_hyperedge(KeyedDelegation(sources=[a], targets=[c]))
+    with pytest.raises(ConstraintViolation, match="inverse-functional"):
+        graph.add_hyperedge(KeyedDelegation(sources=[d], targets=[b]))
+
+
+def test_default_hyperedges_reject_overlap_and_reflexive_sides():
+    a, b = uuid4(), uuid4()
+    graph = Hypergraph()
+    with pytest.raises(ConstraintViolation, match="non-cyclic"):
+        graph.add_hyperedge(KeyedGroup(sources=[a, b], targets=[b]))
+    with pytest.raises(ConstraintViolation):
+        graph.add_hyperedge(Hyperedge(sources=[], targets=[]))
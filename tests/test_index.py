@@ -0,0 +1,107 @@
+from uuid import uuid4
+
+import pytest
+
+from hgraph.core.config import EdgeConfig
+from hgraph.core.edge import Edge
+from hgraph.core.hypergraph import Hypergraph
+from hgraph.core.index import EdgeIndex
+from hgraph.core.validator import ConstraintValidator, ConstraintViolation
+
+
+class IndexedFollows(Edge):
+    config: EdgeConfig = EdgeConfig(
+        irreflexive=True, asymmetric=True, allows_duplicates=False
+    )
+
+
+class IndexedOwns(Edge):
+    config: EdgeConfig = EdgeConfig(functional=True, inverse_functional=True)
+
+
+class IndexedAncestor(Edge):
+    config: EdgeConfig = EdgeConfig(antisymmetric=True)
+
+
+def test_buckets_follow_add_and_remove():
+    a, b, c = uuid4(), uuid4(), uuid4()
+    first = IndexedFollows(source=a, target=b)
+    second = IndexedFollows(source=a, target=c)
+    index = EdgeIndex([first, second])
+
+    assert set(index.from_source("IndexedFollows", a).values()) == {
+        first.id,
+        second.id,
+    }
+    assert list(index.to_target("IndexedFollows", b).values()) == [first.id]
+    assert list(index.between("IndexedFollows", a, c).values()) == [second.id]
+    assert len(index.of_type("IndexedFollows")) == 2
+    assert len(index.outgoing(a)) == 2 and len(index.incoming(c)) == 1
+
+    index.remove(first)
+    assert list(index.of_type("IndexedFollows").values()) == [second.id]
+    assert not index.between("IndexedFollows", a, b)
+    # Emptied buckets are dropped rather than left behind.
+    assert ("IndexedFollows", b.int) not in index.by_target
+
+
+def test_lookups_are_scoped_by_type():
+    a, b = uuid4(), uuid4()
+    index = EdgeIndex([IndexedFollows(source=a, target=b)])
+    assert not index.from_source("IndexedOwns", a)
+    assert len(index.outgoing(a, "IndexedFollows")) == 1
+
+
+@pytest.mark.parametrize(
+    "existing, new, message",
+    [
+        ((0, 1), (0, 1), "Duplicate"),
+        ((0, 1), (1, 0), "asymmetric"),
+        (None, (0, 0), "irreflexive"),
+    ],
+)
+def test_follows_constraints(existing, new, message):
+    nodes = [uuid4(), uuid4()]
+    graph = Hypergraph()
+    if existing is not None:
+        graph.add_edge(
+            IndexedFollows(source=nodes[existing[0]], target=nodes[existing[1]])
+        )
+    with pytest.raises(ConstraintViolation, match=message):
+        graph.add_edge(IndexedFollows(source=nodes[new[0]], target=nodes[new[1]]))
+
+
+def test_functional_and_inverse_functional():
+    a, b, c = uuid4(), uuid4(), uuid4()
+    graph = Hypergraph()
+    graph.add_edge(IndexedOwns(source=a, target=b))
+    with pytest.raises(ConstraintViolation, match="functional"):
+        graph.add_edge(IndexedOwns(source=a, target=c))
+    with pytest.raises(ConstraintViolation, match="inverse-functional"):
+        graph.add_edge(IndexedOwns(source=c, target=b))
+
+
+def test_antisymmetric_allows_self_loops_only():
+    a, b = uuid4(), uuid4()
+    graph = Hypergraph()
+    graph.add_edge(IndexedAncestor(source=a, target=b))
+    graph.add_edge(IndexedAncestor(source=a, target=a))
+    with pytest.raises(ConstraintViolation, match="antisymmetric"):
+        graph.add_edge(IndexedAncestor(source=b, target=a))
+
+
+def test_update_does_not_conflict_with_itself():
+    a, b = uuid4(), uuid4()
+    graph = Hypergraph()
+    edge = IndexedOwns(source=a, target=b)
+    graph.add_edge(edge)
+    graph.update_edge(edge.id, edge)
+    assert graph.get_edge(edge.id) == edge
+
+
+def test_validator_builds_an_index_when_none_is_given():
+    a, b = uuid4(), uuid4()
+    stored = IndexedOwns(source=a, target=b)
+    validator = ConstraintValidator({stored.id: stored}, {})
+    with pytest.raises(ConstraintViolation):
+        validator.validate_edge(IndexedOwns(source=a, target=uuid4()))
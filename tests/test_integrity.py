@@ -0,0 +1,95 @@
+from uuid import uuid4
+
+import pytest
+
+from hgraph.core.bloom import BloomFilter
+from hgraph.core.config import EdgeConfig, HyperedgeConfig
+from hgraph.core.edge import Edge, Hyperedge
+from hgraph.core.hypergraph import Hypergraph
+from hgraph.core.node import Node
+from hgraph.core.sqlite_store import SQLiteStore
+from hgraph.core.validator import BatchConstraintViolation, ConstraintViolation
+
+
+class IntPerson(Node):
+    pass
+
+
+class IntEmployee(IntPerson):
+    pass
+
+
+class IntKnows(Edge):
+    config: EdgeConfig = EdgeConfig(domain="IntPerson", range="IntPerson")
+
+
+class IntLinks(Edge):
+    pass
+
+
+class IntClub(Hyperedge):
+    config: HyperedgeConfig = HyperedgeConfig(domain="IntPerson")
+
+
+def test_integrity_rejects_dangling_endpoints(store):
+    graph = Hypergraph(store, integrity=True)
+    a = Node()
+    graph.add_node(a)
+    with pytest.raises(ConstraintViolation, match="not a stored node"):
+        graph.add_edge(IntLinks(source=a.id, target=uuid4()))
+    with pytest.raises(ConstraintViolation):
+        graph.add_hyperedge(IntClub(sources=[a.id], targets=[uuid4()]))
+    # Without integrity, only typed ends are checked.
+    Hypergraph(store).add_edge(IntLinks(source=a.id, target=uuid4()))
+
+
+def test_domain_and_range_accept_subtypes(store):
+    graph = Hypergraph(store)
+    person, employee, thing = IntPerson(), IntEmployee(), Node()
+    graph.add_nodes([person, employee, thing])
+    graph.add_edge(IntKnows(source=employee.id, target=person.id))
+    with pytest.raises(ConstraintViolation, match="must be a IntPerson"):
+        graph.add_edge(IntKnows(source=person.id, target=thing.id))
+    with pytest.raises(ConstraintViolation, match="not a stored node"):
+        graph.add_edge(IntKnows(source=uuid4(), target=person.id))
+    graph.add_hyperedge(IntClub(sources=[person.id, employee.id], targets=[thing.id]))
+
+
+def test_batches_report_each_dangling_edge():
+    graph = Hypergraph(integrity=True)
+    a, b = Node(), Node()
+    graph.add_nodes([a, b])
+    edges = [
+        IntLinks(source=a.id, target=b.id),
+        IntLinks(source=a.id, target=uuid4()),
+        IntLinks(source=uuid4(), target=b.id),
+    ]
+    with pytest.raises(BatchConstraintViolation) as raised:
+        graph.add_edges(edges, fail_fast=False)
+    assert [position for position, _ in raised.value.violations] == [1, 2]
+    assert not graph.edges
+
+
+def test_sqlite_skips_queries_for_ids_never_stored():
+    store = SQLiteStore()
+    graph = Hypergraph(store, integrity=True)
+    nodes = [Node() for _ in range(3000)]
+    graph.add_nodes(nodes)
+    assert store.node_types([nodes[0].id]) == {nodes[0].id: "Node"}
+    queries = []
+    execute = store.execute
+    store.execute = lambda *args: queries.append(args) or execute(*args)
+    assert store.node_types([uuid4() for _ in range(20)]) == {}
+    assert len(queries) <= 1
+    # Nodes added after the filter was built are still found.
+    late = Node()
+    graph.add_node(late)
+    assert store.node_types([late.id]) == {late.id: "Node"}
+
+
+def test_bloom_filter_has_no_false_negatives():
+    keys = [uuid4().int for _ in range(5000)]
+    bloom = BloomFilter.of(keys, len(keys))
+    assert all(key in bloom for key in keys)
+    misses = sum(uuid4().int in bloom for _ in range(5000))
+    assert misses < 250
@@ -0,0 +1,123 @@
+from uuid import uuid4
+
+import pytest
+
+from hgraph.core.config import EdgeConfig
+from hgraph.core.edge import Edge
+from hgraph.core.hypergraph import Hypergraph
+from hgraph.core.node import Node
+from hgraph.core.validator import ConstraintViolation
+
+
+class InvSiblingOf(Edge):
+    config: EdgeConfig = EdgeConfig(symmetric=True, allows_duplicates=False)
+
+
+class InvMarriedTo(Edge):
+    config: EdgeConfig = EdgeConfig(symmetric=True, functional=True)
+
+
+class InvHasChild(Edge):
+    config: EdgeConfig = EdgeConfig(inverse="InvChildOf", transitive=True)
+
+
+class InvChildOf(Edge):
+    config: EdgeConfig = EdgeConfig(asymmetric=True)
+
+
+def test_virtual_symmetric_duplicate_is_rejected():
+    graph = Hypergraph(inverses="virtual")
+    a, b = uuid4(), uuid4()
+    graph.add_edge(InvSiblingOf(source=a, target=b))
+    with pytest.raises(ConstraintViolation):
+        graph.add_edge(InvSiblingOf(source=b, target=a))
+
+
+def test_virtual_duplicate_within_a_batch_is_rejected():
+    graph = Hypergraph(inverses="virtual")
+    a, b = uuid4(), uuid4()
+    with pytest.raises(ConstraintViolation):
+        graph.add_edges(
+            [InvSiblingOf(source=a, target=b), InvSiblingOf(source=b, target=a)]
+        )
+    assert not graph.edges
+
+
+def test_virtual_functional_counts_implied_edges():
+    graph = Hypergraph(inverses="virtual")
+    a, b, c = uuid4(), uuid4(), uuid4()
+    graph.add_edge(InvMarriedTo(source=a, target=b))
+    # Implies a -> c next to the stored a -> b.
+    with pytest.raises(ConstraintViolation):
+        graph.add_edge(InvMarriedTo(source=c, target=a))
+    # b already has a spouse through the implied b -> a.
+    with pytest.raises(ConstraintViolation):
+        graph.add_edge(InvMarriedTo(source=b, target=c))
+
+
+def test_virtual_asymmetric_sees_inverse_of_another_type():
+    graph = Hypergraph(inverses="virtual")
+    parent, child = uuid4(), uuid4()
+    graph.add_edge(InvHasChild(source=parent, target=child))
+    # The stored edge implies ChildOf(child -> parent).
+    with pytest.raises(ConstraintViolation):
+        graph.add_edge(InvChildOf(source=parent, target=child))
+
+
+def test_virtual_update_does_not_conflict_with_its_own_inverse():
+    graph = Hypergraph(inverses="virtual")
+    a, b = uuid4(), uuid4()
+    edge = InvSiblingOf(source=a, target=b)
+    loop = InvSiblingOf(source=a, target=a)
+    graph.add_edges([edge, loop])
+    graph.update_edge(edge.id, InvSiblingOf(source=a, target=b))
+    graph.update_edge(edge.id, InvSiblingOf(source=b, target=a))
+    graph.update_edge(loop.id, InvSiblingOf(source=a, target=a))
+    assert len(graph.edges) == 2
+
+
+def test_none_mode_ignores_implied_edges():
+    graph = Hypergraph()
+    a, b = uuid4(), uuid4()
+    graph.add_edge(InvSiblingOf(source=a, target=b))
+    graph.add_edge(InvSiblingOf(source=b, target=a))
+    assert len(graph.edges) == 2
+
+
+def test_virtual_queries_read_stored_edges_backwards():
+    graph = Hypergraph(inverses="virtual")
+    parent, child = Node(), Node()
+    graph.add_nodes([parent, child])
+    graph.add_edge(InvHasChild(source=parent.id, target=child.id))
+    assert len(graph.edges) == 1
+    (implied,) = graph.find_edges(source=child.id, type="InvChildOf")
+    assert isinstance(implied, InvChildOf)
+    assert implied.target == parent.id
+    assert graph.get_neighbors(child.id, type="InvChildOf") == [parent]
+
+
+def test_materialize_stores_and_deletes_inverses_together():
+    graph = Hypergraph(inverses="materialize")
+    a, b = uuid4(), uuid4()
+    edge = InvSiblingOf(source=a, target=b)
+    graph.add_edge(edge)
+    assert len(graph.edges) == 2
+    with pytest.raises(ConstraintViolation):
+        graph.add_edge(InvSiblingOf(source=b, target=a))
+    graph.delete_edge(edge.id)
+    assert not graph.edges
+
+
+def test_virtual_reachability_follows_inverses():
+    graph = Hypergraph(inverses="virtual")
+    grandparent, parent, child = uuid4(), uuid4(), uuid4()
+    graph.add_edge(InvHasChild(source=grandparent, target=parent))
+    assert graph.is_reachable(parent, grandparent, "InvChildOf")
+    # Built closures pick up later writes, inside transactions too.
+    last = InvHasChild(source=parent, target=child)
+    with graph.transaction():
+        graph.add_edge(last)
+    assert graph.is_reachable(child, parent, "InvChildOf")
+    assert graph.is_reachable(grandparent, child, "InvHasChild")
+    graph.delete_edge(last.id)
+    assert not graph.is_reachable(child, parent, "InvChildOf")
@@ -0,0 +1,116 @@
+from uuid import uuid4
+
+import pytest
+
+from hgraph.core.config import EdgeConfig
+from hgraph.core.edge import Edge, Hyperedge
+from hgraph.core.hypergraph import Hypergraph
+from hgraph.core.jsonl import iter_records, load_from_json, save_to_json
+from hgraph.core.node import Node
+from hgraph.core.validator import ConstraintViolation
+
+
+class JsonPerson(Node):
+    name: str = ""
+
+
+class JsonManages(Edge):
+    config: EdgeConfig = EdgeConfig(functional=True)
+    since: int = 0
+
+
+class JsonCommittee(Hyperedge):
+    pass
+
+
+def populated():
+    graph = Hypergraph()
+    a, b = JsonPerson(name="a"), JsonPerson(name="b")
+    graph.add_nodes([a, b])
+    graph.add_edge(JsonManages(source=a.id, target=b.id, since=2020))
+    graph.add_hyperedge(JsonCommittee(sources=[a.id], targets=[b.id]))
+    return graph
+
+
+@pytest.mark.parametrize("name", ["graph.jsonl", "graph.jsonl.gz"])
+def test_round_trip(tmp_path, name):
+    graph = populated()
+    path = str(tmp_path / name)
+    save_to_json(graph, path)
+    loaded = load_from_json(path, batch_size=1)
+    assert dict(loaded.nodes) == dict(graph.nodes)
+    assert dict(loaded.edges) == dict(graph.edges)
+    assert dict(loaded.hyperedges) == dict(graph.hyperedges)
+    assert [kind for kind, _ in iter_records(path)] == [
+        "node",
+        "node",
+        "edge",
+        "hyperedge",
+    ]
+
+
+def test_config_is_not_written_per_record(tmp_path):
+    path = str(tmp_path / "graph.jsonl")
+    save_to_json(populated(), path)
+    assert all("config" not in data for _, data in iter_records(path))
+
+
+def invalid_snapshot(path):
+    graph = Hypergraph()
+    a = uuid4()
+    # Written around the validator, as a corrupt snapshot would be.
+    graph.store.put_edge(JsonManages(source=a, target=uuid4()))
+    graph.store.put_edge(JsonManages(source=a, target=uuid4()))
+    save_to_json(graph, path)
+
+
+def test_untrusted_load_validates(tmp_path):
+    path = str(tmp_path / "bad.jsonl")
+    invalid_snapshot(path)
+    with pytest.raises(ConstraintViolation):
+        load_from_json(path)
+
+
+def test_trusted_load_skips_validation(tmp_path):
+    path = str(tmp_path / "bad.jsonl")
+    invalid_snapshot(path)
+    assert len(load_from_json(path, trusted=True).edges) == 2
+
+
+class JsonAncestorOf(Edge):
+    config: EdgeConfig = EdgeConfig(transitive=True)
+
+
+class JsonParentOf(Edge):
+    config: EdgeConfig = EdgeConfig(inverse="JsonChildOf")
+
+
+class JsonChildOf(Edge):
+    config: EdgeConfig = EdgeConfig(inverse="JsonParentOf")
+
+
+def test_trusted_load_keeps_built_closures_current():
+    graph = Hypergraph()
+    a, b, c = uuid4(), uuid4(), uuid4()
+    graph.add_edge(JsonAncestorOf(source=a, target=b))
+    assert not graph.is_reachable(a, c, "JsonAncestorOf")
+    graph.load_records("edges", [JsonAncestorOf(source=b, target=c)], trusted=True)
+    assert graph.is_reachable(a, c, "JsonAncestorOf")
+
+
+def test_trusted_load_materialises_inverses():
+    graph = Hypergraph(inverses="materialize")
+    parent = JsonParentOf(source=uuid4(), target=uuid4())
+    graph.load_records("edges", [parent], trusted=True)
+    (child,) = graph.find_edges(type="JsonChildOf")
+    assert (child.source, child.target) == (parent.target, parent.source)
+
+
+def test_trusted_load_is_refused_in_a_transaction():
+    graph = Hypergraph()
+    with pytest.raises(RuntimeError):
+        with graph.transaction():
+            graph.load_records(
+                "edges", [Edge(source=uuid4(), target=uuid4())], trusted=True
+            )
+    assert not graph.edges
@@ -0,0 +1,112 @@
+from hgraph.core.config import EdgeConfig
+from hgraph.core.edge import Edge, Hyperedge
+from hgraph.core.hypergraph import Hypergraph
+from hgraph.core.node import Node
+from hgraph.core.query import Matcher, QueryPattern
+
+
+class MatchPerson(Node):
+    name: str = ""
+
+
+class MatchStudent(MatchPerson):
+    pass
+
+
+class MatchParentOf(Edge):
+    config: EdgeConfig = EdgeConfig(inverse="MatchChildOf")
+
+
+class MatchChildOf(Edge):
+    pass
+
+
+class MatchClub(Hyperedge):
+    pass
+
+
+def family(inverses="none"):
+    graph = Hypergraph(inverses=inverses)
+    grandparent = MatchPerson(name="g")
+    parent = MatchPerson(name="p")
+    child = MatchStudent(name="c")
+    graph.add_nodes([grandparent, parent, child])
+    graph.add_edge(MatchParentOf(source=grandparent.id, target=parent.id))
+    graph.add_edge(MatchParentOf(source=parent.id, target=child.id))
+    return graph, grandparent, parent, child
+
+
+def test_grandparent_pattern():
+    graph, grandparent, _, child = family()
+    results = graph.match("MatchParentOf(a, b), MatchParentOf(b, c)")
+    assert [(r["a"], r["c"]) for r in results] == [(grandparent.id, child.id)]
+
+
+def test_where_filters_nodes():
+    graph, _, parent, _ = family()
+    pattern = QueryPattern().node("x", "MatchPerson", name="p")
+    assert graph.match(pattern) == [{"x": parent.id}]
+
+
+def test_node_type_matches_subtypes():
+    graph, grandparent, parent, child = family()
+    people = {r["x"] for r in graph.match("MatchPerson(x)")}
+    assert people == {grandparent.id, parent.id, child.id}
+    assert graph.match("MatchStudent(x)") == [{"x": child.id}]
+    bound = graph.match("MatchParentOf(p, c), MatchPerson(c)")
+    assert len(bound) == 2
+
+
+def test_edge_variable_binds_the_edge_id():
+    graph, grandparent, parent, _ = family()
+    (edge,) = graph.find_edges(source=grandparent.id)
+    results = graph.match(QueryPattern().edge("a", "b", "MatchParentOf", var="e"))
+    assert {"a": grandparent.id, "b": parent.id, "e": edge.id} in results
+
+
+def test_virtual_inverse_edges_match():
+    graph, grandparent, parent, child = family(inverses="virtual")
+    results = graph.match("MatchChildOf(c, p), MatchChildOf(p, g)")
+    assert [(r["c"], r["g"]) for r in results] == [(child.id, grandparent.id)]
+    # An implied edge bound to a variable can be joined on again.
+    pattern = (
+        QueryPattern()
+        .edge("c", "p", "MatchChildOf", var="e")
+        .edge("x", "y", "MatchChildOf", var="e")
+    )
+    assert len(graph.match(pattern)) == 2
+    assert family()[0].match("MatchChildOf(c, p)") == []
+
+
+def test_member_patterns():
+    graph, grandparent, parent, child = family()
+    club = MatchClub(sources=[grandparent.id], targets=[parent.id, child.id])
+    graph.add_hyperedge(club)
+    members = graph.match("MatchClub(h, x), MatchStudent(x)")
+    assert members == [{"h": club.id, "x": child.id}]
+    pattern = QueryPattern().member("h", "x", role="source").node("x", "MatchPerson")
+    assert graph.match(pattern) == [{"h": club.id, "x": grandparent.id}]
+
+
+def test_limit_stops_the_pipeline_early(monkeypatch):
+    graph = Hypergraph()
+    parents = [MatchPerson() for _ in range(50)]
+    children = [MatchPerson() for _ in range(50)]
+    graph.add_nodes(parents + children)
+    for parent in parents:
+        for child in children[:5]:
+            graph.add_edge(MatchParentOf(source=parent.id, target=child.id))
+    checked = []
+    matches = Matcher.matches
+
+    def counting(model, type, where):
+        checked.append(model.id)
+        return matches(model, type, where)
+
+    monkeypatch.setattr(Matcher, "matches", staticmethod(counting))
+    pattern = QueryPattern().node("p", "MatchPerson").edge("p", "c", "MatchParentOf")
+    assert len(graph.match(pattern, limit=3)) == 3
+    limited = len(checked)
+    checked.clear()
+    assert len(graph.match(pattern)) == 250
+    assert limited < len(checked) / 10
@@ -0,0 +1,164 @@
+from uuid import uuid4
+
+import pytest
+
+from hgraph.core import consistency
+from hgraph.core.config import EdgeConfig
+from hgraph.core.edge import Edge
+from hgraph.core.hypergraph import Hypergraph
+from hgraph.core.merge import MergeConflict
+from hgraph.core.node import Node
+from hgraph.core.persistent_store import PersistentStore
+from hgraph.core.rules import EdgesFrom, validator
+
+
+class MergePerson(Node):
+    name: str = ""
+
+
+class MergeManagedBy(Edge):
+    config: EdgeConfig = EdgeConfig(functional=True)
+
+
+class MergeKnows(Edge):
+    pass
+
+
+class MergeLeads(Edge):
+    config: EdgeConfig = EdgeConfig(domain="MergePerson")
+
+
+class MergeEmploys(Edge):
+    @validator(staff=EdgesFrom("MergeEmploys", count=True))
+    def at_most_two(self, staff: int) -> bool:
+        return staff < 2
+
+
+def forked():
+    base = Hypergraph(PersistentStore())
+    person = MergePerson(name="base")
+    base.add_node(person)
+    return base, base.branch(), base.branch(), person
+
+
+def test_disjoint_changes_merge_cleanly():
+    base, ours, theirs, person = forked()
+    mine, other = MergePerson(name="mine"), MergePerson(name="other")
+    ours.add_node(mine)
+    theirs.add_node(other)
+    theirs.update_node(person.id, MergePerson(name="renamed"))
+    merged, conflicts = ours.merge(base, theirs)
+    assert conflicts == []
+    assert {mine.id, other.id, person.id} == set(merged.nodes)
+    assert merged.nodes[person.id].name == "renamed"
+    assert other.id not in ours.nodes
+
+
+def test_same_change_on_both_sides_is_not_a_conflict():
+    base, ours, theirs, person = forked()
+    for side in (ours, theirs):
+        side.update_node(person.id, MergePerson(name="same"))
+    merged, conflicts = ours.merge(base, theirs)
+    assert conflicts == []
+
+
+def test_concurrent_edits_conflict():
+    base, ours, theirs, person = forked()
+    ours.update_node(person.id, MergePerson(name="ours"))
+    theirs.update_node(person.id, MergePerson(name="theirs"))
+    with pytest.raises(MergeConflict) as raised:
+        ours.merge(base, theirs)
+    (conflict,) = raised.value.conflicts
+    assert (conflict.rule, conflict.ids) == ("concurrent", [person.id])
+    merged, _ = ours.merge(base, theirs, strategy="theirs")
+    assert merged.nodes[person.id].name == "theirs"
+
+
+def test_constraint_conflict_across_sides():
+    base, ours, theirs, person = forked()
+    ours.add_edge(MergeManagedBy(source=person.id, target=uuid4()))
+    theirs.add_edge(MergeManagedBy(source=person.id, target=uuid4()))
+    with pytest.raises(MergeConflict) as raised:
+        ours.merge(base, theirs)
+    assert raised.value.conflicts[0].rule == "functional"
+    merged, resolved = ours.merge(base, theirs, strategy="ours")
+    assert [c.rule for c in resolved] == ["functional"]
+    assert set(merged.edges) == set(ours.edges)
+    assert merged.check_consistency(processes=1).ok
+
+
+def test_check_records_audits_only_their_neighbourhood():
+    graph = Hypergraph()
+    source = uuid4()
+    first = MergeManagedBy(source=source, target=uuid4())
+    graph.store.put_edge(first)
+    graph.store.put_edge(MergeManagedBy(source=source, target=uuid4()))
+    clean = MergeManagedBy(source=uuid4(), target=uuid4())
+    graph.store.put_edge(clean)
+    assert consistency.check_records(graph, edge_ids=[clean.id]).ok
+    report = consistency.check_records(graph, edge_ids=[first.id])
+    assert list(report.by_rule()) == ["functional"]
+
+
+def test_edge_to_a_node_deleted_on_the_other_side_conflicts():
+    base = Hypergraph(PersistentStore(), integrity=True)
+    a, b = Node(), Node()
+    base.add_nodes([a, b])
+    ours, theirs = base.branch(), base.branch()
+    ours.delete_node(b.id)
+    knows = MergeKnows(source=a.id, target=b.id)
+    theirs.add_edge(knows)
+    with pytest.raises(MergeConflict) as raised:
+        ours.merge(base, theirs)
+    (conflict,) = raised.value.conflicts
+    assert conflict.rule == "integrity"
+    assert set(conflict.ids) == {knows.id, b.id}
+    merged, _ = ours.merge(base, theirs, strategy="ours")
+    assert knows.id not in merged.edges
+    merged, _ = ours.merge(base, theirs, strategy="theirs")
+    assert b.id in merged.nodes
+    assert merged.check_consistency(processes=1).ok
+
+
+def test_edge_from_a_node_retyped_on_the_other_side_conflicts():
+    base, ours, theirs, person = forked()
+    ours.update_node(person.id, Node())
+    leads = MergeLeads(source=person.id, target=uuid4())
+    theirs.add_edge(leads)
+    with pytest.raises(MergeConflict) as raised:
+        ours.merge(base, theirs)
+    assert [c.rule for c in raised.value.conflicts] == ["domain"]
+    merged, _ = ours.merge(base, theirs, strategy="theirs")
+    assert isinstance(merged.nodes[person.id], MergePerson)
+    assert merged.check_consistency(processes=1).ok
+
+
+def test_custom_rule_counts_edges_from_both_sides():
+    base = Hypergraph(PersistentStore())
+    company = uuid4()
+    base.add_edge(MergeEmploys(source=company, target=uuid4()))
+    ours, theirs = base.branch(), base.branch()
+    mine = MergeEmploys(source=company, target=uuid4())
+    other = MergeEmploys(source=company, target=uuid4())
+    ours.add_edge(mine)
+    theirs.add_edge(other)
+    with pytest.raises(MergeConflict) as raised:
+        ours.merge(base, theirs)
+    assert {c.rule for c in raised.value.conflicts} == {"at_most_two"}
+    assert {i for c in raised.value.conflicts for i in c.ids} == {mine.id, other.id}
+    merged, resolved = ours.merge(base, theirs, strategy="ours")
+    assert resolved
+    assert set(merged.edges) == set(ours.edges)
+    assert merged.check_consistency(processes=1).ok
+
+
+def test_unrelated_node_changes_do_not_conflict():
+    base = Hypergraph(PersistentStore(), integrity=True)
+    a, b, c = Node(), Node(), Node()
+    base.add_nodes([a, b, c])
+    ours, theirs = base.branch(), base.branch()
+    ours.delete_node(c.id)
+    theirs.add_edge(MergeKnows(source=a.id, target=b.id))
+    merged, conflicts = ours.merge(base, theirs)
+    assert conflicts == []
+    assert len(merged.edges) == 1
@@ -0,0 +1,91 @@
+import json
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from hgraph.core.config import EdgeConfig, HyperedgeConfig
+from hgraph.core.edge import Edge, Hyperedge
+from hgraph.core.jsonl import load_from_json
+from hgraph.core.node import Node
+from hgraph.core.registry import SchemaRegistry
+from hgraph.core.sqlite_store import SQLiteStore
+
+
+class ModelOwns(Edge):
+    config: EdgeConfig = EdgeConfig(functional=True)
+    weight: float = 1.0
+
+
+class ModelOwnsToo(Edge):
+    config: EdgeConfig = EdgeConfig(functional=True)
+
+
+class ModelTeam(Hyperedge):
+    config: HyperedgeConfig = HyperedgeConfig(functional=True)
+
+
+def test_config_is_shared_per_class_and_not_dumped():
+    edge = ModelOwns(source=uuid4(), target=uuid4())
+    assert edge.config is ModelOwns.config is ModelOwnsToo.config
+    assert "config" not in edge.model_dump()
+    assert Edge.config is not ModelOwns.config
+
+
+@pytest.mark.parametrize(
+    "build",
+    [
+        lambda: Node(config={}),
+        lambda: ModelOwns(
+            source=uuid4(), target=uuid4(), config=EdgeConfig(functional=False)
+        ),
+        lambda: ModelTeam(sources=[uuid4()], targets=[uuid4()], config={}),
+    ],
+)
+def test_config_argument_is_rejected(build):
+    with pytest.raises(ValidationError, match="per class"):
+        build()
+
+
+def test_trusted_skips_validation_and_fills_defaults():
+    source, target = uuid4(), uuid4()
+    edge = ModelOwns.trusted(source=source, target=target)
+    assert edge == ModelOwns(id=edge.id, source=source, target=target)
+    assert (edge.type, edge.weight) == ("ModelOwns", 1.0)
+    assert edge.model_fields_set == {"source", "target"}
+    # Values are taken as given, unconverted.
+    assert ModelOwns.trusted(source=source, target=target, weight="x").weight == "x"
+
+
+def test_trusted_reports_missing_required_fields():
+    with pytest.raises(ValidationError):
+        ModelOwns.trusted(source=uuid4())
+
+
+def test_records_dumped_with_a_config_still_load(tmp_path):
+    source, target = uuid4(), uuid4()
+    legacy = {
+        "id": str(uuid4()),
+        "type": "ModelOwns",
+        "source": str(source),
+        "target": str(target),
+        "weight": 2.0,
+        "config": {"functional": False},
+    }
+    edge = SchemaRegistry.load_edge(legacy)
+    assert (edge.source, edge.weight) == (source, 2.0)
+    assert edge.config is ModelOwns.config
+
+    path = tmp_path / "legacy.jsonl"
+    path.write_text(json.dumps({"kind": "edge", "data": legacy}) + "\n")
+    for trusted in (False, True):
+        graph = load_from_json(str(path), trusted=trusted)
+        assert graph.get_edge(edge.id) == edge
+
+    store = SQLiteStore()
+    store.put_edge(edge)
+    store.execute(
+        "UPDATE edges SET data = ?",
+        (json.dumps({"weight": 2.0, "config": {"functional": False}}),),
+    )
+    assert store.edges[edge.id] == edge
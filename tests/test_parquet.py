@@ -0,0 +1,110 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID, uuid4
+
+import pytest
+
+from hgraph.core.config import EdgeConfig
+from hgraph.core.edge import Edge, Hyperedge
+from hgraph.core.hypergraph import Hypergraph
+from hgraph.core.node import Node
+from hgraph.core.parquet import (
+    iter_models,
+    load_from_parquet,
+    save_to_parquet,
+    trusted_decoders,
+)
+from hgraph.core.validator import ConstraintViolation
+
+pytest.importorskip("pyarrow")
+
+
+class ParquetPerson(Node):
+    name: str = ""
+    born: Optional[datetime] = None
+
+
+class ParquetTagged(Node):
+    tags: dict = {}
+
+
+class ParquetMentors(Edge):
+    config: EdgeConfig = EdgeConfig(functional=True)
+    witnesses: List[UUID] = []
+
+
+class ParquetBoard(Hyperedge):
+    pass
+
+
+def populated():
+    graph = Hypergraph()
+    a = ParquetPerson(name="a", born=datetime(2000, 1, 2, 3, 4, 5))
+    b = ParquetTagged(tags={"k": [1, 2]})
+    graph.add_nodes([a, b])
+    graph.add_edge(ParquetMentors(source=a.id, target=b.id, witnesses=[uuid4()]))
+    graph.add_hyperedge(ParquetBoard(sources=[a.id, b.id], targets=[uuid4()]))
+    return graph
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_round_trip(tmp_path, trusted):
+    graph = populated()
+    save_to_parquet(graph, str(tmp_path))
+    loaded = load_from_parquet(str(tmp_path), trusted=trusted)
+    assert dict(loaded.nodes) == dict(graph.nodes)
+    assert dict(loaded.edges) == dict(graph.edges)
+    assert dict(loaded.hyperedges) == dict(graph.hyperedges)
+
+
+def test_trusted_rows_are_constructed_not_validated(tmp_path, monkeypatch):
+    graph = populated()
+    save_to_parquet(graph, str(tmp_path))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("validated a trusted row")
+
+    monkeypatch.setattr(ParquetMentors, "model_validate", fail)
+    (edge,) = iter_models(str(tmp_path), "edges", None, 100, trusted=True)
+    assert edge == next(iter(graph.edges.values()))
+    assert isinstance(edge.witnesses[0], UUID)
+
+
+def test_json_columns_fall_back_to_validation():
+    assert trusted_decoders(ParquetTagged) is None
+    assert trusted_decoders(ParquetPerson) is not None
+
+
+def test_trusted_load_skips_constraints(tmp_path):
+    graph = Hypergraph()
+    a = uuid4()
+    graph.store.put_edge(ParquetMentors(source=a, target=uuid4()))
+    graph.store.put_edge(ParquetMentors(source=a, target=uuid4()))
+    save_to_parquet(graph, str(tmp_path))
+    with pytest.raises(ConstraintViolation):
+        load_from_parquet(str(tmp_path))
+    assert len(load_from_parquet(str(tmp_path), trusted=True).edges) == 2
+
+
+def test_type_selection(tmp_path):
+    save_to_parquet(populated(), str(tmp_path))
+    loaded = load_from_parquet(str(tmp_path), types=["ParquetPerson"])
+    assert [node.type for node in loaded.nodes.values()] == ["ParquetPerson"]
+    assert not loaded.edges
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_load_projects_columns(tmp_path, trusted):
+    graph = populated()
+    save_to_parquet(graph, str(tmp_path))
+    loaded = load_from_parquet(str(tmp_path), trusted=trusted, columns=["name"])
+    (person,) = [n for n in loaded.nodes.values() if isinstance(n, ParquetPerson)]
+    assert person.name == "a" and person.born is None
+    (tagged,) = [n for n in loaded.nodes.values() if isinstance(n, ParquetTagged)]
+    assert tagged.tags == {}
+    (edge,) = loaded.edges.values()
+    assert edge.witnesses == [] and edge == ParquetMentors(
+        id=edge.id, source=edge.source, target=edge.target
+    )
+    assert set(loaded.edges) == set(graph.edges)
+    assert set(loaded.hyperedges) == set(graph.hyperedges)
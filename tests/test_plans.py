@@ -0,0 +1,78 @@
+from uuid import uuid4
+
+from hgraph.core.config import EdgeConfig, HyperedgeConfig
+from hgraph.core.edge import Edge, Hyperedge
+from hgraph.core.hypergraph import Hypergraph
+from hgraph.core.registry import SchemaRegistry
+from hgraph.core.rules import CustomRule, EdgesFrom, validator
+from hgraph.core.validator import ConstraintValidator
+
+
+class PlanLinks(Edge):
+    pass
+
+
+class PlanOwns(Edge):
+    config: EdgeConfig = EdgeConfig(functional=True, irreflexive=True)
+
+    @validator(owned=EdgesFrom("PlanOwns", count=True))
+    def few(self, owned: int) -> bool:
+        return owned < 5
+
+
+class PlanTeam(Hyperedge):
+    config: HyperedgeConfig = HyperedgeConfig(cyclic=True, functional=True)
+
+
+def edge(model=PlanLinks):
+    return model(source=uuid4(), target=uuid4())
+
+
+def test_plans_hold_only_the_enabled_checks():
+    assert SchemaRegistry.edge_plan(edge()).checks == ()
+    checks = SchemaRegistry.edge_plan(edge(PlanOwns)).checks
+    assert checks[:2] == (
+        ConstraintValidator._irreflexive,
+        ConstraintValidator._functional,
+    )
+    assert [rule.name for rule in checks[2:]] == ["few"]
+    assert isinstance(checks[2], CustomRule)
+    team = PlanTeam(sources=[uuid4()], targets=[uuid4()])
+    assert SchemaRegistry.hyperedge_plan(team).checks == (
+        ConstraintValidator._irreflexive_sides,
+        ConstraintValidator._unique_members,
+        ConstraintValidator._functional_sides,
+    )
+
+
+def test_plans_are_compiled_once_per_type():
+    assert SchemaRegistry.edge_plan(edge(PlanOwns)) is SchemaRegistry.edge_plan(
+        edge(PlanOwns)
+    )
+
+
+def test_replacing_a_type_drops_its_plan():
+    class PlanRenamed(Edge):
+        pass
+
+    assert SchemaRegistry.edge_plan(edge(PlanRenamed)).checks == ()
+
+    class PlanRenamed(Edge):  # noqa: F811
+        config: EdgeConfig = EdgeConfig(irreflexive=True)
+
+    assert SchemaRegistry.edge_plan(edge(PlanRenamed)).checks == (
+        ConstraintValidator._irreflexive,
+    )
+
+
+def test_unconstrained_types_skip_the_validator(monkeypatch):
+    built = []
+    make = Hypergraph._validator
+    monkeypatch.setattr(
+        Hypergraph, "_validator", lambda graph: built.append(1) or make(graph)
+    )
+    graph = Hypergraph()
+    graph.add_edge(edge())
+    assert built == []
+    graph.add_edge(edge(PlanOwns))
+    assert built == [1]
@@ -0,0 +1,77 @@
+from uuid import uuid4
+
+from hgraph.core.edge import Edge, Hyperedge
+from hgraph.core.hypergraph import Hypergraph
+from hgraph.core.node import Node
+
+
+class QueryKnows(Edge):
+    pass
+
+
+class QueryLikes(Edge):
+    pass
+
+
+class QueryGroup(Hyperedge):
+    pass
+
+
+def small_graph():
+    graph = Hypergraph()
+    a, b, c = Node(), Node(), Node()
+    graph.add_nodes([a, b, c])
+    graph.add_edges(
+        [
+            QueryKnows(source=a.id, target=b.id),
+            QueryKnows(source=a.id, target=c.id),
+            QueryLikes(source=c.id, target=a.id),
+        ]
+    )
+    graph.add_hyperedge(QueryGroup(sources=[a.id], targets=[b.id, c.id]))
+    return graph, a, b, c
+
+
+def test_find_edges_filters():
+    graph, a, b, c = small_graph()
+    assert len(graph.find_edges(source=a.id)) == 2
+    assert len(graph.find_edges(source=a.id, type="QueryLikes")) == 0
+    assert [edge.source for edge in graph.find_edges(target=a.id)] == [c.id]
+    assert len(graph.find_edges(source=a.id, target=b.id)) == 1
+    assert len(graph.find_edges(type="QueryKnows")) == 2
+    assert len(graph.find_edges()) == 3
+
+
+def test_neighbors_by_direction_and_type():
+    graph, a, b, c = small_graph()
+    ids = lambda nodes: {node.id for node in nodes}  # noqa: E731
+    assert ids(graph.get_neighbors(a.id)) == {b.id, c.id}
+    assert ids(graph.get_neighbors(a.id, "in")) == {c.id}
+    assert ids(graph.get_neighbors(a.id, "both", "QueryLikes")) == {c.id}
+
+
+def test_neighbors_skip_ids_that_are_not_nodes():
+    graph = Hypergraph()
+    a = Node()
+    graph.add_node(a)
+    graph.add_edge(QueryKnows(source=a.id, target=uuid4()))
+    assert graph.get_neighbors(a.id) == []
+
+
+def test_degrees_and_hyperedges():
+    graph, a, b, c = small_graph()
+    assert graph.out_degree(a.id) == 2
+    assert graph.in_degree(a.id) == 1
+    assert graph.degree(a.id, "QueryKnows") == 2
+    assert graph.hyperedge_degree(b.id) == 1
+    assert len(graph.find_hyperedges(containing=c.id, type="QueryGroup")) == 1
+
+
+def test_indexes_follow_deletes_and_updates():
+    graph, a, b, c = small_graph()
+    edge = graph.find_edges(source=a.id, target=b.id)[0]
+    graph.update_edge(edge.id, QueryKnows(source=b.id, target=c.id))
+    assert not graph.find_edges(source=a.id, target=b.id)
+    assert len(graph.find_edges(source=b.id)) == 1
+    graph.delete_edge(edge.id)
+    assert not graph.find_edges(source=b.id)
@@ -0,0 +1,84 @@
+from uuid import uuid4
+
+import pytest
+
+from hgraph.core.edge import Edge, Hyperedge
+from hgraph.core.hypergraph import Hypergraph
+from hgraph.core.rules import (
+    EdgesBetween,
+    EdgesFrom,
+    HyperedgesContaining,
+    Lookup,
+    validator,
+)
+from hgraph.core.validator import ConstraintViolation
+
+
+class RuleEmploys(Edge):
+    @validator(staff=EdgesFrom("RuleEmploys", count=True))
+    def at_most_two(self, staff: int) -> bool:
+        return staff < 2
+
+
+class RuleStrictEmploys(RuleEmploys):
+    @validator(staff=EdgesFrom("RuleStrictEmploys", count=True))
+    def at_most_two(self, staff: int) -> bool:
+        return staff < 1
+
+
+class RuleRates(Edge):
+    @validator(earlier=EdgesBetween("RuleRates"))
+    def once_each(self, earlier) -> None:
+        if earlier:
+            raise ConstraintViolation(f"{self.source} already rated {self.target}")
+
+
+class RuleMeeting(Hyperedge):
+    @validator(busy=HyperedgesContaining("sources", "RuleMeeting", count=True))
+    def one_meeting_each(self, busy) -> bool:
+        return not any(busy.values())
+
+
+def test_count_lookup_limits_cardinality():
+    graph = Hypergraph()
+    company = uuid4()
+    first = RuleEmploys(source=company, target=uuid4())
+    graph.add_edges([first, RuleEmploys(source=company, target=uuid4())])
+    with pytest.raises(ConstraintViolation, match="at_most_two"):
+        graph.add_edge(RuleEmploys(source=company, target=uuid4()))
+    # An update does not count the edge it replaces.
+    graph.update_edge(first.id, RuleEmploys(source=company, target=uuid4()))
+
+
+def test_subclass_overrides_a_rule_by_name():
+    graph = Hypergraph()
+    company = uuid4()
+    graph.add_edge(RuleStrictEmploys(source=company, target=uuid4()))
+    with pytest.raises(ConstraintViolation):
+        graph.add_edge(RuleStrictEmploys(source=company, target=uuid4()))
+
+
+def test_rule_may_raise_its_own_violation():
+    graph = Hypergraph()
+    user, item = uuid4(), uuid4()
+    graph.add_edge(RuleRates(source=user, target=item))
+    graph.add_edge(RuleRates(source=item, target=user))
+    with pytest.raises(ConstraintViolation, match="already rated"):
+        graph.add_edge(RuleRates(source=user, target=item))
+
+
+def test_list_fields_are_answered_per_member():
+    graph = Hypergraph()
+    a, b, c = uuid4(), uuid4(), uuid4()
+    graph.add_hyperedge(RuleMeeting(sources=[a, b], targets=[uuid4()]))
+    graph.add_hyperedge(RuleMeeting(sources=[c], targets=[uuid4()]))
+    with pytest.raises(ConstraintViolation, match="one_meeting_each"):
+        graph.add_hyperedge(RuleMeeting(sources=[c, uuid4()], targets=[uuid4()]))
+
+
+def test_lookups_must_name_their_bucket():
+    class Incomplete(Lookup):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete("source")
@@ -0,0 +1,88 @@
+from uuid import uuid4
+
+import pytest
+
+from hgraph.core.config import EdgeConfig
+from hgraph.core.edge import Edge, Hyperedge
+from hgraph.core.hypergraph import Hypergraph
+from hgraph.core.node import Node
+from hgraph.core.persistent_store import PersistentStore
+
+
+class SnapPerson(Node):
+    name: str = ""
+
+
+class SnapOwns(Edge):
+    config: EdgeConfig = EdgeConfig(functional=True)
+
+
+class SnapGroup(Hyperedge):
+    pass
+
+
+def populated():
+    graph = Hypergraph(PersistentStore())
+    a, b = Node(), Node()
+    graph.add_nodes([a, b])
+    owns = SnapOwns(source=a.id, target=b.id)
+    graph.add_edge(owns)
+    return graph, a, b, owns
+
+
+def test_snapshot_is_isolated_and_read_only():
+    graph, a, b, owns = populated()
+    snapshot = graph.snapshot()
+    graph.delete_edge(owns.id)
+    graph.add_node(Node())
+    assert owns.id in snapshot.edges
+    assert len(snapshot.nodes) == 2
+    assert list(snapshot.edge_index.from_source("SnapOwns", a.id).values()) == [owns.id]
+    with pytest.raises(TypeError):
+        snapshot.add_node(Node())
+
+
+def test_branches_diverge_independently():
+    graph, a, b, owns = populated()
+    branch = graph.branch()
+    branch.delete_edge(owns.id)
+    branch.add_edge(SnapOwns(source=b.id, target=a.id))
+    graph.add_hyperedge(SnapGroup(sources=[a.id], targets=[b.id]))
+    assert owns.id in graph.edges
+    assert len(branch.edges) == 1 and not branch.hyperedges
+    # Each branch validates against its own indexes.
+    branch.add_edge(SnapOwns(source=a.id, target=b.id))
+
+
+def test_diff_lists_changes_per_kind():
+    graph, a, b, owns = populated()
+    branch = graph.branch()
+    added = Node()
+    branch.add_node(added)
+    branch.update_node(a.id, SnapPerson(name="renamed"))
+    branch.delete_edge(owns.id)
+    changes = graph.diff(branch)
+    assert changes.nodes.added == [added.id]
+    assert changes.nodes.changed == [a.id]
+    assert changes.edges.removed == [owns.id]
+    assert not changes.hyperedges
+    assert graph.diff(graph.snapshot()).empty
+
+
+def test_branch_rebuilds_closures():
+    class SnapAncestorOf(Edge):
+        config: EdgeConfig = EdgeConfig(transitive=True)
+
+    graph = Hypergraph(PersistentStore())
+    a, b, c = uuid4(), uuid4(), uuid4()
+    graph.add_edge(SnapAncestorOf(source=a, target=b))
+    assert not graph.is_reachable(a, c, "SnapAncestorOf")
+    branch = graph.branch()
+    branch.add_edge(SnapAncestorOf(source=b, target=c))
+    assert branch.is_reachable(a, c, "SnapAncestorOf")
+    assert not graph.is_reachable(a, c, "SnapAncestorOf")
+
+
+def test_other_stores_refuse_to_fork():
+    with pytest.raises(TypeError):
+        Hypergraph().snapshot()
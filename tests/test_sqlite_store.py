@@ -0,0 +1,63 @@
+from uuid import uuid4
+
+from hgraph.core.edge import Edge
+from hgraph.core.hypergraph import Hypergraph
+from hgraph.core.node import Node
+from hgraph.core.sqlite_store import SQLiteStore
+
+
+class SqlPerson(Node):
+    name: str = ""
+
+
+class SqlReviews(Edge):
+    stars: int = 0
+
+
+def test_records_survive_reopening(tmp_path):
+    path = str(tmp_path / "graph.db")
+    store = SQLiteStore(path)
+    graph = Hypergraph(store)
+    person = SqlPerson(name="ada")
+    graph.add_node(person)
+    edge = SqlReviews(source=person.id, target=uuid4(), stars=4)
+    graph.add_edge(edge)
+    store.close()
+
+    reopened = Hypergraph(SQLiteStore(path))
+    assert reopened.get_node(person.id) == person
+    assert reopened.get_edge(edge.id) == edge
+    assert [found.id for found in reopened.find_edges(source=person.id)] == [edge.id]
+
+
+def test_extra_fields_live_in_the_json_column():
+    store = SQLiteStore()
+    store.put_edge(SqlReviews(source=uuid4(), target=uuid4(), stars=5))
+    store.put_node(Node())
+    (data,) = store.execute("SELECT data FROM edges").fetchone()
+    assert data == '{"stars":5}'
+    (data,) = store.execute("SELECT data FROM nodes").fetchone()
+    assert data == "{}"
+
+
+def test_writes_commit_in_groups(tmp_path):
+    store = SQLiteStore(str(tmp_path / "graph.db"), commit_every=3)
+    for _ in range(2):
+        store.put_node(Node())
+    assert store._pending == 2
+    store.put_node(Node())
+    assert store._pending == 0
+
+
+def test_node_types_batches_and_filters_unknown_ids():
+    store = SQLiteStore()
+    nodes = [SqlPerson() for _ in range(1200)]
+    store.put_nodes(nodes)
+    missing = [uuid4() for _ in range(10)]
+    found = store.node_types([node.id for node in nodes] + missing)
+    assert len(found) == 1200
+    assert set(found.values()) == {"SqlPerson"}
+    # A node stored after the filter was built is still found.
+    late = Node()
+    store.put_node(late)
+    assert store.node_types([late.id]) == {late.id: "Node"}
@@ -0,0 +1,79 @@
+from uuid import uuid4
+
+import pytest
+
+from hgraph.core.config import EdgeConfig
+from hgraph.core.edge import Edge, Hyperedge
+from hgraph.core.hypergraph import Hypergraph
+from hgraph.core.node import Node
+from hgraph.core.store import GraphStore, InMemoryStore
+from hgraph.core.validator import ConstraintViolation
+
+
+class StoredPerson(Node):
+    name: str = ""
+
+
+class StoredRated(Edge):
+    config: EdgeConfig = EdgeConfig(functional=True)
+    score: float = 0.0
+
+
+class StoredGroup(Hyperedge):
+    label: str = ""
+
+
+def test_every_backend_satisfies_the_protocol(store):
+    assert isinstance(store, GraphStore)
+
+
+def test_round_trip_keeps_types_and_fields(store):
+    graph = Hypergraph(store)
+    person, other = StoredPerson(name="ada"), Node()
+    graph.add_nodes([person, other])
+    edge = StoredRated(source=person.id, target=other.id, score=2.5)
+    group = StoredGroup(sources=[person.id], targets=[other.id], label="x")
+    graph.add_edge(edge)
+    graph.add_hyperedge(group)
+
+    assert graph.get_node(person.id) == person
+    assert type(graph.get_edge(edge.id)) is StoredRated
+    assert graph.get_edge(edge.id) == edge
+    assert graph.get_hyperedge(group.id) == group
+    assert store.node_types([person.id, uuid4()]) == {person.id: "StoredPerson"}
+
+
+def test_replacing_a_record_reindexes_it(store):
+    graph = Hypergraph(store)
+    a, b, c = uuid4(), uuid4(), uuid4()
+    edge = StoredRated(source=a, target=b)
+    graph.add_edge(edge)
+    graph.update_edge(edge.id, StoredRated(source=c, target=b))
+    assert not graph.find_edges(source=a)
+    assert [found.id for found in graph.find_edges(source=c)] == [edge.id]
+    # The old source is free again for a functional edge.
+    graph.add_edge(StoredRated(source=a, target=c))
+
+
+def test_constraints_hold_on_every_backend(store):
+    graph = Hypergraph(store)
+    a = uuid4()
+    graph.add_edge(StoredRated(source=a, target=uuid4()))
+    with pytest.raises(ConstraintViolation):
+        graph.add_edge(StoredRated(source=a, target=uuid4()))
+
+
+def test_pops_return_the_record_once(store):
+    graph = Hypergraph(store)
+    edge = StoredRated(source=uuid4(), target=uuid4())
+    graph.add_edge(edge)
+    assert store.pop_edge(edge.id) == edge
+    assert store.pop_edge(edge.id) is None
+    assert not graph.find_edges(type="StoredRated")
+
+
+def test_graphs_do_not_share_storage():
+    first, second = Hypergraph(), Hypergraph()
+    first.add_node(Node())
+    assert not second.nodes
+    assert isinstance(Hypergraph().store, InMemoryStore)
@@ -0,0 +1,93 @@
+from uuid import uuid4
+
+import pytest
+
+from hgraph.core.config import EdgeConfig
+from hgraph.core.edge import Edge, Hyperedge
+from hgraph.core.hypergraph import Hypergraph
+from hgraph.core.node import Node
+from hgraph.core.validator import ConstraintViolation
+
+
+class TxnOwns(Edge):
+    config: EdgeConfig = EdgeConfig(functional=True)
+
+
+class TxnGroup(Hyperedge):
+    pass
+
+
+def contents(graph):
+    return (
+        dict(graph.nodes.items()),
+        dict(graph.edges.items()),
+        dict(graph.hyperedges.items()),
+    )
+
+
+def populated(store):
+    graph = Hypergraph(store)
+    a, b = Node(), Node()
+    graph.add_nodes([a, b])
+    owns = TxnOwns(source=a.id, target=b.id)
+    graph.add_edge(owns)
+    group = TxnGroup(sources=[a.id], targets=[b.id])
+    graph.add_hyperedge(group)
+    return graph, a, b, owns, group
+
+
+def test_rollback_restores_every_kind_of_write(store):
+    graph, a, b, owns, group = populated(store)
+    before = contents(graph)
+    with pytest.raises(ConstraintViolation):
+        with graph.transaction():
+            graph.add_node(Node())
+            graph.update_node(a.id, Node())
+            graph.delete_edge(owns.id)
+            graph.update_hyperedge(group.id, TxnGroup(sources=[b.id], targets=[a.id]))
+            graph.add_edge(TxnOwns(source=b.id, target=a.id))
+            graph.add_edge(TxnOwns(source=b.id, target=uuid4()))
+    assert contents(graph) == before
+    assert list(graph.edge_index.from_source("TxnOwns", a.id).values()) == [owns.id]
+    assert not graph.edge_index.from_source("TxnOwns", b.id)
+
+
+def test_commit_keeps_writes(store):
+    graph, a, b, owns, _ = populated(store)
+    with graph.transaction():
+        graph.delete_edge(owns.id)
+        graph.add_edge(TxnOwns(source=a.id, target=a.id))
+    assert owns.id not in graph.edges
+    assert len(graph.edges) == 1
+
+
+def test_later_writes_are_validated_against_earlier_ones():
+    graph, a, b, _, _ = populated(None)
+    with pytest.raises(ConstraintViolation):
+        with graph.transaction():
+            graph.add_edge(TxnOwns(source=b.id, target=a.id))
+            graph.add_edge(TxnOwns(source=b.id, target=b.id))
+    assert len(graph.edges) == 1
+
+
+def test_nested_block_rolls_back_only_its_own_writes():
+    graph = Hypergraph()
+    kept, dropped = Node(), Node()
+    with graph.transaction():
+        graph.add_node(kept)
+        with pytest.raises(RuntimeError):
+            with graph.transaction():
+                graph.add_node(dropped)
+                raise RuntimeError
+    assert set(graph.nodes) == {kept.id}
+
+
+def test_outer_failure_undoes_committed_inner_block():
+    graph = Hypergraph()
+    with pytest.raises(RuntimeError):
+        with graph.transaction():
+            with graph.transaction():
+                graph.add_node(Node())
+            raise RuntimeError
+    assert not graph.nodes
+    assert graph.transaction_log is None
@@ -0,0 +1,130 @@
+import random
+from uuid import uuid4
+
+from hgraph.core.config import EdgeConfig
+from hgraph.core.edge import Edge, Hyperedge
+from hgraph.core.hypergraph import Hypergraph
+
+
+class WalkLinks(Edge):
+    pass
+
+
+class WalkBlocks(Edge):
+    pass
+
+
+class WalkFriendOf(Edge):
+    config: EdgeConfig = EdgeConfig(symmetric=True)
+
+
+class WalkMeeting(Hyperedge):
+    pass
+
+
+def chain(graph, nodes, type=WalkLinks):
+    edges = [type(source=a, target=b) for a, b in zip(nodes, nodes[1:])]
+    graph.add_edges(edges)
+    return edges
+
+
+def shortest(graph, start, end, max_depth):
+    """Reference hop count by plain breadth-first search."""
+    seen, frontier = {start}, [start]
+    for depth in range(max_depth + 1):
+        if end in seen:
+            return depth
+        reached = []
+        for node in frontier:
+            for edge in graph.find_edges(source=node):
+                if edge.target not in seen:
+                    seen.add(edge.target)
+                    reached.append(edge.target)
+        frontier = reached
+    return None
+
+
+def test_find_path_returns_nodes_and_links():
+    graph = Hypergraph()
+    nodes = [uuid4() for _ in range(4)]
+    edges = chain(graph, nodes)
+    path = graph.find_path(nodes[0], nodes[3])
+    assert path.nodes == nodes
+    assert path.links == [edge.id for edge in edges]
+    assert path.length == 3
+    assert graph.find_path(nodes[0], nodes[0]).length == 0
+
+
+def test_find_path_respects_depth_direction_and_type():
+    graph = Hypergraph()
+    nodes = [uuid4() for _ in range(4)]
+    chain(graph, nodes)
+    graph.add_edge(WalkBlocks(source=nodes[0], target=nodes[3]))
+    assert graph.find_path(nodes[0], nodes[3]).length == 1
+    assert graph.find_path(nodes[0], nodes[3], type="WalkLinks").length == 3
+    assert graph.find_path(nodes[0], nodes[3], max_depth=2, type="WalkLinks") is None
+    assert graph.find_path(nodes[3], nodes[0]) is None
+    assert graph.find_path(nodes[3], nodes[0], direction="in").length == 1
+    assert graph.find_path(nodes[3], nodes[0], direction="both").length == 1
+
+
+def test_hyperedges_are_hops_from_sources_to_targets():
+    graph = Hypergraph()
+    a, b, c = uuid4(), uuid4(), uuid4()
+    meeting = WalkMeeting(sources=[a], targets=[b, c])
+    graph.add_hyperedge(meeting)
+    assert graph.find_path(a, c) is None
+    path = graph.find_path(a, c, hyperedges=True)
+    assert path.nodes == [a, c] and path.links == [meeting.id]
+
+
+def test_virtual_symmetric_edges_are_traversed():
+    graph = Hypergraph(inverses="virtual")
+    a, b = uuid4(), uuid4()
+    graph.add_edge(WalkFriendOf(source=a, target=b))
+    assert graph.find_path(b, a).length == 1
+
+
+def test_all_paths_are_simple_and_shortest_first():
+    graph = Hypergraph()
+    a, b, c, d = (uuid4() for _ in range(4))
+    chain(graph, [a, b, d])
+    chain(graph, [a, c, b])
+    graph.add_edge(WalkLinks(source=d, target=a))
+    paths = graph.all_paths(a, d)
+    assert [path.nodes for path in paths] == [[a, b, d], [a, c, b, d]]
+    assert len(graph.all_paths(a, d, limit=1)) == 1
+
+
+def test_k_hop_neighborhood_counts_hops():
+    graph = Hypergraph()
+    nodes = [uuid4() for _ in range(5)]
+    chain(graph, nodes)
+    assert graph.k_hop_neighborhood(nodes[0], 2) == {
+        nodes[0]: 0,
+        nodes[1]: 1,
+        nodes[2]: 2,
+    }
+    assert graph.k_hop_neighborhood(nodes[2], 1, direction="both") == {
+        nodes[2]: 0,
+        nodes[1]: 1,
+        nodes[3]: 1,
+    }
+
+
+def test_find_path_matches_breadth_first_search():
+    rng = random.Random(3)
+    graph = Hypergraph()
+    nodes = [uuid4() for _ in range(40)]
+    graph.add_edges(
+        WalkLinks(source=rng.choice(nodes), target=rng.choice(nodes)) for _ in range(70)
+    )
+    for _ in range(100):
+        start, end = rng.choice(nodes), rng.choice(nodes)
+        path = graph.find_path(start, end, max_depth=4)
+        expected = shortest(graph, start, end, 4)
+        assert (None if path is None else path.length) == expected
+        if path is not None:
+            for source, target, link in zip(path.nodes, path.nodes[1:], path.links):
+                edge = graph.get_edge(link)
+                assert (edge.source, edge.target) == (source, target)